@@ -7,18 +7,29 @@ student information, transcriptions, and worksheet generation.
 from fastapi import FastAPI, HTTPException, Depends
 from sqlmodel import Session, select
 from typing import List, Dict, Any
+import asyncio
+import time
+from functools import partial
 
-from app.db.database import get_session
+from app.db.database import engine, get_session
 from app.db.models import (
     Student, BasicInformation, ProfessionalBackground, PersonalBackground,
     InterestHobby, LearningContext, CulturalElements, SocialAspects,
-    Interview, InterviewTemplate
+    Interview, InterviewTemplate, TranscriptionJob
+)
+from app.core.dependencies import (
+    get_current_active_user, get_conversation_analyzer, get_extraction_cache, get_extraction_cascade,
+    get_parser_pool
 )
-from app.core.dependencies import get_student_extraction_service, get_current_active_user
 from app.services.student_extractor import StudentExtractionService
-from app.api.models.transcription import TranscriptionCreate
+from app.services.conversation_analyzer import ConversationAnalyzer
+from app.api.models.transcription import TranscriptionCreate, TranscriptionAnalyze
 from app.api.models.student import StudentDetailResponse
-from app.api.routes import worksheets, auth
+from app.api.routes import worksheets, auth, metrics, content
+from app.core.config import get_settings
+from app.core.http_client import create_http_client
+from app.services.ai_gateway import create_ai_gateway
+from app.services.transcription_queue import enqueue_transcription, job_status, create_workers
 from app.db.models import User
 
 app = FastAPI(
@@ -30,45 +41,168 @@ app = FastAPI(
 # Include routers
 app.include_router(worksheets.router, tags=["worksheets"])
 app.include_router(auth.router)
+app.include_router(metrics.router)
+app.include_router(content.router)
+
+@app.on_event("startup")
+async def create_ai_clients() -> None:
+    """Create the pooled HTTP client and the AI gateway shared by the AI-backed services."""
+    settings = get_settings()
+    app.state.http_client = create_http_client(settings)
+    app.state.ai_gateway = create_ai_gateway(app.state.http_client, settings)
+
+@app.on_event("startup")
+async def create_parser_pool() -> None:
+    """Create the pool of spaCy parser processes shared by the conversation analyzers."""
+    app.state.parser_pool = get_parser_pool()
+
+@app.on_event("startup")
+async def start_transcription_workers() -> None:
+    """Start the in-process workers for queued transcriptions."""
+    settings = get_settings()
+    service = StudentExtractionService(
+        app.state.ai_gateway,
+        get_extraction_cache(),
+        get_analyzer=partial(get_conversation_analyzer, settings.HYBRID_EXTRACTION_TIER),
+        chunk_chars=settings.EXTRACTION_CHUNK_CHARS,
+        cascade=get_extraction_cascade()
+    )
+    workers = create_workers(settings, lambda: Session(engine), service, settings.TRANSCRIPTION_WORKERS)
+    app.state.transcription_stop = asyncio.Event()
+    app.state.transcription_workers = [
+        asyncio.ensure_future(worker.run(app.state.transcription_stop)) for worker in workers
+    ]
+
+@app.on_event("shutdown")
+async def stop_transcription_workers() -> None:
+    """Let the in-process workers finish their current job, then stop them."""
+    app.state.transcription_stop.set()
+    await asyncio.gather(*app.state.transcription_workers)
 
-@app.post("/transcriptions/", response_model=Dict[str, Any])
-async def process_transcription(
+@app.on_event("shutdown")
+async def close_ai_clients() -> None:
+    """Close the shared HTTP client and its pooled connections."""
+    await app.state.http_client.aclose()
+
+@app.on_event("shutdown")
+async def stop_parser_pool() -> None:
+    """Stop the spaCy parser processes."""
+    if app.state.parser_pool is not None:
+        await asyncio.to_thread(app.state.parser_pool.shutdown)
+
+@app.post("/transcriptions/", status_code=202, response_model=Dict[str, Any])
+def process_transcription(
     transcription_data: TranscriptionCreate,
-    service: StudentExtractionService = Depends(get_student_extraction_service),
     session: Session = Depends(get_session),
     current_user: User = Depends(get_current_active_user)
 ) -> Dict[str, Any]:
-    """Process a transcription to extract student information.
+    """Queue a transcription for extraction of student information.
+    
+    Extraction and saving run in a worker; poll the returned status URL for
+    progress and the result.
     
     Args:
         transcription_data: Transcription data
-        service: Student extraction service
         session: Database session
         current_user: Current authenticated user
         
     Returns:
-        Dict[str, Any]: Processed student information
+        Dict[str, Any]: Job ID and status URL
         
     Raises:
-        HTTPException: If processing fails
+        HTTPException: If the transcription cannot be queued
     """
     try:
-        # Extract information from transcription
-        extracted_data = await service.process_transcription(transcription_data.transcription)
+        job = enqueue_transcription(
+            session,
+            transcription_data.transcription,
+            cache_mode=transcription_data.cache_mode,
+            submitted_by=current_user.user_id,
+            extraction_mode=transcription_data.extraction_mode
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Failed to queue transcription: {str(e)}"
+        )
         
-        # Save to database
-        student = await service.save_student_info(session, extracted_data)
+    return {
+        "status": job.status,
+        "job_id": job.job_id,
+        "status_url": f"/transcriptions/jobs/{job.job_id}"
+    }
+
+@app.get("/transcriptions/jobs/{job_id}", response_model=Dict[str, Any])
+def get_transcription_job(
+    job_id: int,
+    session: Session = Depends(get_session),
+    current_user: User = Depends(get_current_active_user)
+) -> Dict[str, Any]:
+    """Check the processing status of a queued transcription.
+    
+    Args:
+        job_id: Job ID returned when the transcription was queued
+        session: Database session
+        current_user: Current authenticated user
         
-        return {
-            "status": "success",
-            "student_id": student.student_id,
-            "extracted_info": extracted_data
-        }
+    Returns:
+        Dict[str, Any]: Job status, progress and, once completed, the extracted information
+        
+    Raises:
+        HTTPException: If the job is not found
+    """
+    job = session.get(TranscriptionJob, job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Transcription job not found")
+    return job_status(job)
+
+@app.post("/transcriptions/analyze", response_model=Dict[str, Any])
+def analyze_transcription(
+    analyze_data: TranscriptionAnalyze,
+    current_user: User = Depends(get_current_active_user)
+) -> Dict[str, Any]:
+    """Analyze a transcription locally with spaCy, without calling the AI service.
+    
+    Meant for quick previews: the 'fast' tier trades accuracy for latency, and a
+    latency budget lets the server pick the tier from the transcript length.
+    
+    Args:
+        analyze_data: Transcription plus optional tier or latency budget
+        current_user: Current authenticated user
+        
+    Returns:
+        Dict[str, Any]: Extracted information and the tier that produced it
+        
+    Raises:
+        HTTPException: If the tier is unknown or analysis fails
+    """
+    try:
+        tier = ConversationAnalyzer.resolve_tier(
+            len(analyze_data.transcription),
+            tier=analyze_data.tier,
+            latency_budget_ms=analyze_data.latency_budget_ms
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+        
+    try:
+        analyzer = get_conversation_analyzer(tier)
+        start = time.perf_counter()
+        extracted_data = analyzer.analyze_transcription(analyze_data.transcription)
+        elapsed_ms = (time.perf_counter() - start) * 1000
     except Exception as e:
         raise HTTPException(
             status_code=500,
-            detail=f"Failed to process transcription: {str(e)}"
+            detail=f"Failed to analyze transcription: {str(e)}"
         )
+        
+    return {
+        "status": "success",
+        "tier": tier,
+        "model": analyzer.model_name,
+        "elapsed_ms": elapsed_ms,
+        "extracted_info": extracted_data
+    }
 
 @app.get("/students/", response_model=List[StudentDetailResponse])
 def get_students(
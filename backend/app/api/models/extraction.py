@@ -0,0 +1,302 @@
+"""Models for student information extracted by the AI service.
+
+This module defines Pydantic models mirroring the student tables, used to
+validate the AI service's extraction output before it is saved. Each section
+of the save_student_info payload is validated on its own, so an invalid
+section can be re-requested without repeating the whole extraction.
+
+Only the top-level student fields and the category and name of an interest
+are required. Every other field is optional, since a transcript rarely gives
+all of them, so a partially answered section keeps the values it has.
+"""
+
+import json
+from datetime import date
+from typing import Any, Dict, List, Optional, Tuple, Type
+
+from pydantic import BaseModel, ValidationError, validator
+from pydantic.errors import PydanticValueError
+
+class BlankError(PydanticValueError):
+    """Raised for text fields left blank."""
+    code = "blank"
+    msg_template = "must not be blank"
+
+class ExtractedModel(BaseModel):
+    """Base for extraction models: surrounding whitespace is stripped and blank text counts as missing."""
+
+    @validator('*', pre=True)
+    def strip_text(cls, v, field):
+        """Strip text values so blank answers count as missing."""
+        if isinstance(v, str):
+            v = v.strip()
+            if not v:
+                if field.required:
+                    raise BlankError()
+                return None
+        return v
+
+class StudentData(ExtractedModel):
+    """Top-level student fields.
+    
+    Attributes:
+        first_name: Student's first name
+        last_name: Student's last name
+        proficiency_level: English proficiency level
+    """
+    first_name: str
+    last_name: str
+    proficiency_level: str
+
+class BasicInformationData(ExtractedModel):
+    """Basic information, mirroring BasicInformation.
+    
+    Attributes:
+        date_of_birth: Date of birth
+        email: Email address
+        phone: Phone number
+        native_language: First language
+        current_address: Current address or city
+    """
+    date_of_birth: Optional[date] = None
+    email: Optional[str] = None
+    phone: Optional[str] = None
+    native_language: Optional[str] = None
+    current_address: Optional[str] = None
+
+class ProfessionalBackgroundData(ExtractedModel):
+    """Professional background, mirroring ProfessionalBackground.
+    
+    Attributes:
+        current_occupation: Current job
+        company: Employer
+        industry: Industry sector
+        work_responsibilities: Main responsibilities
+        years_of_experience: Years of work experience
+        education_level: Highest education level
+    """
+    current_occupation: Optional[str] = None
+    company: Optional[str] = None
+    industry: Optional[str] = None
+    work_responsibilities: Optional[str] = None
+    years_of_experience: Optional[int] = None
+    education_level: Optional[str] = None
+
+class PersonalBackgroundData(ExtractedModel):
+    """Personal background, mirroring PersonalBackground.
+    
+    Attributes:
+        hometown: City or town of origin
+        country_of_origin: Country of origin
+        family_background: Family situation
+        life_experiences: Notable life experiences
+        personal_goals: Personal goals
+    """
+    hometown: Optional[str] = None
+    country_of_origin: Optional[str] = None
+    family_background: Optional[str] = None
+    life_experiences: Optional[str] = None
+    personal_goals: Optional[str] = None
+
+class InterestHobbyData(ExtractedModel):
+    """One interest or hobby, mirroring InterestHobby.
+    
+    Attributes:
+        category: Kind of interest, e.g. sports or music
+        name: Name of the interest
+        description: Short description
+        experience_years: Years of practice
+        frequency: How often the student does it
+    """
+    category: str
+    name: str
+    description: Optional[str] = None
+    experience_years: Optional[int] = None
+    frequency: Optional[str] = None
+
+class LearningContextData(ExtractedModel):
+    """Learning context, mirroring LearningContext.
+    
+    Attributes:
+        learning_goals: Goals for learning English
+        preferred_learning_style: Preferred way of learning
+        previous_language_experience: Earlier language learning
+        challenges: Difficulties with English
+        strengths: Strengths in English
+        areas_for_improvement: Areas to work on
+    """
+    learning_goals: Optional[str] = None
+    preferred_learning_style: Optional[str] = None
+    previous_language_experience: Optional[str] = None
+    challenges: Optional[str] = None
+    strengths: Optional[str] = None
+    areas_for_improvement: Optional[str] = None
+
+class CulturalElementsData(ExtractedModel):
+    """Cultural elements, mirroring CulturalElements.
+    
+    Attributes:
+        cultural_background: Cultural background
+        traditions: Traditions the student follows
+        value_systems: Values important to the student
+        cultural_practices: Cultural practices
+        dietary_preferences: Dietary preferences
+    """
+    cultural_background: Optional[str] = None
+    traditions: Optional[str] = None
+    value_systems: Optional[str] = None
+    cultural_practices: Optional[str] = None
+    dietary_preferences: Optional[str] = None
+
+class SocialAspectsData(ExtractedModel):
+    """Social aspects, mirroring SocialAspects.
+    
+    Attributes:
+        communication_style: Preferred way of communicating
+        group_work_preference: Attitude to group work
+        social_interests: Social activities
+        community_involvement: Community involvement
+        interaction_preferences: Preferred kinds of interaction
+    """
+    communication_style: Optional[str] = None
+    group_work_preference: Optional[str] = None
+    social_interests: Optional[str] = None
+    community_involvement: Optional[str] = None
+    interaction_preferences: Optional[str] = None
+
+# Key of the top-level student fields among the sections
+STUDENT_SECTION = ""
+
+# Interests and hobbies are a list of InterestHobbyData rather than one object
+INTERESTS_SECTION = "interests_hobbies"
+
+# Model of each object section of the save_student_info payload
+SECTION_MODELS: Dict[str, Type[ExtractedModel]] = {
+    STUDENT_SECTION: StudentData,
+    "basic_info": BasicInformationData,
+    "professional_background": ProfessionalBackgroundData,
+    "personal_background": PersonalBackgroundData,
+    "learning_context": LearningContextData,
+    "cultural_elements": CulturalElementsData,
+    "social_aspects": SocialAspectsData,
+}
+
+# Error types meaning a value is absent rather than malformed; asking the AI
+# service again rarely helps when the transcript does not say
+MISSING_ERROR_TYPES = ("value_error.missing", "type_error.none.not_allowed", "value_error.blank")
+
+def describe_errors(errors: List[Dict[str, Any]]) -> str:
+    """Summarize validation errors as 'field: message' pairs.
+    
+    Args:
+        errors: Errors as returned by validate_section
+        
+    Returns:
+        str: One line describing every error
+    """
+    return "; ".join(
+        f"{'.'.join(str(part) for part in e['loc']) or 'value'}: {e['msg']}" for e in errors
+    )
+
+def is_missing_only(errors: List[Dict[str, Any]]) -> bool:
+    """Whether validation failed only because values are absent."""
+    return all(e["type"] in MISSING_ERROR_TYPES for e in errors)
+
+def _to_json(model: BaseModel) -> Dict[str, Any]:
+    """Dump a model's fields that have a value to JSON-compatible values (dates become ISO strings)."""
+    return json.loads(model.json(exclude_none=True))
+
+def section_value(data: Dict[str, Any], section: str) -> Any:
+    """Read one section from an extraction payload.
+    
+    Args:
+        data: save_student_info payload
+        section: Section key; STUDENT_SECTION for the top-level fields
+        
+    Returns:
+        Any: The section's value, or None if it is absent
+    """
+    if section == STUDENT_SECTION:
+        return {name: data.get(name) for name in StudentData.__fields__}
+    return data.get(section)
+
+def validate_section(section: str, value: Any) -> Tuple[Optional[Any], List[Dict[str, Any]]]:
+    """Validate one section of an extraction payload.
+    
+    Args:
+        section: Section key; STUDENT_SECTION or INTERESTS_SECTION included
+        value: The section's value
+        
+    Returns:
+        Tuple[Optional[Any], List[Dict[str, Any]]]: The validated,
+            JSON-compatible value and the validation errors (Pydantic's 'loc',
+            'msg' and 'type'). Fields without a value are left out. For
+            interests, valid entries are kept and the errors of the others are
+            reported; for other sections, valid fields are kept when others are
+            invalid. The value is None if nothing valid is left.
+    """
+    if section == INTERESTS_SECTION:
+        if not isinstance(value, list):
+            return None, [{"loc": (), "msg": "must be a list of objects", "type": "type_error.list"}]
+        valid, errors = [], []
+        for index, item in enumerate(value):
+            try:
+                valid.append(_to_json(InterestHobbyData.parse_obj(item)))
+            except ValidationError as e:
+                errors.extend({**error, "loc": (index, *error["loc"])} for error in e.errors())
+        return valid, errors
+    model = SECTION_MODELS[section]
+    try:
+        return _to_json(model.parse_obj(value)) or None, []
+    except ValidationError as e:
+        errors = e.errors()
+    if section == STUDENT_SECTION or not isinstance(value, dict):
+        return None, errors
+    # Keep the fields that are valid on their own; all of them are optional
+    invalid = {error["loc"][0] for error in errors if error["loc"]}
+    partial = model.parse_obj({name: v for name, v in value.items() if name not in invalid})
+    return _to_json(partial) or None, errors
+
+def validate_field(section: str, name: str, value: Any) -> List[Dict[str, Any]]:
+    """Validate a single field of an object section.
+    
+    Args:
+        section: Section key; STUDENT_SECTION for the top-level fields
+        name: Field name
+        value: Field value
+        
+    Returns:
+        List[Dict[str, Any]]: Validation errors, as for validate_section
+    """
+    model = SECTION_MODELS[section]
+    _, error = model.__fields__[name].validate(value, {}, loc=name, cls=model)
+    return ValidationError([error], model).errors() if error else []
+
+def validate_extraction(data: Dict[str, Any]) -> Tuple[Dict[str, Any], Dict[str, List[Dict[str, Any]]]]:
+    """Validate an extraction payload section by section.
+    
+    The top-level student fields are always checked; other sections only when
+    present, since the tables behind them are optional.
+    
+    Args:
+        data: save_student_info payload as returned by the AI service
+        
+    Returns:
+        Tuple[Dict[str, Any], Dict[str, List[Dict[str, Any]]]]: Payload made
+            of the valid sections, and the errors of each invalid section
+    """
+    valid: Dict[str, Any] = {}
+    errors: Dict[str, List[Dict[str, Any]]] = {}
+    for section in (*SECTION_MODELS, INTERESTS_SECTION):
+        value = section_value(data, section)
+        if section != STUDENT_SECTION and value is None:
+            continue
+        validated, section_errors = validate_section(section, value)
+        if section_errors:
+            errors[section] = section_errors
+        if validated:
+            if section == STUDENT_SECTION:
+                valid.update(validated)
+            else:
+                valid[section] = validated
+    return valid, errors
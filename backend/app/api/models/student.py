@@ -139,11 +139,11 @@ class Conversation(ConversationBase):
         orm_mode = True
 
 class BasicInfoResponse(BaseModel):
-    date_of_birth: date
-    email: str
-    phone: str
-    native_language: str
-    current_address: str
+    date_of_birth: Optional[date] = None
+    email: Optional[str] = None
+    phone: Optional[str] = None
+    native_language: Optional[str] = None
+    current_address: Optional[str] = None
 
 class StudentDetailResponse(BaseModel):
     student_id: int
@@ -3,8 +3,45 @@
 This module defines the request and response models for the transcription endpoints.
 """
 
-from pydantic import BaseModel
+from pydantic import BaseModel, validator
+from typing import Optional
+
+from app.services.response_cache import check_cache_mode
+from app.services.student_extractor import check_extraction_mode
 
 class TranscriptionCreate(BaseModel):
-    """Request model for transcription processing."""
-    transcription: str 
\ No newline at end of file
+    """Request model for transcription processing.
+    
+    Attributes:
+        transcription: Interview transcription text
+        cache_mode: 'use', 'refresh' or 'bypass' the extraction cache
+        extraction_mode: 'llm' sends the whole extraction to the AI service,
+            'hybrid' runs the local analyzer first and asks the AI service
+            only for the remaining fields, 'chunked' extracts long transcripts
+            in concurrent chunks and merges the results
+    """
+    transcription: str
+    cache_mode: str = "use"
+    extraction_mode: str = "llm"
+
+    @validator('cache_mode')
+    def validate_cache_mode(cls, v):
+        """Reject unknown cache modes."""
+        return check_cache_mode(v)
+
+    @validator('extraction_mode')
+    def validate_extraction_mode(cls, v):
+        """Reject unknown extraction modes."""
+        return check_extraction_mode(v)
+
+class TranscriptionAnalyze(BaseModel):
+    """Request model for local transcription analysis.
+    
+    Attributes:
+        transcription: Interview transcription text
+        tier: Speed/accuracy tier ('fast', 'balanced' or 'accurate')
+        latency_budget_ms: Latency budget used to pick the tier when none is given
+    """
+    transcription: str
+    tier: Optional[str] = None
+    latency_budget_ms: Optional[float] = None
@@ -3,4 +3,4 @@
 This package contains all the API route modules for the ESL Worksheet Generator.
 """
 
-from app.api.routes import worksheets, auth 
\ No newline at end of file
+from app.api.routes import worksheets, auth, metrics, content 
\ No newline at end of file
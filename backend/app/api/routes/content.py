@@ -0,0 +1,227 @@
+"""API routes for personalized content generation.
+
+This module provides endpoints that personalize homework templates for students
+with the AI service.
+"""
+
+import asyncio
+import json
+from typing import Any, AsyncIterator, Dict, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import StreamingResponse
+from sqlalchemy.orm import joinedload, selectinload
+from sqlmodel import Session, select
+
+from app.core.config import get_settings, Settings
+from app.core.dependencies import (
+    get_content_generation_service, get_current_active_user, get_batch_job_registry
+)
+from app.db.database import engine, get_session
+from app.db.models import (
+    Class, HomeworkTemplate, PersonalizedHomework, Student, StudentClass, User
+)
+from app.services.batch_generation import (
+    BatchGenerationJob, BatchJobRegistry, generate_for_class, store_homework
+)
+from app.services.content_generator import ContentGenerationService, check_generation_mode
+from app.services.response_cache import check_cache_mode
+
+router = APIRouter(tags=["content"])
+
+
+def homework_template_context(template: HomeworkTemplate) -> Dict[str, Any]:
+    """Build the template part of a generation context from a homework template.
+
+    Args:
+        template: Homework template
+
+    Returns:
+        Dict[str, Any]: Template fields sent to the AI service
+    """
+    return {
+        "name": template.name,
+        "objective": template.objective,
+        "base_questions": template.base_questions,
+    }
+
+
+def _sse(event: str, data: Dict[str, Any]) -> str:
+    """Format a server-sent event."""
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+
+@router.post("/students/{student_id}/homework/{template_id}/generate/stream")
+async def stream_homework_generation(
+    student_id: int,
+    template_id: int,
+    cache_mode: str = "use",
+    service: ContentGenerationService = Depends(get_content_generation_service),
+    session: Session = Depends(get_session),
+    current_user: User = Depends(get_current_active_user)
+) -> StreamingResponse:
+    """Personalize a homework template for a student, streaming the content as it is generated.
+
+    The response is a server-sent event stream: 'token' events carry pieces of
+    the content as the AI service produces them. When generation ends, the
+    assembled content is validated and stored as a PersonalizedHomework, and a
+    'done' event reports its ID and the prompt's token counts. Failures after
+    the stream has started are reported as an 'error' event.
+
+    The student's profile is loaded up front, so the stream does not touch the
+    request's session; the homework is stored in a session of its own in a
+    worker thread, keeping the event loop free.
+
+    Args:
+        student_id: Student ID
+        template_id: Homework template ID
+        cache_mode: 'use', 'refresh' or 'bypass' the generated content cache
+        service: Content generation service
+        session: Database session
+        current_user: Current authenticated user
+
+    Returns:
+        StreamingResponse: Server-sent event stream
+
+    Raises:
+        HTTPException: If the student or template is not found or the cache mode is invalid
+    """
+    try:
+        check_cache_mode(cache_mode)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    statement = (
+        select(Student)
+        .where(Student.student_id == student_id)
+        .options(joinedload(Student.learning_context), selectinload(Student.interests_hobbies))
+    )
+    student = session.exec(statement).unique().first()
+    if student is None:
+        raise HTTPException(status_code=404, detail="Student not found")
+    template = session.get(HomeworkTemplate, template_id)
+    if template is None:
+        raise HTTPException(status_code=404, detail="Homework template not found")
+    context = homework_template_context(template)
+
+    async def events() -> AsyncIterator[str]:
+        # Sent immediately so clients and proxies see the first byte before the AI responds
+        yield ": generating\n\n"
+        pieces = []
+        report: Dict[str, Any] = {}
+        try:
+            async for delta in service.generate_stream(
+                student, context, cache_mode=cache_mode, report=report
+            ):
+                pieces.append(delta)
+                yield _sse("token", {"delta": delta})
+            content = service.parse_content("".join(pieces))
+
+            homework = PersonalizedHomework(
+                template_id=template_id,
+                student_id=student_id,
+                personalized_questions=content,
+                generation_status="completed"
+            )
+            homework_id = await asyncio.to_thread(store_homework, lambda: Session(engine), homework)
+        except Exception as e:
+            yield _sse("error", {"detail": f"Failed to generate content: {str(e)}"})
+            return
+        yield _sse("done", {"homework_id": homework_id, "content": content, "usage": report})
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
+@router.post("/classes/{class_id}/homework/{template_id}/generate", status_code=202, response_model=Dict[str, Any])
+async def generate_class_homework(
+    class_id: int,
+    template_id: int,
+    fan_out: Optional[int] = Query(None, ge=1, le=64),
+    mode: str = "full",
+    service: ContentGenerationService = Depends(get_content_generation_service),
+    registry: BatchJobRegistry = Depends(get_batch_job_registry),
+    settings: Settings = Depends(get_settings),
+    session: Session = Depends(get_session),
+    current_user: User = Depends(get_current_active_user)
+) -> Dict[str, Any]:
+    """Start personalizing a homework template for every student enrolled in a class.
+
+    The enrolled students are generated in the background with at most
+    fan_out concurrent calls. The job loads their profiles in a single query
+    (plus one eager load of their interests) and stores each PersonalizedHomework
+    row as soon as it is generated, so one failure does not lose the others.
+    In 'skeleton' mode the template's shared structure is generated once and
+    each student only gets its personalized slots, which cuts the tokens and
+    time spent per student.
+
+    Args:
+        class_id: Class ID
+        template_id: Homework template ID
+        fan_out: Maximum concurrent generations; defaults to BATCH_GENERATION_FAN_OUT
+        mode: 'full' or 'skeleton' generation
+        service: Content generation service
+        registry: Batch job registry
+        settings: Application settings
+        session: Database session
+        current_user: Current authenticated user
+
+    Returns:
+        Dict[str, Any]: Job handle with progress counts
+
+    Raises:
+        HTTPException: If the mode is unknown or the class or template is not found
+    """
+    try:
+        check_generation_mode(mode)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    if session.get(Class, class_id) is None:
+        raise HTTPException(status_code=404, detail="Class not found")
+    template = session.get(HomeworkTemplate, template_id)
+    if template is None or template.class_id != class_id:
+        raise HTTPException(status_code=404, detail="Homework template not found")
+
+    statement = select(StudentClass.student_id).where(StudentClass.class_id == class_id)
+    student_ids = list(session.exec(statement).all())
+
+    job = BatchGenerationJob(class_id, template_id, len(student_ids), mode=mode)
+    # The job outlives this request's session, so it gets plain data and opens its own
+    registry.start(job, generate_for_class(
+        job,
+        service,
+        student_ids,
+        homework_template_context(template),
+        lambda: Session(engine),
+        fan_out=fan_out or settings.BATCH_GENERATION_FAN_OUT
+    ))
+    return job.to_dict()
+
+
+@router.get("/homework/jobs/{job_id}", response_model=Dict[str, Any])
+def get_homework_job(
+    job_id: str,
+    registry: BatchJobRegistry = Depends(get_batch_job_registry),
+    current_user: User = Depends(get_current_active_user)
+) -> Dict[str, Any]:
+    """Get the progress of a class-wide homework generation job.
+
+    Args:
+        job_id: Job ID returned when the generation was started
+        registry: Batch job registry
+        current_user: Current authenticated user
+
+    Returns:
+        Dict[str, Any]: Job status and progress counts
+
+    Raises:
+        HTTPException: If the job is not found
+    """
+    job = registry.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job.to_dict()
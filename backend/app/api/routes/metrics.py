@@ -0,0 +1,56 @@
+"""Operational metrics routes for the ESL Worksheet Generator API.
+
+This module exposes runtime statistics, such as connection pool usage of the
+shared HTTP client, to administrators.
+"""
+
+from typing import Any, Dict
+
+import httpx
+from fastapi import APIRouter, Depends
+
+from app.core.dependencies import (
+    get_current_superuser, get_http_client, get_ai_gateway, get_extraction_cache, get_content_cache,
+    get_extraction_cascade, get_generation_cascade
+)
+from app.core.http_client import pool_stats
+from app.db.models import User
+from app.services.ai_gateway import AIGateway
+from app.services.model_cascade import ModelCascade
+from app.services.response_cache import ResponseCache
+
+router = APIRouter(prefix="/metrics", tags=["metrics"])
+
+
+@router.get("/", response_model=Dict[str, Any])
+def read_metrics(
+    client: httpx.AsyncClient = Depends(get_http_client),
+    gateway: AIGateway = Depends(get_ai_gateway),
+    extraction_cache: ResponseCache = Depends(get_extraction_cache),
+    content_cache: ResponseCache = Depends(get_content_cache),
+    extraction_cascade: ModelCascade = Depends(get_extraction_cascade),
+    generation_cascade: ModelCascade = Depends(get_generation_cascade),
+    current_user: User = Depends(get_current_superuser)
+) -> Dict[str, Any]:
+    """Get runtime metrics.
+    
+    Args:
+        client: Shared HTTP client
+        gateway: Shared AI gateway
+        extraction_cache: Shared extraction cache
+        content_cache: Shared generated content cache
+        extraction_cascade: Shared extraction model cascade
+        generation_cascade: Shared generation model cascade
+        current_user: Current superuser
+        
+    Returns:
+        Dict[str, Any]: Metrics grouped by component
+    """
+    return {
+        "http_client": pool_stats(client),
+        "ai_gateway": gateway.stats(),
+        "extraction_cache": extraction_cache.stats(),
+        "content_cache": content_cache.stats(),
+        "extraction_cascade": extraction_cascade.stats(),
+        "generation_cascade": generation_cascade.stats()
+    }
@@ -3,8 +3,10 @@
 This module provides dependency injection for services and database sessions.
 """
 
-from typing import Generator
-from fastapi import Depends, HTTPException, status
+from typing import Generator, Optional
+from functools import lru_cache, partial
+import httpx
+from fastapi import Depends, HTTPException, Request, status
 from sqlmodel import Session, select
 from jose import jwt, JWTError
 from datetime import datetime
@@ -15,22 +17,87 @@ from app.services.student_extractor import StudentExtractionService
 from app.services.worksheet_extractor import WorksheetExtractionService
 from app.services.content_generator import ContentGenerationService
 from app.services.pdf_generator import PDFGenerationService
+from app.services.conversation_analyzer import ConversationAnalyzer
+from app.services.doc_cache import DocCache
+from app.services.nlp_models import ParserPool
+from app.services.response_cache import ResponseCache
+from app.services.ai_gateway import AIGateway
+from app.services.model_cascade import ModelCascade
+from app.services.batch_generation import BatchJobRegistry
 from app.db.models import User
 from app.core.security import SECRET_KEY, ALGORITHM, oauth2_scheme
 from app.api.models.auth import TokenPayload
 
+def get_http_client(request: Request) -> httpx.AsyncClient:
+    """Get the shared HTTP client created at application startup.
+    
+    Args:
+        request: Incoming request, used to reach the application state
+        
+    Returns:
+        httpx.AsyncClient: Pooled client for calls to the AI service
+    """
+    return request.app.state.http_client
+
+def get_ai_gateway(request: Request) -> AIGateway:
+    """Get the shared AI gateway created at application startup.
+    
+    Args:
+        request: Incoming request, used to reach the application state
+        
+    Returns:
+        AIGateway: Rate-limited gateway for calls to the AI service
+    """
+    return request.app.state.ai_gateway
+
+@lru_cache()
+def get_extraction_cache() -> ResponseCache:
+    """Get the shared cache of transcription extraction results.
+    
+    Returns:
+        ResponseCache: Process-wide cache instance
+    """
+    settings = get_settings()
+    return ResponseCache(
+        settings.STORAGE_PATH,
+        "extraction_cache",
+        max_entries=settings.EXTRACTION_CACHE_MAX_ENTRIES,
+        ttl_seconds=settings.EXTRACTION_CACHE_TTL_SECONDS
+    )
+
+@lru_cache()
+def get_extraction_cascade() -> ModelCascade:
+    """Get the shared model cascade for extraction.
+    
+    Returns:
+        ModelCascade: Process-wide cascade, so its statistics cover every extraction
+    """
+    return ModelCascade(get_settings().EXTRACTION_MODELS)
+
 def get_student_extraction_service(
+    gateway: AIGateway = Depends(get_ai_gateway),
+    cache: ResponseCache = Depends(get_extraction_cache),
+    cascade: ModelCascade = Depends(get_extraction_cascade),
     settings: Settings = Depends(get_settings)
 ) -> StudentExtractionService:
     """Get StudentExtractionService instance.
     
     Args:
+        gateway: Shared AI gateway
+        cache: Shared extraction cache
+        cascade: Shared extraction model cascade
         settings: Application settings
         
     Returns:
         StudentExtractionService: Service instance
     """
-    return StudentExtractionService(settings.AI_SERVICE_URL, settings.AI_SERVICE_KEY)
+    return StudentExtractionService(
+        gateway,
+        cache,
+        get_analyzer=partial(get_conversation_analyzer, settings.HYBRID_EXTRACTION_TIER),
+        chunk_chars=settings.EXTRACTION_CHUNK_CHARS,
+        cascade=cascade
+    )
 
 def get_worksheet_extraction_service(
     settings: Settings = Depends(get_settings)
@@ -45,18 +112,48 @@ def get_worksheet_extraction_service(
     """
     return WorksheetExtractionService(settings.STORAGE_PATH)
 
+@lru_cache()
+def get_content_cache() -> ResponseCache:
+    """Get the shared cache of generated content keyed by profile fingerprint.
+    
+    Returns:
+        ResponseCache: Process-wide cache instance
+    """
+    settings = get_settings()
+    return ResponseCache(
+        settings.STORAGE_PATH,
+        "content_cache",
+        max_entries=settings.CONTENT_CACHE_MAX_ENTRIES,
+        ttl_seconds=settings.CONTENT_CACHE_TTL_SECONDS
+    )
+
+@lru_cache()
+def get_generation_cascade() -> ModelCascade:
+    """Get the shared model cascade for content generation.
+    
+    Returns:
+        ModelCascade: Process-wide cascade, so its statistics cover every generation
+    """
+    return ModelCascade(get_settings().GENERATION_MODELS)
+
 def get_content_generation_service(
+    gateway: AIGateway = Depends(get_ai_gateway),
+    cache: ResponseCache = Depends(get_content_cache),
+    cascade: ModelCascade = Depends(get_generation_cascade),
     settings: Settings = Depends(get_settings)
 ) -> ContentGenerationService:
     """Get ContentGenerationService instance.
     
     Args:
+        gateway: Shared AI gateway
+        cache: Shared generated content cache
+        cascade: Shared generation model cascade
         settings: Application settings
         
     Returns:
         ContentGenerationService: Service instance
     """
-    return ContentGenerationService(settings.AI_SERVICE_URL, settings.AI_SERVICE_KEY)
+    return ContentGenerationService(gateway, cache, settings.CONTENT_CONTEXT_TOKEN_BUDGET, cascade)
 
 def get_pdf_generation_service(
     settings: Settings = Depends(get_settings)
@@ -71,6 +168,53 @@ def get_pdf_generation_service(
     """
     return PDFGenerationService(settings.PDF_SERVICE_URL, settings.STORAGE_PATH)
 
+@lru_cache()
+def get_doc_cache() -> DocCache:
+    """Get the shared cache of parsed transcripts.
+    
+    Returns:
+        DocCache: Process-wide cache instance
+    """
+    settings = get_settings()
+    return DocCache(settings.STORAGE_PATH, settings.DOC_CACHE_MAX_BYTES)
+
+@lru_cache()
+def get_parser_pool() -> Optional[ParserPool]:
+    """Get the shared pool of spaCy parser processes.
+    
+    Returns:
+        Optional[ParserPool]: Process-wide pool, or None if CHUNK_PARSE_PROCESSES is 0
+    """
+    processes = get_settings().CHUNK_PARSE_PROCESSES
+    return ParserPool(processes) if processes > 0 else None
+
+@lru_cache()
+def get_conversation_analyzer(tier: str = ConversationAnalyzer.DEFAULT_TIER) -> ConversationAnalyzer:
+    """Get the shared ConversationAnalyzer for a speed/accuracy tier.
+    
+    Chunks of long transcripts are parsed by the shared parser pool, never by
+    a pool forked per transcript, so concurrent requests cannot multiply the
+    number of spaCy processes.
+    
+    Args:
+        tier: Speed/accuracy tier
+        
+    Returns:
+        ConversationAnalyzer: Process-wide analyzer instance for the tier
+    """
+    return ConversationAnalyzer(
+        tier=tier, doc_cache=get_doc_cache(), chunk_processes=1, parser_pool=get_parser_pool()
+    )
+
+@lru_cache()
+def get_batch_job_registry() -> BatchJobRegistry:
+    """Get the registry of class-wide batch generation jobs.
+    
+    Returns:
+        BatchJobRegistry: Process-wide registry instance
+    """
+    return BatchJobRegistry()
+
 # Authentication dependencies
 async def get_current_user(
     token: str = Depends(oauth2_scheme),
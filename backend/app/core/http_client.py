@@ -0,0 +1,176 @@
+"""Shared HTTP client for calls to external services.
+
+This module builds the process-wide httpx.AsyncClient used to talk to the AI
+service. One pooled client is created at application startup and closed at
+shutdown, so connections (and their TCP/TLS handshakes) are reused across
+requests instead of being opened for every call.
+"""
+
+import importlib.util
+from typing import Dict, Any
+
+import httpx
+
+from app.core.config import Settings
+
+
+class HTTPClientStats:
+    """Request and connection counters collected through the client's event hooks.
+
+    Connections are counted with the request 'trace' extension, which reports
+    the connection events of the underlying transport, so no private pool
+    state is read.
+
+    Attributes:
+        requests: Number of requests sent
+        responses: Number of responses received
+        errors: Number of responses with a 4xx or 5xx status
+        transport_errors: Number of requests that failed without a response
+        in_flight: Number of requests currently waiting for a response
+        peak_in_flight: Highest number of requests waiting at the same time
+        connections_opened: Number of new connections opened
+        tls_handshakes: Number of TLS handshakes completed
+    """
+
+    # Trace events that complete opening a connection and its TLS handshake
+    CONNECT_EVENTS = ("connection.connect_tcp.complete", "connection.connect_unix_socket.complete")
+    TLS_EVENT = "connection.start_tls.complete"
+
+    def __init__(self):
+        """Initialize all counters to zero."""
+        self.requests = 0
+        self.responses = 0
+        self.errors = 0
+        self.transport_errors = 0
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self.connections_opened = 0
+        self.tls_handshakes = 0
+
+    async def on_request(self, request: httpx.Request) -> None:
+        """Count an outgoing request and trace its connection events."""
+        self.requests += 1
+        previous = request.extensions.get("trace")
+
+        async def trace(event_name: str, info: Dict[str, Any]) -> None:
+            self.on_trace(event_name)
+            if previous is not None:
+                await previous(event_name, info)
+
+        request.extensions["trace"] = trace
+
+    async def on_response(self, response: httpx.Response) -> None:
+        """Count an incoming response."""
+        self.responses += 1
+        if response.status_code >= 400:
+            self.errors += 1
+
+    def on_trace(self, event_name: str) -> None:
+        """Count a new connection or TLS handshake reported by the transport."""
+        if event_name in self.CONNECT_EVENTS:
+            self.connections_opened += 1
+        elif event_name == self.TLS_EVENT:
+            self.tls_handshakes += 1
+
+
+class PooledAsyncClient(httpx.AsyncClient):
+    """AsyncClient that keeps request counters for pool statistics.
+
+    Attributes:
+        stats: Request and connection counters updated by the client's event hooks
+        limits: Connection limits the client was created with
+    """
+
+    def __init__(self, **kwargs: Any):
+        """Initialize the client and register the counting event hooks.
+
+        Args:
+            **kwargs: Keyword arguments for httpx.AsyncClient
+        """
+        self.stats = HTTPClientStats()
+        self.limits = kwargs.get("limits", httpx.Limits(max_connections=100, max_keepalive_connections=20))
+        event_hooks = kwargs.pop("event_hooks", None) or {}
+        event_hooks = {
+            "request": [*event_hooks.get("request", []), self.stats.on_request],
+            "response": [*event_hooks.get("response", []), self.stats.on_response],
+        }
+        super().__init__(event_hooks=event_hooks, **kwargs)
+
+    async def send(self, request: httpx.Request, **kwargs: Any) -> httpx.Response:
+        """Send a request, counting it as in flight until its response arrives.
+
+        Args:
+            request: Request to send
+            **kwargs: Keyword arguments for httpx.AsyncClient.send
+
+        Returns:
+            httpx.Response: The response
+        """
+        stats = self.stats
+        stats.in_flight += 1
+        stats.peak_in_flight = max(stats.peak_in_flight, stats.in_flight)
+        try:
+            return await super().send(request, **kwargs)
+        except httpx.TransportError:
+            stats.transport_errors += 1
+            raise
+        finally:
+            stats.in_flight -= 1
+
+
+def create_http_client(settings: Settings) -> PooledAsyncClient:
+    """Create the pooled HTTP client.
+
+    HTTP/2 is only enabled when requested and the optional 'h2' package is
+    installed; otherwise the client falls back to HTTP/1.1 keep-alive.
+
+    Args:
+        settings: Application settings
+
+    Returns:
+        PooledAsyncClient: Configured client; the caller is responsible for closing it
+    """
+    return PooledAsyncClient(
+        limits=httpx.Limits(
+            max_connections=settings.AI_HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=settings.AI_HTTP_MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=settings.AI_HTTP_KEEPALIVE_EXPIRY,
+        ),
+        timeout=httpx.Timeout(
+            settings.AI_HTTP_TIMEOUT,
+            connect=settings.AI_HTTP_CONNECT_TIMEOUT,
+        ),
+        http2=settings.AI_HTTP2 and importlib.util.find_spec("h2") is not None,
+    )
+
+
+def pool_stats(client: httpx.AsyncClient) -> Dict[str, Any]:
+    """Report request and connection counters for a client.
+
+    Only counters the client tracks itself are reported; clients not created
+    by create_http_client have none and report an empty dictionary.
+    requests_per_connection shows how well connections are reused.
+
+    Args:
+        client: HTTP client, ideally one created by create_http_client
+
+    Returns:
+        Dict[str, Any]: Request and connection statistics
+    """
+    counters = getattr(client, "stats", None)
+    if counters is None:
+        return {}
+    opened = counters.connections_opened
+    return {
+        "requests": counters.requests,
+        "responses": counters.responses,
+        "errors": counters.errors,
+        "transport_errors": counters.transport_errors,
+        "in_flight": counters.in_flight,
+        "peak_in_flight": counters.peak_in_flight,
+        "connections_opened": opened,
+        "tls_handshakes": counters.tls_handshakes,
+        "requests_per_connection": counters.requests / opened if opened else None,
+        "max_connections": client.limits.max_connections,
+        "max_keepalive_connections": client.limits.max_keepalive_connections,
+    }
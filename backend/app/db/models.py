@@ -48,34 +48,34 @@ class Student(StudentBase, table=True):
 class BasicInformation(SQLModel, table=True):
     basic_info_id: Optional[int] = Field(default=None, primary_key=True)
     student_id: int = Field(foreign_key="student.student_id")
-    date_of_birth: date
-    email: str
-    phone: str
-    native_language: str
-    current_address: str
+    date_of_birth: Optional[date] = None
+    email: Optional[str] = None
+    phone: Optional[str] = None
+    native_language: Optional[str] = None
+    current_address: Optional[str] = None
     
     student: Student = Relationship(back_populates="basic_info")
 
 class ProfessionalBackground(SQLModel, table=True):
     prof_background_id: Optional[int] = Field(default=None, primary_key=True)
     student_id: int = Field(foreign_key="student.student_id")
-    current_occupation: str
-    company: str
-    industry: str
-    work_responsibilities: str
-    years_of_experience: int
-    education_level: str
+    current_occupation: Optional[str] = None
+    company: Optional[str] = None
+    industry: Optional[str] = None
+    work_responsibilities: Optional[str] = None
+    years_of_experience: Optional[int] = None
+    education_level: Optional[str] = None
     
     student: Student = Relationship(back_populates="professional_background")
 
 class PersonalBackground(SQLModel, table=True):
     personal_background_id: Optional[int] = Field(default=None, primary_key=True)
     student_id: int = Field(foreign_key="student.student_id")
-    hometown: str
-    country_of_origin: str
-    family_background: str
-    life_experiences: str
-    personal_goals: str
+    hometown: Optional[str] = None
+    country_of_origin: Optional[str] = None
+    family_background: Optional[str] = None
+    life_experiences: Optional[str] = None
+    personal_goals: Optional[str] = None
     
     student: Student = Relationship(back_populates="personal_background")
 
@@ -84,43 +84,43 @@ class InterestHobby(SQLModel, table=True):
     student_id: int = Field(foreign_key="student.student_id")
     category: str
     name: str
-    description: str
-    experience_years: int
-    frequency: str
+    description: Optional[str] = None
+    experience_years: Optional[int] = None
+    frequency: Optional[str] = None
     
     student: Student = Relationship(back_populates="interests_hobbies")
 
 class LearningContext(SQLModel, table=True):
     learning_context_id: Optional[int] = Field(default=None, primary_key=True)
     student_id: int = Field(foreign_key="student.student_id")
-    learning_goals: str
-    preferred_learning_style: str
-    previous_language_experience: str
-    challenges: str
-    strengths: str
-    areas_for_improvement: str
+    learning_goals: Optional[str] = None
+    preferred_learning_style: Optional[str] = None
+    previous_language_experience: Optional[str] = None
+    challenges: Optional[str] = None
+    strengths: Optional[str] = None
+    areas_for_improvement: Optional[str] = None
     
     student: Student = Relationship(back_populates="learning_context")
 
 class CulturalElements(SQLModel, table=True):
     cultural_elements_id: Optional[int] = Field(default=None, primary_key=True)
     student_id: int = Field(foreign_key="student.student_id")
-    cultural_background: str
-    traditions: str
-    value_systems: str
-    cultural_practices: str
-    dietary_preferences: str
+    cultural_background: Optional[str] = None
+    traditions: Optional[str] = None
+    value_systems: Optional[str] = None
+    cultural_practices: Optional[str] = None
+    dietary_preferences: Optional[str] = None
     
     student: Student = Relationship(back_populates="cultural_elements")
 
 class SocialAspects(SQLModel, table=True):
     social_aspects_id: Optional[int] = Field(default=None, primary_key=True)
     student_id: int = Field(foreign_key="student.student_id")
-    communication_style: str
-    group_work_preference: str
-    social_interests: str
-    community_involvement: str
-    interaction_preferences: str
+    communication_style: Optional[str] = None
+    group_work_preference: Optional[str] = None
+    social_interests: Optional[str] = None
+    community_involvement: Optional[str] = None
+    interaction_preferences: Optional[str] = None
     
     student: Student = Relationship(back_populates="social_aspects")
 
@@ -265,4 +265,29 @@ class User(SQLModel, table=True):
     professor_id: Optional[int] = Field(default=None, foreign_key="professor.professor_id")
     professor: Optional[Professor] = Relationship(
         sa_relationship_kwargs={"foreign_keys": "[User.professor_id]"}
-    ) 
\ No newline at end of file
+    )
+
+# Background Processing Tables
+class TranscriptionJob(SQLModel, table=True):
+    """Queued transcription awaiting extraction by a worker.
+    
+    Workers claim queued jobs with SELECT ... FOR UPDATE SKIP LOCKED, so any
+    number of workers can poll the table without taking the same job. A job
+    left in 'processing' past its lease (its worker died) is claimed again.
+    """
+    job_id: Optional[int] = Field(default=None, primary_key=True)
+    status: str = Field(default="queued", index=True)  # queued, processing, completed, failed
+    stage: Optional[str] = None  # extracting, validating, saving while processing
+    transcription: str
+    cache_mode: str = "use"
+    extraction_mode: str = "llm"  # llm, hybrid, chunked
+    attempts: int = 0
+    worker_id: Optional[str] = None
+    student_id: Optional[int] = Field(default=None, foreign_key="student.student_id")
+    submitted_by: Optional[int] = Field(default=None, foreign_key="user.user_id")
+    result: Optional[Dict[str, Any]] = Field(default=None, sa_column=Column(JSONB))
+    extraction_report: Optional[Dict[str, Any]] = Field(default=None, sa_column=Column(JSONB))
+    error: Optional[str] = None
+    created_at: datetime = Field(default_factory=datetime.utcnow, index=True)
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
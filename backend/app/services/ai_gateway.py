@@ -0,0 +1,647 @@
+"""Gateway for all calls to the AI service.
+
+This module wraps the shared HTTP client with the controls needed to stay
+within the provider's limits: a global concurrency limit, request and token
+rate limits, retries with exponential backoff that honour Retry-After, and a
+circuit breaker that fails fast while the provider is degraded.
+"""
+
+import asyncio
+import hashlib
+import json
+import random
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import AsyncIterator, Dict, Any, Optional
+
+import httpx
+
+from app.core.config import Settings
+
+RETRYABLE_STATUS_CODES = {408, 409, 429, 500, 502, 503, 504}
+
+
+class AIServiceError(Exception):
+    """Raised when the AI service cannot produce a response.
+
+    Attributes:
+        status_code: HTTP status returned by the AI service, if any
+        retry_after: Seconds the caller should wait before trying again, if known
+    """
+
+    def __init__(self, message: str, status_code: Optional[int] = None,
+                 retry_after: Optional[float] = None):
+        """Initialize the error.
+
+        Args:
+            message: Error description
+            status_code: HTTP status returned by the AI service, if any
+            retry_after: Seconds the caller should wait before trying again, if known
+        """
+        super().__init__(message)
+        self.status_code = status_code
+        self.retry_after = retry_after
+
+
+class CircuitOpenError(AIServiceError):
+    """Raised without calling the AI service while the circuit breaker is open."""
+
+
+class TokenBucket:
+    """Token bucket rate limiter for asyncio tasks.
+
+    The bucket refills continuously at `rate` tokens per second up to
+    `capacity`. Callers wait until enough tokens are available; the level may
+    go negative after a request larger than the capacity or an adjustment,
+    which delays later callers accordingly.
+
+    Attributes:
+        rate (float): Tokens added per second
+        capacity (float): Maximum number of stored tokens
+    """
+
+    def __init__(self, rate: float, capacity: float):
+        """Initialize a full bucket.
+
+        Args:
+            rate: Tokens added per second
+            capacity: Maximum number of stored tokens
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    @property
+    def tokens(self) -> float:
+        """Number of tokens currently available."""
+        self._refill()
+        return self._tokens
+
+    async def acquire(self, amount: float = 1.0) -> float:
+        """Wait until the requested tokens are available and take them.
+
+        A request larger than the capacity proceeds once the bucket is full
+        and leaves the level negative by the excess, so later callers wait
+        until the whole request has been paid for.
+
+        Args:
+            amount: Number of tokens to take
+
+        Returns:
+            float: Seconds spent waiting
+        """
+        needed = min(amount, self.capacity)
+        waited = 0.0
+        # The lock keeps waiters in arrival order
+        async with self._lock:
+            self._refill()
+            while self._tokens < needed:
+                delay = (needed - self._tokens) / self.rate
+                await asyncio.sleep(delay)
+                waited += delay
+                self._refill()
+            self._tokens -= amount
+        return waited
+
+    def adjust(self, amount: float) -> None:
+        """Take (or with a negative amount, return) tokens without waiting.
+
+        Args:
+            amount: Number of tokens to take
+        """
+        self._refill()
+        self._tokens = min(self._tokens - amount, self.capacity)
+
+    def _refill(self) -> None:
+        """Add the tokens accrued since the last update."""
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+
+class CircuitBreaker:
+    """Consecutive-failure circuit breaker.
+
+    After `failure_threshold` consecutive failures the circuit opens and calls
+    are rejected for `recovery_seconds`. Then a single trial call is let
+    through (half-open): its success closes the circuit, its failure opens it
+    again.
+
+    Attributes:
+        failure_threshold (int): Consecutive failures that open the circuit
+        recovery_seconds (float): Time the circuit stays open before a trial call
+        state (str): 'closed', 'open' or 'half_open'
+    """
+
+    def __init__(self, failure_threshold: int = 5, recovery_seconds: float = 30.0):
+        """Initialize a closed circuit.
+
+        Args:
+            failure_threshold: Consecutive failures that open the circuit
+            recovery_seconds: Time the circuit stays open before a trial call
+        """
+        self.failure_threshold = failure_threshold
+        self.recovery_seconds = recovery_seconds
+        self.state = "closed"
+        self.failures = 0
+        self.opened_count = 0
+        self._opened_at = 0.0
+        self._trial_in_flight = False
+
+    def check(self) -> None:
+        """Reject a call while the circuit is open, without changing its state.
+
+        Raises:
+            CircuitOpenError: If the circuit is open and not yet due for a trial call
+        """
+        if self.state == "open":
+            remaining = self._opened_at + self.recovery_seconds - time.monotonic()
+            if remaining > 0:
+                raise CircuitOpenError(
+                    "AI service circuit is open after repeated failures",
+                    retry_after=remaining
+                )
+
+    def before_call(self) -> bool:
+        """Check whether a call may proceed.
+
+        Returns:
+            bool: Whether the call is the half-open trial call
+
+        Raises:
+            CircuitOpenError: If the circuit is open or a trial call is running
+        """
+        self.check()
+        if self.state == "open":
+            self.state = "half_open"
+        if self.state == "half_open":
+            if self._trial_in_flight:
+                raise CircuitOpenError(
+                    "AI service circuit is half-open; a trial call is in progress",
+                    retry_after=self.recovery_seconds
+                )
+            self._trial_in_flight = True
+            return True
+        return False
+
+    def record_success(self, trial: bool = False) -> None:
+        """Close the circuit after a successful call.
+
+        Args:
+            trial: Whether the call was the half-open trial call
+        """
+        self.state = "closed"
+        self.failures = 0
+        if trial:
+            self._trial_in_flight = False
+
+    def record_failure(self, trial: bool = False) -> None:
+        """Count a failed call, opening the circuit when the threshold is reached.
+
+        Args:
+            trial: Whether the call was the half-open trial call
+        """
+        self.failures += 1
+        if trial:
+            self._trial_in_flight = False
+        if self.state == "half_open" or self.failures >= self.failure_threshold:
+            if self.state != "open":
+                self.opened_count += 1
+            self.state = "open"
+            self._opened_at = time.monotonic()
+
+    def release(self, trial: bool = False) -> None:
+        """End a call that says nothing about the provider's health.
+
+        Args:
+            trial: Whether the call was the half-open trial call
+        """
+        if trial:
+            self._trial_in_flight = False
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header into seconds.
+
+    Args:
+        value: Header value, either delay seconds or an HTTP date
+
+    Returns:
+        Optional[float]: Seconds to wait, or None if missing or unparseable
+    """
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max((retry_at - datetime.now(timezone.utc)).total_seconds(), 0.0)
+
+
+class AIGateway:
+    """Rate-limited, retrying client for the AI service's chat completions API.
+
+    One gateway is shared by every AI-calling service so the limits apply to
+    the whole process. Identical requests made while one is already in flight
+    are coalesced: the later callers await the first call's result instead of
+    sending their own request.
+
+    Attributes:
+        ai_service_url: URL for the AI service
+        max_retries: Retries after the first attempt for retryable failures
+        backoff_base: Base delay in seconds for exponential backoff
+        backoff_max: Maximum backoff delay in seconds
+        breaker: Circuit breaker guarding the AI service
+    """
+
+    def __init__(
+        self,
+        client: httpx.AsyncClient,
+        ai_service_url: str,
+        ai_service_key: str,
+        max_concurrency: int = 16,
+        requests_per_minute: float = 500,
+        tokens_per_minute: float = 150_000,
+        max_retries: int = 4,
+        backoff_base: float = 0.5,
+        backoff_max: float = 30.0,
+        failure_threshold: int = 5,
+        recovery_seconds: float = 30.0,
+        default_completion_tokens: int = 1000
+    ):
+        """Initialize the gateway.
+
+        Args:
+            client: Shared HTTP client
+            ai_service_url: URL for the AI service
+            ai_service_key: API key for the AI service
+            max_concurrency: Maximum requests in flight to the AI service
+            requests_per_minute: Request rate limit
+            tokens_per_minute: Token rate limit (prompt plus completion tokens)
+            max_retries: Retries after the first attempt for retryable failures
+            backoff_base: Base delay in seconds for exponential backoff
+            backoff_max: Maximum backoff delay in seconds
+            failure_threshold: Consecutive failures that open the circuit
+            recovery_seconds: Time the circuit stays open before a trial call
+            default_completion_tokens: Completion size assumed for rate limiting
+                when a request does not set max_tokens
+        """
+        self.client = client
+        self.ai_service_url = ai_service_url
+        self.headers = {"Authorization": f"Bearer {ai_service_key}"}
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.default_completion_tokens = default_completion_tokens
+        self.breaker = CircuitBreaker(failure_threshold, recovery_seconds)
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._max_concurrency = max_concurrency
+        self._request_bucket = TokenBucket(requests_per_minute / 60, max(requests_per_minute / 60, 1.0))
+        self._token_bucket = TokenBucket(tokens_per_minute / 60, tokens_per_minute / 60)
+        self._stats = {
+            "calls": 0,
+            "attempts": 0,
+            "retries": 0,
+            "rate_limited": 0,
+            "failures": 0,
+            "short_circuited": 0,
+            "throttle_wait_seconds": 0.0,
+            "in_flight": 0,
+            "coalesced": 0,
+        }
+        # Shared upstream calls by request hash, for single-flight coalescing
+        self._pending: Dict[str, "asyncio.Task[Dict[str, Any]]"] = {}
+
+    async def chat_completion(self, payload: Dict[str, Any], coalesce: bool = True) -> Dict[str, Any]:
+        """Send a chat completion request.
+
+        Args:
+            payload: Request body for the chat completions endpoint
+            coalesce: Share the result of an identical request already in
+                flight instead of sending a new one
+
+        Returns:
+            Dict[str, Any]: Decoded response body; coalesced callers receive
+                the same object, so it must not be mutated
+
+        Raises:
+            CircuitOpenError: If the circuit breaker rejects the call
+            AIServiceError: If the request fails and cannot be retried
+        """
+        self._stats["calls"] += 1
+        if not coalesce:
+            return await self._call(payload)
+
+        key = self.request_key(payload)
+        task = self._pending.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._call(payload))
+            self._pending[key] = task
+            task.add_done_callback(lambda done: self._finish_pending(key, done))
+        else:
+            self._stats["coalesced"] += 1
+        # Shielded so that a cancelled caller does not cancel the call for the others
+        return await asyncio.shield(task)
+
+    @staticmethod
+    def request_key(payload: Dict[str, Any]) -> str:
+        """Hash a request body for single-flight coalescing.
+
+        Args:
+            payload: Request body for the chat completions endpoint
+
+        Returns:
+            str: Hex digest identifying the request
+        """
+        canonical = json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str)
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+    def _finish_pending(self, key: str, task: "asyncio.Task[Dict[str, Any]]") -> None:
+        """Forget a finished shared call."""
+        if self._pending.get(key) is task:
+            del self._pending[key]
+        if not task.cancelled():
+            # Mark the exception as retrieved even if every caller was cancelled
+            task.exception()
+
+    async def _call(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """Send a request with retries; see chat_completion."""
+        estimate = self.estimate_tokens(payload)
+        attempt = 0
+        while True:
+            try:
+                response = await self._send(payload, estimate)
+            except CircuitOpenError:
+                self._stats["short_circuited"] += 1
+                raise
+            except httpx.TransportError as e:
+                error = AIServiceError(f"AI service request failed: {e!r}")
+            else:
+                if response.status_code == 200:
+                    try:
+                        data = response.json()
+                    except ValueError:
+                        self._stats["failures"] += 1
+                        raise AIServiceError("AI service returned invalid JSON", status_code=200)
+                    used = (data.get("usage") or {}).get("total_tokens")
+                    if used:
+                        self._token_bucket.adjust(used - estimate)
+                    return data
+
+                error = self._status_error(response)
+                if response.status_code not in RETRYABLE_STATUS_CODES:
+                    self._stats["failures"] += 1
+                    raise error
+
+            if attempt >= self.max_retries:
+                self._stats["failures"] += 1
+                raise error
+            attempt += 1
+            self._stats["retries"] += 1
+            await asyncio.sleep(self.backoff_delay(attempt, error.retry_after))
+
+    def backoff_delay(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        """Compute the delay before a retry.
+
+        Uses exponential backoff with full jitter. A Retry-After from the
+        provider takes precedence, with a little jitter added so that callers
+        throttled together do not retry together.
+
+        Args:
+            attempt: Retry number, starting at 1
+            retry_after: Delay requested by the provider, if any
+
+        Returns:
+            float: Seconds to wait
+        """
+        if retry_after is not None:
+            return retry_after + random.uniform(0, self.backoff_base)
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * 2 ** attempt))
+
+    def estimate_tokens(self, payload: Dict[str, Any]) -> int:
+        """Estimate the tokens a request will use, for rate limiting.
+
+        Args:
+            payload: Request body for the chat completions endpoint
+
+        Returns:
+            int: Approximate prompt plus completion tokens
+        """
+        prompt_chars = sum(len(str(m.get("content", ""))) for m in payload.get("messages", []))
+        # Roughly four characters per token for English text
+        return prompt_chars // 4 + payload.get("max_tokens", self.default_completion_tokens)
+
+    def stats(self) -> Dict[str, Any]:
+        """Return call counters, limiter levels and the circuit state.
+
+        Returns:
+            Dict[str, Any]: Gateway statistics
+        """
+        return {
+            **self._stats,
+            "max_concurrency": self._max_concurrency,
+            "request_tokens_available": self._request_bucket.tokens,
+            "llm_tokens_available": self._token_bucket.tokens,
+            "circuit_state": self.breaker.state,
+            "circuit_opened": self.breaker.opened_count,
+        }
+
+    async def stream_chat_completion(self, payload: Dict[str, Any]) -> AsyncIterator[str]:
+        """Send a streaming chat completion request and yield the content deltas.
+
+        The request is sent with 'stream': true and counts against the same
+        limits as chat_completion, holding its concurrency slot until the
+        stream ends. Retries only happen before the first token; a failure
+        after that is raised to the caller. Streams are never coalesced.
+
+        Args:
+            payload: Request body for the chat completions endpoint
+
+        Yields:
+            str: Content deltas in the order the AI service sends them
+
+        Raises:
+            CircuitOpenError: If the circuit breaker rejects the call
+            AIServiceError: If the request fails and cannot be retried
+        """
+        self._stats["calls"] += 1
+        payload = {**payload, "stream": True}
+        estimate = self.estimate_tokens(payload)
+        attempt = 0
+        while True:
+            try:
+                await self._throttle(estimate)
+                async with self._semaphore:
+                    trial = self.breaker.before_call()
+                    self._stats["attempts"] += 1
+                    self._stats["in_flight"] += 1
+                    started = False
+                    try:
+                        async with self.client.stream(
+                            "POST",
+                            f"{self.ai_service_url}/chat/completions",
+                            headers=self.headers,
+                            json=payload
+                        ) as response:
+                            if response.status_code == 200:
+                                started = True
+                                async for delta in _iter_stream_deltas(response):
+                                    yield delta
+                            else:
+                                await response.aread()
+                    except httpx.TransportError as e:
+                        self.breaker.record_failure(trial)
+                        if started:
+                            self._stats["failures"] += 1
+                            raise AIServiceError(f"AI service stream failed: {e!r}")
+                        error = AIServiceError(f"AI service request failed: {e!r}")
+                    except AIServiceError:
+                        # A malformed event: the provider is misbehaving mid-stream
+                        self.breaker.record_failure(trial)
+                        self._stats["failures"] += 1
+                        raise
+                    except BaseException:
+                        self.breaker.release(trial)
+                        raise
+                    else:
+                        self._record_status(trial, response.status_code)
+                        if started:
+                            return
+                        error = self._status_error(response)
+                    finally:
+                        self._stats["in_flight"] -= 1
+            except CircuitOpenError:
+                self._stats["short_circuited"] += 1
+                raise
+
+            if error.status_code is not None and error.status_code not in RETRYABLE_STATUS_CODES:
+                self._stats["failures"] += 1
+                raise error
+            if attempt >= self.max_retries:
+                self._stats["failures"] += 1
+                raise error
+            attempt += 1
+            self._stats["retries"] += 1
+            await asyncio.sleep(self.backoff_delay(attempt, error.retry_after))
+
+    async def _throttle(self, estimate: int) -> None:
+        """Wait for the rate limiters, failing fast while the circuit is open.
+
+        Raises:
+            CircuitOpenError: If the circuit is open
+        """
+        self.breaker.check()
+        waited = await self._request_bucket.acquire()
+        waited += await self._token_bucket.acquire(estimate)
+        self._stats["throttle_wait_seconds"] += waited
+
+    def _record_status(self, trial: bool, status_code: int) -> None:
+        """Report a response status to the circuit breaker.
+
+        Server errors count as failures, while throttling and client errors say
+        nothing about the provider's health.
+        """
+        if status_code == 200:
+            self.breaker.record_success(trial)
+        elif status_code >= 500:
+            self.breaker.record_failure(trial)
+        else:
+            self.breaker.release(trial)
+
+    def _status_error(self, response: httpx.Response) -> AIServiceError:
+        """Build the error for a non-200 response, counting rate limiting."""
+        if response.status_code == 429:
+            self._stats["rate_limited"] += 1
+        return AIServiceError(
+            f"AI service returned status {response.status_code}",
+            status_code=response.status_code,
+            retry_after=parse_retry_after(response.headers.get("Retry-After"))
+        )
+
+    async def _send(self, payload: Dict[str, Any], estimate: int) -> httpx.Response:
+        """Send one attempt once the rate limiters, a concurrency slot and the breaker allow it."""
+        await self._throttle(estimate)
+        async with self._semaphore:
+            # Checked again since the circuit may have opened while this call queued
+            trial = self.breaker.before_call()
+            self._stats["attempts"] += 1
+            self._stats["in_flight"] += 1
+            try:
+                response = await self.client.post(
+                    f"{self.ai_service_url}/chat/completions",
+                    headers=self.headers,
+                    json=payload
+                )
+            except httpx.TransportError:
+                self.breaker.record_failure(trial)
+                raise
+            except BaseException:
+                self.breaker.release(trial)
+                raise
+            finally:
+                self._stats["in_flight"] -= 1
+
+        self._record_status(trial, response.status_code)
+        return response
+
+
+def create_ai_gateway(client: httpx.AsyncClient, settings: Settings) -> AIGateway:
+    """Create the AI gateway configured from the application settings.
+
+    Args:
+        client: Shared HTTP client
+        settings: Application settings
+
+    Returns:
+        AIGateway: Configured gateway
+    """
+    return AIGateway(
+        client,
+        settings.AI_SERVICE_URL,
+        settings.AI_SERVICE_KEY,
+        max_concurrency=settings.AI_MAX_CONCURRENCY,
+        requests_per_minute=settings.AI_REQUESTS_PER_MINUTE,
+        tokens_per_minute=settings.AI_TOKENS_PER_MINUTE,
+        max_retries=settings.AI_MAX_RETRIES,
+        backoff_base=settings.AI_BACKOFF_BASE_SECONDS,
+        backoff_max=settings.AI_BACKOFF_MAX_SECONDS,
+        failure_threshold=settings.AI_CIRCUIT_FAILURE_THRESHOLD,
+        recovery_seconds=settings.AI_CIRCUIT_RECOVERY_SECONDS
+    )
+
+
+async def _iter_stream_deltas(response: httpx.Response) -> AsyncIterator[str]:
+    """Yield the content deltas of a streamed chat completion.
+
+    Args:
+        response: Open response carrying server-sent events
+
+    Yields:
+        str: Non-empty content deltas
+
+    Raises:
+        AIServiceError: If an event is not a valid chat completion chunk
+    """
+    async for line in response.aiter_lines():
+        if not line.startswith("data:"):
+            continue
+        data = line[len("data:"):].strip()
+        if data == "[DONE]":
+            break
+        try:
+            chunk = json.loads(data)
+            deltas = [(choice.get("delta") or {}).get("content") for choice in chunk.get("choices", [])]
+        except (ValueError, AttributeError, TypeError) as e:
+            raise AIServiceError(f"AI service sent a malformed stream event: {e!r}", status_code=200)
+        for delta in deltas:
+            if delta:
+                yield delta
@@ -0,0 +1,135 @@
+"""Parsing of JSON answers from the AI service.
+
+This module decodes the JSON documents the AI service returns. Well-formed
+answers take the plain json.loads path; otherwise common defects are repaired
+locally (markdown code fences, prose around the object, trailing commas,
+Python literals, output cut off before the closing braces) so that a
+malformed answer does not have to be requested again.
+"""
+
+import json
+import re
+from typing import Any, Dict, List, Optional, Tuple
+
+# Markdown code fence around an answer, e.g. ```json ... ```
+_FENCE = re.compile(r"```[\w-]*\s*(.*?)(?:```|$)", re.DOTALL)
+
+# Python literals sometimes written instead of their JSON equivalents
+_LITERALS = {"True": "true", "False": "false", "None": "null"}
+
+_CLOSERS = {"{": "}", "[": "]"}
+
+
+def _strip_trailing_comma(out: List[str]) -> None:
+    """Remove a comma (and whitespace after it) at the end of the output."""
+    while out and out[-1].isspace():
+        out.pop()
+    if out and out[-1] == ",":
+        out.pop()
+
+
+def repair_json(text: str) -> Optional[str]:
+    """Repair common defects of a JSON object returned as text.
+
+    Takes the first JSON object in the text, dropping code fences and any text
+    before or after it, removes trailing commas, replaces Python literals and
+    closes strings, arrays and objects left open by a truncated answer. If the
+    answer was cut off inside a field, the incomplete field is dropped.
+
+    Args:
+        text: Answer text
+
+    Returns:
+        Optional[str]: Repaired JSON text, or None if the text has no object
+    """
+    fenced = _FENCE.search(text)
+    if fenced and "{" in fenced.group(1):
+        text = fenced.group(1)
+    start = text.find("{")
+    if start < 0:
+        return None
+
+    out: List[str] = []
+    stack: List[str] = []
+    # Output length and open containers at the last comma outside a string,
+    # used to drop a field cut off by truncation
+    last_comma: Optional[Tuple[int, List[str]]] = None
+    in_string = escaped = False
+    i = start
+    while i < len(text):
+        char = text[i]
+        if in_string:
+            out.append(char)
+            if escaped:
+                escaped = False
+            elif char == "\\":
+                escaped = True
+            elif char == '"':
+                in_string = False
+        elif char == '"':
+            in_string = True
+            out.append(char)
+        elif char in _CLOSERS:
+            stack.append(_CLOSERS[char])
+            out.append(char)
+        elif char in "}]":
+            if not stack:
+                break
+            _strip_trailing_comma(out)
+            out.append(stack.pop())
+            if not stack:
+                return "".join(out)
+        elif char == ",":
+            out.append(char)
+            last_comma = (len(out) - 1, list(stack))
+        elif char.isalpha():
+            word = re.match(r"[A-Za-z]+", text[i:]).group(0)
+            out.append(_LITERALS.get(word, word))
+            i += len(word)
+            continue
+        else:
+            out.append(char)
+        i += 1
+
+    # The answer ended before the object was closed
+    candidates = []
+    closed = out + (['"'] if in_string else [])
+    _strip_trailing_comma(closed)
+    candidates.append("".join(closed) + "".join(reversed(stack)))
+    if last_comma is not None:
+        length, open_containers = last_comma
+        candidates.append("".join(out[:length]) + "".join(reversed(open_containers)))
+    for candidate in candidates:
+        try:
+            json.loads(candidate)
+        except ValueError:
+            continue
+        return candidate
+    return candidates[0]
+
+
+def parse_json_object(text: str) -> Dict[str, Any]:
+    """Decode a JSON object answered by the AI service, repairing it if needed.
+
+    Args:
+        text: Answer text
+
+    Returns:
+        Dict[str, Any]: Decoded object
+
+    Raises:
+        ValueError: If the text is not a JSON object, even after repair
+    """
+    try:
+        value = json.loads(text)
+    except ValueError:
+        repaired = repair_json(text)
+        if repaired is None:
+            raise ValueError("AI service answer does not contain a JSON object")
+        try:
+            value = json.loads(repaired)
+        except ValueError as e:
+            raise ValueError(f"AI service answer is not valid JSON: {e}")
+    if not isinstance(value, dict):
+        raise ValueError("AI service answer is not a JSON object")
+    return value
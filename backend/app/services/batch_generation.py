@@ -0,0 +1,301 @@
+"""Class-wide batch generation of personalized homework.
+
+This module personalizes one homework template for every student in a class,
+calling the content generation service concurrently with a bounded fan-out,
+and tracks the progress of each batch as an in-memory job.
+"""
+
+import asyncio
+import logging
+import threading
+import uuid
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Callable, Coroutine, Dict, List, Optional
+
+from sqlalchemy.orm import joinedload, selectinload
+from sqlmodel import Session, select
+
+from app.db.models import PersonalizedHomework, Student
+from app.services.content_generator import ContentGenerationService
+
+logger = logging.getLogger(__name__)
+
+
+class BatchGenerationJob:
+    """Progress of a class-wide homework generation.
+
+    Attributes:
+        job_id (str): Unique job identifier
+        class_id (int): Class whose students are personalized for
+        template_id (int): Homework template being personalized
+        mode (str): 'full' generates every student's content from scratch,
+            'skeleton' generates the shared structure once and only the
+            personalized slots per student
+        total (int): Number of students in the batch
+        completed (int): Students whose homework was generated and stored
+        failed (int): Students whose generation or storage failed
+        failures (Dict[int, str]): Why each failed student failed, by student ID
+        status (str): 'running', 'completed' or 'failed'
+        homework_ids (List[int]): IDs of the stored PersonalizedHomework rows, in
+            the order they were stored
+        prompt_tokens (int): Locally counted prompt tokens of the generations
+            sent to the AI service (cached results excluded)
+        completion_tokens (int): Completion tokens reported by the AI service
+        error (Optional[str]): Why the job failed, if it did
+    """
+
+    def __init__(self, class_id: int, template_id: int, total: int, mode: str = "full"):
+        """Initialize a running job.
+
+        Args:
+            class_id: Class whose students are personalized for
+            template_id: Homework template being personalized
+            total: Number of students in the batch
+            mode: 'full' or 'skeleton' generation
+        """
+        self.job_id = uuid.uuid4().hex
+        self.class_id = class_id
+        self.template_id = template_id
+        self.mode = mode
+        self.total = total
+        self.completed = 0
+        self.failed = 0
+        self.failures: Dict[int, str] = {}
+        self.status = "running"
+        self.homework_ids: List[int] = []
+        self.prompt_tokens = 0
+        self.completion_tokens = 0
+        self.error: Optional[str] = None
+        self.created_at = datetime.utcnow()
+        self.finished_at: Optional[datetime] = None
+        self.task: Optional[asyncio.Task] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the job's progress for API responses.
+
+        Returns:
+            Dict[str, Any]: Job status and progress counts
+        """
+        return {
+            "job_id": self.job_id,
+            "class_id": self.class_id,
+            "template_id": self.template_id,
+            "mode": self.mode,
+            "status": self.status,
+            "total": self.total,
+            "completed": self.completed,
+            "failed": self.failed,
+            "failures": dict(self.failures),
+            "pending": self.total - self.completed - self.failed,
+            "homework_ids": self.homework_ids,
+            "prompt_tokens": self.prompt_tokens,
+            "completion_tokens": self.completion_tokens,
+            "error": self.error,
+            "created_at": self.created_at.isoformat(),
+            "finished_at": self.finished_at.isoformat() if self.finished_at else None,
+            "elapsed_seconds": ((self.finished_at or datetime.utcnow()) - self.created_at).total_seconds(),
+        }
+
+    def record_usage(self, report: Dict[str, Any]) -> None:
+        """Add the tokens of one generation to the job's totals.
+
+        Args:
+            report: Report filled in by the content generation service
+        """
+        if report and not report.get("cached"):
+            # The prompt is sent once more for every escalation to a larger model
+            calls = 1 + len((report.get("cascade") or {}).get("escalations", []))
+            self.prompt_tokens += report.get("prompt_tokens", 0) * calls
+            self.completion_tokens += (report.get("provider_usage") or {}).get("completion_tokens", 0)
+
+
+class BatchJobRegistry:
+    """In-memory registry of recent batch generation jobs.
+
+    Jobs live in the process that runs them, so status is only available from
+    that process and is lost on restart; the generated homework itself is
+    stored in the database.
+
+    Attributes:
+        max_jobs (int): Number of jobs remembered; the oldest are dropped first
+    """
+
+    def __init__(self, max_jobs: int = 1000):
+        """Initialize an empty registry.
+
+        Args:
+            max_jobs: Number of jobs remembered
+        """
+        self.max_jobs = max_jobs
+        self._jobs: "OrderedDict[str, BatchGenerationJob]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def add(self, job: BatchGenerationJob) -> None:
+        """Register a job, dropping the oldest finished jobs past max_jobs.
+
+        Args:
+            job: Job to register
+        """
+        with self._lock:
+            self._jobs[job.job_id] = job
+            for job_id in list(self._jobs):
+                if len(self._jobs) <= self.max_jobs:
+                    break
+                if self._jobs[job_id].status != "running":
+                    del self._jobs[job_id]
+
+    def start(self, job: BatchGenerationJob, run: Coroutine[Any, Any, None]) -> None:
+        """Register a job and run it as a background task.
+
+        The job keeps a reference to the task, so it is not garbage collected
+        while running, and an error escaping the task is logged and recorded
+        on the job rather than lost.
+
+        Args:
+            job: Job to register
+            run: Coroutine doing the job's work
+        """
+        self.add(job)
+        job.task = asyncio.ensure_future(run)
+
+        def finished(task: asyncio.Future) -> None:
+            if task.cancelled():
+                error = "Job was cancelled"
+            elif task.exception() is not None:
+                error = f"Job crashed: {task.exception()!r}"
+                logger.error("Batch generation job %s crashed", job.job_id, exc_info=task.exception())
+            else:
+                return
+            job.status = "failed"
+            job.error = job.error or error
+            job.finished_at = job.finished_at or datetime.utcnow()
+
+        job.task.add_done_callback(finished)
+
+    def get(self, job_id: str) -> Optional[BatchGenerationJob]:
+        """Look up a job.
+
+        Args:
+            job_id: Job identifier
+
+        Returns:
+            Optional[BatchGenerationJob]: The job, or None if unknown
+        """
+        with self._lock:
+            return self._jobs.get(job_id)
+
+
+def _load_students(session_factory: Callable[[], Session], student_ids: List[int]) -> List[Student]:
+    """Load students with the profile fields the prompt needs, in a session of their own.
+
+    The session is closed before returning; the eagerly loaded fields stay
+    readable on the detached students.
+    """
+    with session_factory() as session:
+        statement = (
+            select(Student)
+            .where(Student.student_id.in_(student_ids))
+            .options(joinedload(Student.learning_context), selectinload(Student.interests_hobbies))
+        )
+        return session.exec(statement).unique().all()
+
+
+def store_homework(session_factory: Callable[[], Session], homework: PersonalizedHomework) -> int:
+    """Store one generated homework in a session of its own and return its ID.
+
+    This blocks on the database; call it through asyncio.to_thread from async code.
+
+    Args:
+        session_factory: Creates the database session used for the insert
+        homework: Homework to store
+
+    Returns:
+        int: ID of the stored row
+    """
+    with session_factory() as session:
+        session.add(homework)
+        # Flushing assigns the ID without reloading the row after the commit
+        session.flush()
+        homework_id = homework.homework_id
+        session.commit()
+    return homework_id
+
+
+async def generate_for_class(
+    job: BatchGenerationJob,
+    service: ContentGenerationService,
+    student_ids: List[int],
+    template: Dict[str, Any],
+    session_factory: Callable[[], Session],
+    fan_out: int = 8
+) -> None:
+    """Personalize a template for every student and store each result as it is ready.
+
+    Students are generated concurrently, at most fan_out at a time; the AI
+    gateway still applies its global limits on top. In 'skeleton' mode the
+    template's shared structure is generated once first, and each student
+    only gets the values of its personalized slots. Failed generations are
+    stored with generation_status 'failed' so they can be retried later.
+
+    The task uses only the IDs it is given: students are loaded and each
+    homework is committed in sessions of its own, in worker threads so the
+    event loop is never blocked. A student whose homework cannot be stored
+    is counted as failed with the reason in job.failures; the others are kept.
+
+    Args:
+        job: Job whose progress is updated; job.mode selects the generation mode
+        service: Content generation service
+        student_ids: IDs of the students to personalize for
+        template: Template part of the generation context
+        session_factory: Creates the database sessions used by the job
+        fan_out: Maximum concurrent generations
+    """
+    semaphore = asyncio.Semaphore(fan_out)
+    skeleton = None
+
+    async def personalize(student: Student) -> None:
+        async with semaphore:
+            report: Dict[str, Any] = {}
+            try:
+                if skeleton is not None:
+                    content = await service.generate_from_skeleton(student, skeleton, report=report)
+                else:
+                    content = service.parse_content(await service.generate(student, template, report=report))
+                status = "completed"
+            except Exception as e:
+                content = {"error": str(e)}
+                status = "failed"
+                job.failures[student.student_id] = str(e)
+            job.record_usage(report)
+        homework = PersonalizedHomework(
+            template_id=job.template_id,
+            student_id=student.student_id,
+            personalized_questions=content,
+            generation_status=status
+        )
+        try:
+            homework_id = await asyncio.to_thread(store_homework, session_factory, homework)
+        except Exception as e:
+            job.failed += 1
+            job.failures[student.student_id] = f"Could not store homework: {e}"
+            return
+        job.homework_ids.append(homework_id)
+        if status == "completed":
+            job.completed += 1
+        else:
+            job.failed += 1
+
+    try:
+        students = await asyncio.to_thread(_load_students, session_factory, student_ids)
+        if job.mode == "skeleton":
+            report: Dict[str, Any] = {}
+            skeleton = await service.generate_skeleton(template, report=report)
+            job.record_usage(report)
+        await asyncio.gather(*(personalize(student) for student in students))
+        job.status = "completed"
+    except Exception as e:
+        job.status = "failed"
+        job.error = str(e)
+    finally:
+        job.finished_at = datetime.utcnow()
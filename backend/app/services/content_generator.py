@@ -3,35 +3,474 @@
 This module handles the generation of personalized content based on student information.
 """
 
-from typing import Dict, Any
-import httpx
+from typing import AsyncIterator, Callable, Dict, Any, List, Optional, Tuple
+import json
+import re
 from sqlmodel import Session
 
 from app.db.models import Student
+from app.services.ai_gateway import AIGateway
+from app.services.ai_output import parse_json_object
+from app.services.model_cascade import AnswerCheck, ModelCascade
+from app.services.prompt_context import PromptContextBuilder, compact, to_json
+from app.services.response_cache import ResponseCache, check_cache_mode
+
+GENERATION_MODES = ("full", "skeleton")
+
+# Personalization slot placeholder in skeleton text, e.g. {{work_task}}
+_SLOT = re.compile(r"\{\{\s*(\w+)\s*\}\}")
+
+def check_generation_mode(mode: str) -> str:
+    """Validate a class-wide generation mode.
+    
+    Args:
+        mode: Generation mode
+        
+    Returns:
+        str: The mode, unchanged
+        
+    Raises:
+        ValueError: If the mode is not one of GENERATION_MODES
+    """
+    if mode not in GENERATION_MODES:
+        raise ValueError(f"Unknown generation mode: {mode}; expected one of {', '.join(GENERATION_MODES)}")
+    return mode
+
+def fill_skeleton(skeleton: Dict[str, Any], values: Dict[str, Any]) -> Dict[str, Any]:
+    """Merge a student's slot values into a template skeleton.
+    
+    Every {{slot}} placeholder is replaced by the student's value, or by the
+    slot's neutral default when the student has none or only whitespace. The slot definitions
+    themselves are left out of the result.
+    
+    Args:
+        skeleton: Skeleton returned by generate_skeleton
+        values: Slot values by slot name
+        
+    Returns:
+        Dict[str, Any]: Complete personalized content
+    """
+    slots = skeleton.get("slots") or {}
+    defaults = {
+        name: spec.get("default") if isinstance(spec, dict) else spec
+        for name, spec in slots.items()
+    }
+
+    def replace(match: re.Match) -> str:
+        name = match.group(1)
+        value = str(values.get(name) or "").strip()
+        return value or str(defaults.get(name) or name.replace("_", " "))
+
+    def fill(value: Any) -> Any:
+        if isinstance(value, str):
+            return _SLOT.sub(replace, value)
+        if isinstance(value, dict):
+            return {k: fill(v) for k, v in value.items()}
+        if isinstance(value, list):
+            return [fill(v) for v in value]
+        return value
+
+    return fill({k: v for k, v in skeleton.items() if k != "slots"})
 
 class ContentGenerationService:
-    """Service for generating personalized content."""
+    """Service for generating personalized content.
+    
+    Attributes:
+        MODEL: AI model used for generation when no cascade is configured
+        PROMPT_VERSION: Version of the generation prompt; bump it whenever the
+            messages sent to the model change so cached content is not reused
+        CONTEXT_TRIM_ORDER: Context fields trimmed to fit the token budget,
+            least relevant first
+        SYSTEM_PROMPT: System message sent with every generation request
+        SKELETON_PROMPT_VERSION: Version of the skeleton and slot-filling prompts
+    """
+
+    MODEL = "gpt-4-turbo-preview"
+    PROMPT_VERSION = "2"
+    SKELETON_PROMPT_VERSION = "1"
+    CONTEXT_TRIM_ORDER = (
+        "student.learning_context.challenges",
+        "student.learning_context.style",
+        "student.interests",
+        "template.base_questions",
+        "student.learning_context.goals",
+        "template.objective",
+    )
+    SYSTEM_PROMPT = "You are an expert ESL teacher specializing in creating personalized content."
 
-    def __init__(self, ai_service_url: str, ai_service_key: str):
+    def __init__(self, gateway: AIGateway, cache: Optional[ResponseCache] = None,
+                 context_token_budget: int = 1500, cascade: Optional[ModelCascade] = None):
         """Initialize the service.
         
         Args:
-            ai_service_url: URL for the AI service
-            ai_service_key: API key for the AI service
+            gateway: Shared gateway for calls to the AI service
+            cache: Optional cache of generated content keyed by profile fingerprint
+            context_token_budget: Tokens the serialized student and template
+                context may use in the prompt
+            cascade: Models tried from cheapest to most capable, shared so its
+                statistics cover every generation; MODEL alone if omitted
+        """
+        self.gateway = gateway
+        self.cache = cache
+        self.cascade = cascade or ModelCascade((self.MODEL,))
+        self.context_builder = PromptContextBuilder(
+            self.MODEL, context_token_budget, self.CONTEXT_TRIM_ORDER
+        )
+
+    def fingerprint(self, context: Dict[str, Any]) -> str:
+        """Hash a generation context into a cache key.
+        
+        The context holds exactly the student fields and template the prompt is
+        built from, so two students or revisions with the same fingerprint
+        would send the AI service the same request.
+        
+        Args:
+            context: Context returned by build_context
+            
+        Returns:
+            str: Key derived from the context, models and prompt version
         """
-        self.ai_service_url = ai_service_url
-        self.ai_service_key = ai_service_key
-        self.headers = {"Authorization": f"Bearer {ai_service_key}"}
+        canonical = json.dumps(context, sort_keys=True, separators=(",", ":"), default=str)
+        return ResponseCache.make_key(
+            canonical, self.cascade.key, self.PROMPT_VERSION, str(self.context_builder.max_tokens)
+        )
 
-    async def generate(self, student: Student, template: Dict[str, Any]) -> Dict[str, Any]:
+    async def generate(self, student: Student, template: Dict[str, Any], cache_mode: str = "use",
+                       report: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Generate personalized content based on student information.
         
         Args:
             student: Student record
             template: Content template
+            cache_mode: 'use' returns stored content for an unchanged profile
+                and template, 'refresh' regenerates and replaces it, 'bypass'
+                regenerates without touching the cache
+            report: Optional dictionary updated with the prompt's token counts
+                (see prepare_request), the 'provider_usage' reported by the AI
+                service, whether the content was 'cached' and, for new
+                content, the 'cascade' report (answering model, escalations,
+                latency per model)
             
         Returns:
             Dict[str, Any]: Generated content
+            
+        Raises:
+            ValueError: If the cache mode is unknown or the most capable model
+                does not answer with a JSON object
+            AIServiceError: If the AI service call fails
+        """
+        check_cache_mode(cache_mode)
+        context = self.build_context(student, template)
+        request, usage = self.prepare_request(context)
+        if report is not None:
+            report.update(usage)
+        key = self.fingerprint(context) if self.cache is not None else None
+        return await self._complete(request, key, cache_mode, report)
+
+    async def generate_skeleton(self, template: Dict[str, Any], cache_mode: str = "use",
+                                report: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Generate the shared, student-independent structure of a template's content.
+        
+        The skeleton holds the instructions, structure and neutral questions
+        once per template (homework or activity). Questions that should be
+        personalized contain {{slot}} placeholders described under 'slots',
+        each with a neutral default. Students then only need their slot values
+        (see generate_from_skeleton).
+        
+        Args:
+            template: Content template
+            cache_mode: 'use', 'refresh' or 'bypass' the content cache, as for generate
+            report: Optional dictionary updated as for generate
+            
+        Returns:
+            Dict[str, Any]: Skeleton with its 'slots' definitions
+            
+        Raises:
+            ValueError: If the cache mode is unknown or the skeleton is not a JSON object
+            AIServiceError: If the AI service call fails
+        """
+        check_cache_mode(cache_mode)
+        context_json, context_tokens, trimmed = self.context_builder.build({"template": template})
+        request = self._chat_request(
+            "You are an expert ESL teacher designing reusable worksheet skeletons.",
+            "Create the shared part of a worksheet for this template that every student will get. "
+            "Return a JSON object with 'title', 'instructions', 'questions' (a list of objects with "
+            "number, prompt and answer_lines) and 'slots'. Where a question should be personalized, "
+            "write {{slot_name}} in it and define the slot in 'slots' as "
+            "{\"slot_name\": {\"description\": ..., \"default\": ...}}, where default is neutral "
+            f"text used when nothing is known about the student. Template: {context_json}",
+            report, context_tokens, trimmed
+        )
+        key = None
+        if self.cache is not None:
+            key = ResponseCache.make_key(
+                context_json, self.cascade.key, f"skeleton-{self.SKELETON_PROMPT_VERSION}"
+            )
+        check = self._content_check(
+            lambda skeleton: None if skeleton.get("questions") else "missing: questions"
+        )
+        return self.parse_content(await self._complete(request, key, cache_mode, report, check))
+
+    async def generate_from_skeleton(self, student: Student, skeleton: Dict[str, Any],
+                                     cache_mode: str = "use",
+                                     report: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Personalize a template skeleton for a student.
+        
+        Only the slot descriptions and the student's profile are sent, and the
+        AI service answers with short values for the slots, which are merged
+        into the skeleton locally with fill_skeleton.
+        
+        Args:
+            student: Student record
+            skeleton: Skeleton returned by generate_skeleton
+            cache_mode: 'use', 'refresh' or 'bypass' the content cache, as for generate
+            report: Optional dictionary updated as for generate
+            
+        Returns:
+            Dict[str, Any]: Complete personalized content
+            
+        Raises:
+            ValueError: If the cache mode is unknown or the answer is not a JSON object
+            AIServiceError: If the AI service call fails
+        """
+        check_cache_mode(cache_mode)
+        slots = {
+            name: spec.get("description") if isinstance(spec, dict) else spec
+            for name, spec in (skeleton.get("slots") or {}).items()
+        }
+        if not slots:
+            if report is not None:
+                report.update(context_tokens=0, prompt_tokens=0, trimmed_fields=[],
+                              cached=False, provider_usage={})
+            return fill_skeleton(skeleton, {})
+
+        context = self.build_context(student, {})
+        context_json, context_tokens, trimmed = self.context_builder.build(context)
+        slots_json = to_json(compact(slots))
+        request = self._chat_request(
+            "You are an expert ESL teacher personalizing worksheets.",
+            "Fill these personalization slots for the student with short texts. "
+            "Return a JSON object {\"slots\": {\"slot_name\": text}}. "
+            f"Slots: {slots_json} Student: {context_json}",
+            report, context_tokens, trimmed
+        )
+        key = None
+        if self.cache is not None:
+            key = ResponseCache.make_key(
+                context_json, slots_json, self.cascade.key, f"slots-{self.SKELETON_PROMPT_VERSION}"
+            )
+
+        def unfilled(answer: Dict[str, Any]) -> Optional[str]:
+            values = self._slot_values(answer)
+            empty = [name for name in slots if not str(values.get(name) or "").strip()]
+            return "missing: " + ", ".join(empty) if empty else None
+
+        answer = self.parse_content(
+            await self._complete(request, key, cache_mode, report, self._content_check(unfilled))
+        )
+        return fill_skeleton(skeleton, self._slot_values(answer))
+
+    @staticmethod
+    def _slot_values(answer: Dict[str, Any]) -> Dict[str, Any]:
+        """Slot values from a slot-filling answer, nested under 'slots' or not."""
+        return answer.get("slots") if isinstance(answer.get("slots"), dict) else answer
+
+    async def generate_stream(self, student: Student, template: Dict[str, Any],
+                              cache_mode: str = "use",
+                              report: Optional[Dict[str, Any]] = None) -> AsyncIterator[str]:
+        """Generate personalized content, yielding it as the AI service produces it.
+        
+        Cached content for an unchanged profile and template is yielded as a
+        single piece. Otherwise the completion is streamed from the cascade's
+        most capable model, since content already sent to the client cannot be
+        escalated, and once it ends the assembled text is validated and cached
+        like generate's result.
+        
+        Args:
+            student: Student record
+            template: Content template
+            cache_mode: 'use', 'refresh' or 'bypass' the content cache, as for generate
+            report: Optional dictionary updated as for generate, before the first piece
+            
+        Yields:
+            str: Pieces of the generated content, which concatenate to a JSON object
+            
+        Raises:
+            ValueError: If the cache mode is unknown or the content is not a JSON object
+            AIServiceError: If the AI service call fails
+        """
+        check_cache_mode(cache_mode)
+        context = self.build_context(student, template)
+        request, usage = self.prepare_request(context)
+        if report is not None:
+            report.update(usage, cached=False)
+
+        key = None
+        if self.cache is not None:
+            key = self.fingerprint(context)
+            if cache_mode == "use":
+                cached = self.cache.get(key)
+                if cached is not None:
+                    if report is not None:
+                        report["cached"] = True
+                    yield cached
+                    return
+            else:
+                self.cache.record_bypass()
+
+        pieces = []
+        async for delta in self.gateway.stream_chat_completion(request):
+            pieces.append(delta)
+            yield delta
+
+        generated_content = "".join(pieces)
+        self.parse_content(generated_content)
+        if key is not None and cache_mode != "bypass":
+            self.cache.put(key, generated_content)
+
+    async def _complete(self, request: Dict[str, Any], key: Optional[str], cache_mode: str,
+                        report: Optional[Dict[str, Any]], check: Optional[AnswerCheck] = None) -> str:
+        """Answer a request from the content cache or the AI service's model cascade.
+        
+        Args:
+            request: Request body for the AI service
+            key: Content cache key, or None when caching is disabled
+            cache_mode: 'use', 'refresh' or 'bypass' the content cache
+            report: Optional dictionary updated with 'cached', 'provider_usage'
+                (summed over the models tried) and the 'cascade' report
+            check: Cascade check of each answer; by default any non-empty JSON
+                object is accepted
+            
+        Returns:
+            str: Completion text
+            
+        Raises:
+            ValueError: If the most capable model does not answer with a JSON object
+        """
+        if report is not None:
+            report.update(cached=False, provider_usage={})
+        if key is not None:
+            if cache_mode == "use":
+                cached = self.cache.get(key)
+                if cached is not None:
+                    if report is not None:
+                        report["cached"] = True
+                    return cached
+            else:
+                self.cache.record_bypass()
+
+        # Call AI service to generate content
+        generated_content, cascade_report = await self.cascade.complete(
+            self.gateway, request, check or self._content_check()
+        )
+        if report is not None:
+            report.update(provider_usage=cascade_report["usage"], cascade=cascade_report)
+
+        if key is not None and cache_mode != "bypass":
+            self.cache.put(key, generated_content)
+
+        return generated_content
+
+    def _content_check(self, problem: Optional[Callable[[Dict[str, Any]], Optional[str]]] = None) -> AnswerCheck:
+        """Build the cascade check of generated content.
+        
+        Args:
+            problem: Tells why decoded content should be escalated, as
+                'reason: details', or None if it is acceptable
+            
+        Returns:
+            AnswerCheck: Check returning the completion text; empty objects
+                are escalated, as is content problem rejects
+        """
+
+        def check(response: Dict[str, Any]) -> Tuple[str, Optional[str]]:
+            generated_content = response["choices"][0]["message"]["content"]
+            content = self.parse_content(generated_content)
+            if not content:
+                return generated_content, "missing: empty content"
+            return generated_content, problem(content) if problem else None
+
+        return check
+
+    def _chat_request(self, system_prompt: str, user_prompt: str, report: Optional[Dict[str, Any]],
+                      context_tokens: int, trimmed: List[str]) -> Dict[str, Any]:
+        """Build a chat completion request, recording its token counts in report.
+        
+        Args:
+            system_prompt: System message
+            user_prompt: User message
+            report: Optional dictionary updated as by prepare_request
+            context_tokens: Tokens of the serialized context within user_prompt
+            trimmed: Context fields trimmed to fit the budget
+            
+        Returns:
+            Dict[str, Any]: Request body for the AI service
+        """
+        counter = self.context_builder.counter
+        if report is not None:
+            report.update(
+                context_tokens=context_tokens,
+                prompt_tokens=counter.count(system_prompt) + counter.count(user_prompt),
+                trimmed_fields=trimmed,
+                exact=counter.exact,
+            )
+        return {
+            "model": self.cascade.final_model,
+            "messages": [
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": user_prompt}
+            ],
+            "response_format": {"type": "json_object"}
+        }
+
+    @staticmethod
+    def parse_content(generated_content: str) -> Dict[str, Any]:
+        """Parse and validate generated content.
+        
+        Args:
+            generated_content: Completion text returned by the AI service
+            
+        Returns:
+            Dict[str, Any]: Decoded content
+            
+        Raises:
+            ValueError: If the content is not a JSON object, even after local repair
+        """
+        return parse_json_object(generated_content)
+
+    def prepare_request(self, context: Dict[str, Any]) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """Build the chat completion request for a generation context.
+        
+        The context is serialized as compact JSON without empty fields and
+        trimmed to the context token budget.
+        
+        Args:
+            context: Context returned by build_context
+            
+        Returns:
+            Tuple[Dict[str, Any], Dict[str, Any]]: Request body for the AI
+                service, and its token report: 'context_tokens',
+                'prompt_tokens' (all messages), 'trimmed_fields' and whether
+                the counts are 'exact' (tiktoken) or estimated
+        """
+        context_json, context_tokens, trimmed = self.context_builder.build(context)
+        usage: Dict[str, Any] = {}
+        request = self._chat_request(
+            self.SYSTEM_PROMPT,
+            f"Generate personalized content based on this context: {context_json}",
+            usage, context_tokens, trimmed
+        )
+        return request, usage
+
+    def build_context(self, student: Student, template: Dict[str, Any]) -> Dict[str, Any]:
+        """Build the generation context from a student and a template.
+        
+        Args:
+            student: Student record
+            template: Content template
+            
+        Returns:
+            Dict[str, Any]: Student fields and template sent to the AI service
         """
         # Prepare student context
         context = {
@@ -51,30 +490,4 @@ class ContentGenerationService:
             "template": template
         }
 
-        # Call AI service to generate content
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{self.ai_service_url}/chat/completions",
-                headers=self.headers,
-                json={
-                    "model": "gpt-4-turbo-preview",
-                    "messages": [
-                        {
-                            "role": "system",
-                            "content": "You are an expert ESL teacher specializing in creating personalized content."
-                        },
-                        {
-                            "role": "user",
-                            "content": f"Generate personalized content based on this context: {context}"
-                        }
-                    ],
-                    "response_format": {"type": "json_object"}
-                }
-            )
-            
-            if response.status_code != 200:
-                raise Exception("Failed to generate content with AI service")
-                
-            generated_content = response.json()["choices"][0]["message"]["content"]
-            
-            return generated_content
+        return context
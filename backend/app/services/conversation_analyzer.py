@@ -6,8 +6,16 @@ personal information, preferences, and various attributes from natural language
 """
 
 import spacy
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Iterable, Iterator, Optional, Set, Tuple
 import re
+import time
+from collections import deque
+from functools import partial
+
+from app.services.nlp_models import ParserPool, get_model
+from app.services.keyword_index import KeywordIndex
+from app.services.pattern_scanner import PatternScanner
+from app.services.doc_cache import DocCache
 
 class ConversationAnalyzer:
     """Service class for analyzing conversation transcripts using NLP.
@@ -17,23 +25,135 @@ class ConversationAnalyzer:
     like personal information, interests, and preferences through pattern matching
     and entity recognition.
     
+    The spaCy model is taken from the process-wide registry, so every analyzer
+    built with the same model name and exclusions shares one loaded model.
+    
+    Analyzers come in speed/accuracy tiers backed by the small, medium and
+    large English models. The tier can be fixed or picked per transcript
+    from a latency budget with resolve_tier().
+    
     Attributes:
-        nlp (spacy.Language): Loaded spaCy language model
-        patterns (Dict[str, str]): Regular expression patterns for extracting specific information
-        categories (Dict[str, List[str]]): Keywords associated with different information categories
+        tier (str): Speed/accuracy tier ('fast', 'balanced' or 'accurate')
+        model_name (str): Name of the spaCy model in use
+        exclude (Tuple[str, ...]): Pipeline components left out of the model
+        nlp (spacy.Language): Shared spaCy language model
+        doc_cache (Optional[DocCache]): On-disk cache of parsed documents, if enabled
+        long_text_threshold (int): Length above which transcripts are analyzed in chunks
+        chunk_chars (int): Maximum chunk size for long transcripts
+        chunk_processes (int): Worker processes used to parse chunks without a parser pool
+        parser_pool (Optional[ParserPool]): Persistent processes that parse the chunks
+            of long transcripts in parallel, if given
+        patterns (Dict[str, str]): Regular expression patterns for extracting specific information,
+            compiled once per class into a combined scanner; register_pattern()
+            extends them for one analyzer only
+        pattern_fields (Dict[str, str]): Result field filled by each pattern key
+        categories (Dict[str, List[str]]): Keywords associated with different information categories;
+            call build_keyword_index() after changing them
+        last_batch_stats (Dict[str, float]): Throughput of the most recent
+            analyze_transcriptions run (documents, seconds, docs_per_second)
+        pipeline_runs (int): Number of spaCy pipeline runs made by this analyzer,
+            counted in _run_pipeline, through which every parse goes; each
+            analyzed transcription costs exactly one (one per chunk for long
+            transcripts), or none when its parse is served from the document cache
     """
     
-    def __init__(self):
-        """Initialize the ConversationAnalyzer with spaCy model and patterns."""
-        # Load English language model
-        self.nlp = spacy.load("en_core_web_lg")
-        
-        # Define entity patterns for specific information
-        self.patterns = {
-            "age_range": r"\b(?:\d{1,2}(?:-\d{1,2})?)\s*(?:years? old|yo)\b",
-            "years_experience": r"\b(\d+)\s*years?\s*(?:of)?\s*experience\b",
-            "years_in_country": r"\b(\d+(?:\.\d+)?)\s*years?\s*(?:in|living in)\b",
-        }
+    # Pipeline components none of the extractors rely on. The attribute_ruler
+    # is kept by default because it sets the POS tags noun_chunks depends on.
+    DEFAULT_EXCLUDED_COMPONENTS = ("lemmatizer",)
+
+    # spaCy model behind each speed/accuracy tier
+    TIER_MODELS = {
+        "fast": "en_core_web_sm",
+        "balanced": "en_core_web_md",
+        "accurate": "en_core_web_lg",
+    }
+    DEFAULT_TIER = "accurate"
+    
+    # Rough single-core parse throughput per tier, in characters per second,
+    # used to route by latency budget; calibrate with analyzer_tiers_benchmark.py
+    TIER_CHARS_PER_SECOND = {
+        "fast": 60_000,
+        "balanced": 45_000,
+        "accurate": 35_000,
+    }
+
+    # Output keys of analyze_transcription, in order
+    RESULT_FIELDS = (
+        "name", "age_range", "native_language", "english_level", "job_title",
+        "years_of_experience", "years_in_current_country", "hometown", "current_city",
+        "hobbies", "sports", "interests", "learning_goals", "work_environment",
+    )
+
+    # Define entity patterns for specific information
+    patterns = {
+        "age_range": r"\b(?:\d{1,2}(?:-\d{1,2})?)\s*(?:years? old|yo)\b",
+        "years_experience": r"\b(\d+)\s*years?\s*(?:of)?\s*experience\b",
+        "years_in_country": r"\b(\d+(?:\.\d+)?)\s*years?\s*(?:in|living in)\b",
+    }
+    pattern_fields = {
+        "age_range": "age_range",
+        "years_experience": "years_of_experience",
+        "years_in_country": "years_in_current_country",
+    }
+    _pattern_scanner = PatternScanner(patterns)
+
+    # Indicator phrases and values used by the first-match extractors
+    LANGUAGE_INDICATORS = ["native language", "mother tongue", "first language"]
+    LEVELS = ["beginner", "intermediate", "advanced", "fluent"]
+    LEVEL_INDICATORS = ["level", "proficiency", "english"]
+    JOB_INDICATORS = ["work as", "job is", "position is", "profession is"]
+    LOCATION_INDICATORS = {
+        "hometown": ["from", "grew up in", "born in"],
+        "current_city": ["live in", "living in", "moved to", "currently in"],
+    }
+
+    def __init__(
+        self,
+        tier: str = DEFAULT_TIER,
+        model_name: Optional[str] = None,
+        exclude: Iterable[str] = DEFAULT_EXCLUDED_COMPONENTS,
+        doc_cache: Optional[DocCache] = None,
+        long_text_threshold: int = 20_000,
+        chunk_chars: int = 10_000,
+        chunk_processes: int = 1,
+        parser_pool: Optional[ParserPool] = None,
+    ):
+        """Initialize the ConversationAnalyzer with spaCy model and patterns.
+        
+        Args:
+            tier (str): Speed/accuracy tier, one of TIER_MODELS
+            model_name (Optional[str]): spaCy model to use instead of the tier's default
+            exclude (Iterable[str]): Pipeline components to turn off for faster parsing
+            doc_cache (Optional[DocCache]): Cache of parsed documents; re-analyzing a
+                cached transcript then skips the spaCy pipeline entirely
+            long_text_threshold (int): Transcripts longer than this many characters
+                are split into chunks, parsed in parallel by the parser pool or
+                if chunk_processes allows
+            chunk_chars (int): Maximum size of each chunk of a long transcript
+            chunk_processes (int): Worker processes for parsing chunks when there is
+                no parser pool; -1 uses all CPU cores but forks a new pool, each
+                process loading its own model copy, for every long transcript, so
+                keep it for offline batch runs
+            parser_pool (Optional[ParserPool]): Persistent parser processes shared
+                across analyzers and requests; the server's way to parse chunks
+                in parallel
+            
+        Raises:
+            ValueError: If the tier is unknown
+        """
+        if tier not in self.TIER_MODELS:
+            raise ValueError(f"Unknown analyzer tier: {tier}")
+        self.tier = tier
+        self.model_name = model_name or self.TIER_MODELS[tier]
+        
+        # Get the shared English language model, loading it on first use
+        self.exclude = tuple(exclude)
+        self.nlp = get_model(self.model_name, self.exclude)
+        self.doc_cache = doc_cache
+        self.long_text_threshold = long_text_threshold
+        self.chunk_chars = chunk_chars
+        self.chunk_processes = chunk_processes
+        self.parser_pool = parser_pool
         
         # Keywords for different categories
         self.categories = {
@@ -43,6 +163,94 @@ class ConversationAnalyzer:
             "learning_goals": ["goal", "want to", "improve", "better at", "learn"],
             "work_environment": ["office", "remote", "hybrid", "workplace", "work from home"],
         }
+        self.build_keyword_index()
+
+        # First-match extractors fed by the single sentence pass, in priority order
+        self._sentence_extractors = [
+            ("native_language", self._match_language),
+            ("english_level", self._match_english_level),
+            ("job_title", self._match_job_title),
+            ("hometown", partial(self._match_location, location_type="hometown")),
+            ("current_city", partial(self._match_location, location_type="current_city")),
+        ]
+
+        self.last_batch_stats: Dict[str, float] = {}
+        self.pipeline_runs = 0
+
+    @classmethod
+    def resolve_tier(
+        cls,
+        text_length: int,
+        tier: Optional[str] = None,
+        latency_budget_ms: Optional[float] = None,
+    ) -> str:
+        """Pick the tier to analyze a transcript with.
+        
+        An explicit tier wins. Otherwise, with a latency budget, the most accurate
+        tier whose estimated parse time fits the budget is chosen, falling back to
+        'fast' when none does. Without either, DEFAULT_TIER is used.
+        
+        Args:
+            text_length (int): Length of the transcript in characters
+            tier (Optional[str]): Explicitly requested tier
+            latency_budget_ms (Optional[float]): Maximum acceptable analysis time
+            
+        Returns:
+            str: Tier name
+            
+        Raises:
+            ValueError: If the requested tier is unknown
+        """
+        if tier is not None:
+            if tier not in cls.TIER_MODELS:
+                raise ValueError(f"Unknown analyzer tier: {tier}")
+            return tier
+        if latency_budget_ms is None:
+            return cls.DEFAULT_TIER
+        for candidate in ("accurate", "balanced", "fast"):
+            estimated_ms = text_length / cls.TIER_CHARS_PER_SECOND[candidate] * 1000
+            if estimated_ms <= latency_budget_ms:
+                return candidate
+        return "fast"
+
+    def register_pattern(self, key: str, pattern: str, field: Optional[str] = None) -> None:
+        """Add or replace a regex pattern on this analyzer and recompile its scanner.
+        
+        Other analyzers, including ones created later, keep the class patterns.
+        Fields of new patterns are appended to the analysis result after
+        RESULT_FIELDS.
+        
+        Args:
+            key (str): Pattern key
+            pattern (str): Regular expression, matched case-insensitively; use
+                scoped flags such as (?s:...) rather than global ones like (?s)
+            field (str): Result field to fill; defaults to the key
+            
+        Raises:
+            ValueError: If the pattern sets global inline flags
+            re.error: If the pattern is not a valid regex
+        """
+        # Compile first so a rejected pattern leaves the analyzer unchanged
+        self._pattern_scanner = self._pattern_scanner.with_pattern(key, pattern)
+        self.patterns = {**self.patterns, key: pattern}
+        self.pattern_fields = {**self.pattern_fields, key: field or key}
+
+    def build_keyword_index(self) -> None:
+        """Compile the category keywords and indicator lists into one keyword index.
+        
+        The index lets every sentence be matched against all keywords in a single
+        linear scan, so the keyword lists can grow without slowing analysis down.
+        """
+        groups = {
+            "language": self.LANGUAGE_INDICATORS,
+            "level": self.LEVELS,
+            "level_indicator": self.LEVEL_INDICATORS,
+            "job": self.JOB_INDICATORS,
+            **self.LOCATION_INDICATORS,
+        }
+        for category, keywords in self.categories.items():
+            groups[_category_group(category)] = keywords
+        self._keyword_index = KeywordIndex(groups)
 
     def analyze_transcription(self, transcription: str) -> Dict[str, Any]:
         """Analyze conversation transcription and extract relevant information.
@@ -54,33 +262,270 @@ class ConversationAnalyzer:
             Dict[str, Any]: Dictionary containing extracted information with keys
                 corresponding to student attributes and their extracted values
         """
-        doc = self.nlp(transcription)
-        
-        # Initialize the result dictionary
-        result = {
-            "name": self._extract_name(doc),
-            "age_range": self._extract_pattern(transcription, "age_range"),
-            "native_language": self._extract_language(doc),
-            "english_level": self._extract_english_level(doc),
-            "job_title": self._extract_job_title(doc),
-            "years_of_experience": self._extract_pattern(transcription, "years_experience"),
-            "years_in_current_country": self._extract_pattern(transcription, "years_in_country"),
-            "hometown": self._extract_location(doc, "hometown"),
-            "current_city": self._extract_location(doc, "current_city"),
-            "hobbies": self._extract_category(doc, "hobbies"),
-            "sports": self._extract_category(doc, "sports"),
-            "interests": self._extract_category(doc, "interests"),
-            "learning_goals": self._extract_category(doc, "learning_goals"),
-            "work_environment": self._extract_category(doc, "work_environment"),
-        }
+        if len(transcription) > self.long_text_threshold:
+            return self._analyze_chunked(transcription)
+        doc = self._parse(transcription)
+        return self._analyze_doc(doc, transcription)
+
+    def analyze_transcriptions(
+        self,
+        transcriptions: Iterable[str],
+        batch_size: int = 16,
+        n_process: int = -1,
+    ) -> Iterator[Dict[str, Any]]:
+        """Analyze many transcriptions in batches using spaCy's nlp.pipe.
+        
+        Results are yielded lazily and in the same order as the input. Once the
+        generator is exhausted, throughput is recorded in self.last_batch_stats.
+        
+        Args:
+            transcriptions (Iterable[str]): Transcriptions to analyze
+            batch_size (int): Number of texts buffered per batch
+            n_process (int): Number of worker processes; -1 uses all CPU cores
+            
+        Yields:
+            Dict[str, Any]: Extracted information for each transcription, in input order
+        """
+        documents = 0
+        start = time.perf_counter()
+        try:
+            for transcription, doc in self._parse_many(transcriptions, batch_size, n_process):
+                documents += 1
+                yield self._analyze_doc(doc, transcription)
+        finally:
+            elapsed = time.perf_counter() - start
+            self.last_batch_stats = {
+                "documents": documents,
+                "seconds": elapsed,
+                "docs_per_second": documents / elapsed if elapsed > 0 else 0.0,
+            }
+
+    def _analyze_chunked(self, transcription: str) -> Dict[str, Any]:
+        """Analyze a long transcription chunk by chunk, in parallel where possible.
+        
+        Chunks are cut at paragraph or sentence boundaries and their Docs are
+        consumed one at a time in input order, so only a handful of chunks are
+        held in memory regardless of the transcript's size. Merging in order
+        keeps the priority of first-match fields such as name and hometown.
+        
+        Args:
+            transcription (str): The text transcription of the conversation
+            
+        Returns:
+            Dict[str, Any]: Dictionary containing extracted information
+        """
+        # Regex patterns are cheap and may straddle chunk boundaries, so they
+        # always run over the full text
+        found = self._extract_patterns(transcription)
+        collected: Dict[str, List[str]] = {}
+        
+        chunks = split_text(transcription, self.chunk_chars)
+        parsed = self._parse_many(
+            chunks, batch_size=1, n_process=self.chunk_processes, pool=self.parser_pool
+        )
+        for _, doc in parsed:
+            if "name" not in found:
+                name = self._extract_name(doc)
+                if name is not None:
+                    found["name"] = name
+            self._scan_sentences(doc.sents, found, collected)
+        return self._build_result(found, collected)
+
+    def _parse_many(
+        self,
+        texts: Iterable[str],
+        batch_size: int,
+        n_process: int,
+        pool: Optional[ParserPool] = None,
+    ) -> Iterator[Tuple[str, spacy.tokens.Doc]]:
+        """Parse texts with nlp.pipe or a parser pool, serving cached parses where possible.
+        
+        Cache lookups happen as the pipeline pulls texts, so results stay in input
+        order: every text is queued with its cached Doc (or None) before a miss
+        is handed to the pipeline.
+        
+        Args:
+            texts (Iterable[str]): Texts to parse
+            batch_size (int): Number of texts buffered per batch
+            n_process (int): Number of worker processes; -1 uses all CPU cores
+            pool (Optional[ParserPool]): Persistent parser processes to use
+                instead of nlp.pipe
+            
+        Yields:
+            Tuple[str, spacy.tokens.Doc]: Each text with its parsed document, in input order
+        """
+        queued = deque()
+        
+        def uncached():
+            for text in texts:
+                doc = self.doc_cache.get(self.nlp, text) if self.doc_cache else None
+                queued.append((text, doc))
+                if doc is None:
+                    yield text
+        
+        def drain_hits():
+            while queued and queued[0][1] is not None:
+                yield queued.popleft()
+        
+        for doc in self._run_pipeline(uncached(), batch_size, n_process, pool):
+            yield from drain_hits()
+            text, _ = queued.popleft()
+            if self.doc_cache:
+                self.doc_cache.put(self.nlp, text, doc)
+            yield text, doc
+        yield from drain_hits()
+
+    def _run_pipeline(
+        self,
+        texts: Iterable[str],
+        batch_size: int = 1,
+        n_process: int = 1,
+        pool: Optional[ParserPool] = None,
+    ) -> Iterator[spacy.tokens.Doc]:
+        """Run the spaCy pipeline over texts, counting every run in pipeline_runs.
+        
+        This is the only place the analyzer runs its model; parse through it
+        (via _parse or _parse_many) so pipeline_runs stays exact.
+        
+        Args:
+            texts (Iterable[str]): Texts to parse
+            batch_size (int): Number of texts buffered per batch
+            n_process (int): Number of worker processes; -1 uses all CPU cores
+            pool (Optional[ParserPool]): Persistent parser processes to use
+                instead of nlp.pipe
+            
+        Yields:
+            spacy.tokens.Doc: Parsed document for each text, in input order
+        """
+        if pool is not None:
+            docs = pool.parse(self.nlp, self.model_name, self.exclude, texts)
+        else:
+            docs = self.nlp.pipe(texts, batch_size=batch_size, n_process=n_process)
+        for doc in docs:
+            self.pipeline_runs += 1
+            yield doc
+
+    def _parse(self, text: str, use_cache: bool = True) -> spacy.tokens.Doc:
+        """Parse a text, from the document cache when possible.
+        
+        Args:
+            text (str): Text to parse
+            use_cache (bool): Whether to read and populate the document cache
+            
+        Returns:
+            spacy.tokens.Doc: Parsed document
+        """
+        if use_cache and self.doc_cache:
+            doc = self.doc_cache.get(self.nlp, text)
+            if doc is not None:
+                return doc
+        doc = next(self._run_pipeline([text]))
+        if use_cache and self.doc_cache:
+            self.doc_cache.put(self.nlp, text, doc)
+        return doc
+
+    def _analyze_doc(self, doc: spacy.tokens.Doc, transcription: str) -> Dict[str, Any]:
+        """Extract student attributes from an already parsed transcription.
+        
+        Args:
+            doc (spacy.tokens.Doc): spaCy document for the transcription
+            transcription (str): The raw transcription text
+            
+        Returns:
+            Dict[str, Any]: Dictionary containing extracted information
+        """
+        found = self._extract_patterns(transcription)
+        name = self._extract_name(doc)
+        if name is not None:
+            found["name"] = name
+        collected: Dict[str, List[str]] = {}
         
-        return {k: v for k, v in result.items() if v is not None}
+        self._scan_sentences(doc.sents, found, collected)
+        return self._build_result(found, collected)
+
+    def _scan_sentences(
+        self,
+        sents: Iterable[spacy.tokens.Span],
+        found: Dict[str, Any],
+        collected: Dict[str, List[str]],
+    ) -> None:
+        """Run every sentence-level extractor in a single pass over the sentences.
+        
+        Each sentence is lowercased and matched against the keyword index once,
+        and the hits are handed to every extractor that still needs them.
+        First-match fields are skipped once they are in found; category hits are
+        appended to collected in sentence order. Entities and noun chunks are
+        bucketed per sentence up front, since Span.ents and Span.noun_chunks
+        rescan the whole document on every access.
+        
+        Args:
+            sents (Iterable[spacy.tokens.Span]): Sentences of one Doc, in document order
+            found (Dict[str, Any]): First-match field values, updated in place
+            collected (Dict[str, List[str]]): Noun chunks per category, updated in place
+        """
+        sents = list(sents)
+        if not sents:
+            return
+        doc = sents[0].doc
+        sent_ents = _group_by_sentence(sents, doc.ents)
+        sent_chunks = None
+        
+        for index, sent in enumerate(sents):
+            sent_lower = sent.text.lower()
+            hits = self._keyword_index.search(sent_lower)
+            if not hits:
+                continue
+            ents = sent_ents[index]
+            
+            for field, extractor in self._sentence_extractors:
+                if field not in found:
+                    value = extractor(sent, sent_lower, hits, ents)
+                    if value is not None:
+                        found[field] = value
+            
+            chunks = None
+            for category in self.categories:
+                group = _category_group(category)
+                if group in hits:
+                    # Noun chunks are computed once per Doc and matched once per sentence
+                    if chunks is None:
+                        if sent_chunks is None:
+                            sent_chunks = _group_by_sentence(sents, doc.noun_chunks)
+                        chunks = [
+                            (chunk.text, self._keyword_index.search(chunk.text.lower()))
+                            for chunk in sent_chunks[index]
+                        ]
+                    for chunk_text, chunk_hits in chunks:
+                        if group not in chunk_hits:
+                            collected.setdefault(category, []).append(chunk_text.strip())
+
+    def _build_result(self, found: Dict[str, Any], collected: Dict[str, List[str]]) -> Dict[str, Any]:
+        """Assemble the analysis result from the extracted values.
+        
+        Args:
+            found (Dict[str, Any]): First-match field values
+            collected (Dict[str, List[str]]): Noun chunks per category
+            
+        Returns:
+            Dict[str, Any]: Extracted information, omitting fields with no value
+        """
+        result = {}
+        extra_fields = [f for f in self.pattern_fields.values() if f not in self.RESULT_FIELDS]
+        for field in (*self.RESULT_FIELDS, *extra_fields):
+            if field in self.categories:
+                results = collected.get(field)
+                value = list(set(results)) if results else None
+            else:
+                value = found.get(field)
+            if value is not None:
+                result[field] = value
+        return result
 
     def _extract_name(self, doc: spacy.tokens.Doc) -> str:
         """Extract person name from the conversation.
         
         Args:
-            doc (spacy.tokens.Doc): spaCy document object
+            doc (spacy.tokens.Doc): spaCy document object, or a Span of one
             
         Returns:
             str: Extracted full name or None if not found
@@ -92,118 +537,347 @@ class ConversationAnalyzer:
                     return ent.text
         return None
 
-    def _extract_pattern(self, text: str, pattern_key: str) -> str:
-        """Extract information based on regex patterns.
+    def _extract_patterns(self, text: str, keys: Optional[Iterable[str]] = None) -> Dict[str, str]:
+        """Extract information for every regex pattern in one scan of the text.
         
         Args:
             text (str): Text to search in
-            pattern_key (str): Key for the pattern to use from self.patterns
+            keys (Optional[Iterable[str]]): Pattern keys to look for; defaults to all
             
         Returns:
-            str: Matched text or None if no match found
+            Dict[str, str]: Matched text by result field; fields without a match are omitted
         """
-        match = re.search(self.patterns[pattern_key], text, re.IGNORECASE)
-        if match:
-            return match.group(0)
-        return None
+        return {
+            self.pattern_fields[key]: value
+            for key, value in self._pattern_scanner.scan(text, keys).items()
+        }
 
-    def _extract_language(self, doc: spacy.tokens.Doc) -> str:
-        """Extract native language information from the conversation.
+    def _match_language(
+        self,
+        sent: spacy.tokens.Span,
+        sent_lower: str,
+        hits: Dict[str, Set[str]],
+        ents: List[spacy.tokens.Span],
+    ) -> str:
+        """Extract native language information from a sentence.
         
         Args:
-            doc (spacy.tokens.Doc): spaCy document object
+            sent (spacy.tokens.Span): Sentence to inspect
+            sent_lower (str): Lowercased sentence text
+            hits (Dict[str, Set[str]]): Keyword index hits for the sentence
+            ents (List[spacy.tokens.Span]): Named entities within the sentence
             
         Returns:
             str: Extracted language name or None if not found
         """
-        language_indicators = ["native language", "mother tongue", "first language"]
-        for sent in doc.sents:
-            for indicator in language_indicators:
-                if indicator in sent.text.lower():
-                    # Look for language names in the sentence
-                    for ent in sent.ents:
-                        if ent.label_ == "LANGUAGE":
-                            return ent.text
+        if "language" in hits:
+            # Look for language names in the sentence
+            for ent in ents:
+                if ent.label_ == "LANGUAGE":
+                    return ent.text
         return None
 
-    def _extract_english_level(self, doc: spacy.tokens.Doc) -> str:
-        """Extract English proficiency level from the conversation.
+    def _match_english_level(
+        self,
+        sent: spacy.tokens.Span,
+        sent_lower: str,
+        hits: Dict[str, Set[str]],
+        ents: List[spacy.tokens.Span],
+    ) -> str:
+        """Extract English proficiency level from a sentence.
         
         Args:
-            doc (spacy.tokens.Doc): spaCy document object
+            sent (spacy.tokens.Span): Sentence to inspect
+            sent_lower (str): Lowercased sentence text
+            hits (Dict[str, Set[str]]): Keyword index hits for the sentence
+            ents (List[spacy.tokens.Span]): Named entities within the sentence
             
         Returns:
             str: Extracted proficiency level or None if not found
         """
-        levels = ["beginner", "intermediate", "advanced", "fluent"]
-        level_indicators = ["level", "proficiency", "english"]
-        
-        for sent in doc.sents:
-            sent_lower = sent.text.lower()
-            if any(indicator in sent_lower for indicator in level_indicators):
-                for level in levels:
-                    if level in sent_lower:
-                        return level
+        if "level_indicator" in hits and "level" in hits:
+            for level in self.LEVELS:
+                if level in hits["level"]:
+                    return level
         return None
 
-    def _extract_job_title(self, doc: spacy.tokens.Doc) -> str:
-        """Extract job title information from the conversation.
+    def _match_job_title(
+        self,
+        sent: spacy.tokens.Span,
+        sent_lower: str,
+        hits: Dict[str, Set[str]],
+        ents: List[spacy.tokens.Span],
+    ) -> str:
+        """Extract job title information from a sentence.
         
         Args:
-            doc (spacy.tokens.Doc): spaCy document object
+            sent (spacy.tokens.Span): Sentence to inspect
+            sent_lower (str): Lowercased sentence text
+            hits (Dict[str, Set[str]]): Keyword index hits for the sentence
+            ents (List[spacy.tokens.Span]): Named entities within the sentence
             
         Returns:
             str: Extracted job title or None if not found
         """
-        job_indicators = ["work as", "job is", "position is", "profession is"]
-        for sent in doc.sents:
-            for indicator in job_indicators:
-                if indicator in sent.text.lower():
-                    # Look for the next noun chunk after the indicator
-                    start_idx = sent.text.lower().find(indicator) + len(indicator)
-                    remaining_text = sent.text[start_idx:].strip()
-                    remaining_doc = self.nlp(remaining_text)
-                    for chunk in remaining_doc.noun_chunks:
-                        return chunk.text
+        if "job" not in hits:
+            return None
+        for indicator in self.JOB_INDICATORS:
+            if indicator in hits["job"]:
+                # Look for the next noun chunk after the indicator, reusing the
+                # parse of the whole Doc instead of running the pipeline again
+                start_char = sent.start_char + sent_lower.find(indicator) + len(indicator)
+                remaining = sent.doc.char_span(start_char, sent.end_char, alignment_mode="contract")
+                if remaining is None:
+                    continue
+                for chunk in remaining.noun_chunks:
+                    return chunk.text
         return None
 
-    def _extract_location(self, doc: spacy.tokens.Doc, location_type: str) -> str:
-        """Extract location information based on type from the conversation.
+    def _match_location(
+        self,
+        sent: spacy.tokens.Span,
+        sent_lower: str,
+        hits: Dict[str, Set[str]],
+        ents: List[spacy.tokens.Span],
+        location_type: str,
+    ) -> str:
+        """Extract location information based on type from a sentence.
         
         Args:
-            doc (spacy.tokens.Doc): spaCy document object
+            sent (spacy.tokens.Span): Sentence to inspect
+            sent_lower (str): Lowercased sentence text
+            hits (Dict[str, Set[str]]): Keyword index hits for the sentence
+            ents (List[spacy.tokens.Span]): Named entities within the sentence
             location_type (str): Type of location to extract ('hometown' or 'current_city')
             
         Returns:
             str: Extracted location name or None if not found
         """
-        location_indicators = {
-            "hometown": ["from", "grew up in", "born in"],
-            "current_city": ["live in", "living in", "moved to", "currently in"]
-        }
-        
-        for sent in doc.sents:
-            if any(indicator in sent.text.lower() for indicator in location_indicators[location_type]):
-                for ent in sent.ents:
-                    if ent.label_ in ["GPE", "LOC"]:
-                        return ent.text
+        if location_type in hits:
+            for ent in ents:
+                if ent.label_ in ["GPE", "LOC"]:
+                    return ent.text
         return None
 
-    def _extract_category(self, doc: spacy.tokens.Doc, category: str) -> List[str]:
-        """Extract information for a specific category from the conversation.
+
+
+class IncrementalConversationAnalyzer:
+    """Stateful analyzer for transcripts that grow a few sentences at a time.
+    
+    Each appended chunk is parsed together with the text that is not yet
+    committed and a small window of already analyzed sentences for context.
+    Only sentences that are both new and complete are fed to the extractors.
+    The last sentence is held back because the next chunk may continue it.
+    Results are merged into a running profile with the same first-match
+    priority as a full analysis. The cost of each chunk therefore depends on
+    the chunk and the overlap window, not on how long the interview has run.
+    
+    Attributes:
+        analyzer (ConversationAnalyzer): Analyzer providing the model and extractors
+        overlap_sentences (int): Committed sentences re-parsed as context for the next chunk
+        max_pending_chars (int): Uncommitted text length that forces a commit, bounding
+            the cost when a speaker never finishes a sentence
+        chunks_processed (int): Number of chunks added since the last reset
+    """
+    
+    def __init__(
+        self,
+        analyzer: Optional[ConversationAnalyzer] = None,
+        overlap_sentences: int = 2,
+        max_pending_chars: int = 5000,
+    ):
+        """Initialize the incremental analyzer.
+        
+        Args:
+            analyzer (Optional[ConversationAnalyzer]): Analyzer to use; a default one is built if omitted
+            overlap_sentences (int): Committed sentences kept as parsing context
+            max_pending_chars (int): Uncommitted text length that forces a commit
+        """
+        self.analyzer = analyzer or ConversationAnalyzer()
+        self.overlap_sentences = overlap_sentences
+        self.max_pending_chars = max_pending_chars
+        self.reset()
+
+    def reset(self) -> None:
+        """Forget all text and extracted information."""
+        self._context = ""
+        self._pending = ""
+        self._found: Dict[str, Any] = {}
+        self._collected: Dict[str, List[str]] = {}
+        self.chunks_processed = 0
+
+    @property
+    def profile(self) -> Dict[str, Any]:
+        """Information extracted from the committed sentences so far."""
+        return self.analyzer._build_result(self._found, self._collected)
+
+    def add_text(self, chunk: str) -> Dict[str, Any]:
+        """Append a chunk of transcript and update the running profile.
         
         Args:
-            doc (spacy.tokens.Doc): spaCy document object
-            category (str): Category to extract (e.g., 'hobbies', 'sports')
+            chunk (str): Newly transcribed text, including any leading whitespace
             
         Returns:
-            List[str]: List of extracted items for the category or None if none found
-        """
-        results = []
-        for sent in doc.sents:
-            if any(keyword in sent.text.lower() for keyword in self.categories[category]):
-                # Extract noun chunks that follow category keywords
-                for chunk in sent.noun_chunks:
-                    if not any(keyword in chunk.text.lower() for keyword in self.categories[category]):
-                        results.append(chunk.text.strip())
-        return list(set(results)) if results else None 
\ No newline at end of file
+            Dict[str, Any]: The updated profile
+        """
+        self.chunks_processed += 1
+        text = self._pending + chunk
+        if len(text) > self.max_pending_chars:
+            # Commit everything up to the last whitespace so no word is split
+            cut = len(text.rstrip()) - len(text.rstrip().split()[-1]) if text.strip() else 0
+            if cut > 0:
+                self._process(text[:cut], final=True)
+                self._pending += text[cut:]
+                return self.profile
+        self._process(text, final=False)
+        return self.profile
+
+    def finish(self) -> Dict[str, Any]:
+        """Commit the held-back text at the end of the interview.
+        
+        Returns:
+            Dict[str, Any]: The final profile
+        """
+        if self._pending.strip():
+            self._process(self._pending, final=True)
+        self._pending = ""
+        return self.profile
+
+    def _process(self, text: str, final: bool) -> None:
+        """Parse the context window plus new text and commit complete sentences.
+        
+        Args:
+            text (str): Uncommitted text, including the newly appended chunk
+            final (bool): Commit every sentence, including the last one
+        """
+        window = self._context + text
+        offset = len(self._context)
+        # Windows never repeat, so caching them would only fill the cache
+        doc = self.analyzer._parse(window, use_cache=False)
+        sents = list(doc.sents)
+        
+        committed = sents if final else sents[:-1]
+        if not committed:
+            self._pending = text
+            return
+        
+        # Sentences that end inside the context window were analyzed already
+        new_sents = [sent for sent in committed if sent.end_char > offset]
+        boundary = sents[len(committed)].start_char if len(committed) < len(sents) else len(window)
+        
+        if new_sents:
+            new_span = doc[new_sents[0].start:new_sents[-1].end]
+            if "name" not in self._found:
+                name = self.analyzer._extract_name(new_span)
+                if name is not None:
+                    self._found["name"] = name
+            
+            missing = [
+                key for key, field in self.analyzer.pattern_fields.items()
+                if field not in self._found
+            ]
+            if missing:
+                # Include the context so matches crossing the old boundary are found
+                self._found.update(self.analyzer._extract_patterns(window[:boundary], missing))
+            
+            self.analyzer._scan_sentences(new_sents, self._found, self._collected)
+        
+        if self.overlap_sentences > 0:
+            context_start = committed[max(len(committed) - self.overlap_sentences, 0)].start_char
+        else:
+            context_start = boundary
+        self._context = window[context_start:boundary]
+        self._pending = window[boundary:]
+
+
+# Chunk boundaries for long transcripts, coarsest first
+_PARAGRAPH_BREAK = re.compile(r"(?<=\n)\s*\n")
+_SENTENCE_BREAK = re.compile(r"(?<=[.!?])\s+")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def split_text(text: str, max_chars: int) -> Iterator[str]:
+    """Split text into chunks of at most max_chars at natural boundaries.
+    
+    Paragraph breaks are preferred, then sentence-ending punctuation, then any
+    whitespace. A chunk only exceeds max_chars when a single word does. The
+    chunks concatenate back to the original text exactly.
+    
+    Args:
+        text (str): Text to split
+        max_chars (int): Maximum chunk length in characters
+        
+    Yields:
+        str: Consecutive chunks of the text
+    """
+    pieces = _split_pieces(text, max_chars, (_PARAGRAPH_BREAK, _SENTENCE_BREAK, _WHITESPACE))
+    chunk = ""
+    for piece in pieces:
+        if chunk and len(chunk) + len(piece) > max_chars:
+            yield chunk
+            chunk = ""
+        chunk += piece
+    if chunk:
+        yield chunk
+
+
+def _split_pieces(text: str, max_chars: int, separators: Tuple[re.Pattern, ...]) -> Iterator[str]:
+    """Cut text after each separator match, recursing with finer separators
+    into pieces that are still longer than max_chars.
+    
+    Args:
+        text (str): Text to split
+        max_chars (int): Maximum piece length in characters
+        separators (Tuple[re.Pattern, ...]): Separator patterns, coarsest first
+        
+    Yields:
+        str: Consecutive pieces of the text, each ending with its separator
+    """
+    if len(text) <= max_chars or not separators:
+        yield text
+        return
+    start = 0
+    for match in separators[0].finditer(text):
+        if match.end() > start:
+            yield from _split_pieces(text[start:match.end()], max_chars, separators[1:])
+            start = match.end()
+    if start < len(text):
+        yield from _split_pieces(text[start:], max_chars, separators[1:])
+
+def _category_group(category: str) -> str:
+    """Name of the keyword index group holding a category's keywords.
+    
+    Args:
+        category (str): Category name (e.g., 'hobbies')
+        
+    Returns:
+        str: Group name, prefixed so it cannot clash with indicator groups
+    """
+    return f"category:{category}"
+
+
+def _group_by_sentence(
+    sents: List[spacy.tokens.Span], spans: Iterable[spacy.tokens.Span]
+) -> List[List[spacy.tokens.Span]]:
+    """Bucket sorted, non-overlapping spans by the sentence that contains them.
+    
+    A span is assigned to a sentence only if it lies completely within it,
+    matching the semantics of Span.ents and Span.noun_chunks.
+    
+    Args:
+        sents (List[spacy.tokens.Span]): Sentences in document order
+        spans (Iterable[spacy.tokens.Span]): Spans of the same Doc in document order
+        
+    Returns:
+        List[List[spacy.tokens.Span]]: Spans per sentence, aligned with sents
+    """
+    spans = list(spans)
+    groups = [[] for _ in sents]
+    i = 0
+    for index, sent in enumerate(sents):
+        while i < len(spans) and spans[i].start < sent.start:
+            i += 1
+        while i < len(spans) and spans[i].end <= sent.end:
+            groups[index].append(spans[i])
+            i += 1
+    return groups
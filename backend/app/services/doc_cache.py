@@ -0,0 +1,165 @@
+"""Content-addressed on-disk cache of parsed spaCy documents.
+
+This module stores parsed Doc objects as DocBin files so that transcripts can be
+re-analyzed after the rule-based extractors change without running the neural
+pipeline again.
+"""
+
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Any, Optional
+
+import spacy
+from spacy.tokens import DocBin
+
+
+class DocCache:
+    """Size-bounded LRU cache of parsed documents stored as DocBin files.
+
+    Entries are keyed by a hash of the transcript text and of the model's name,
+    version and active pipeline, so a model upgrade or a different component
+    set never returns stale parses. The least recently used files are evicted
+    once the cache grows past max_bytes.
+
+    Attributes:
+        storage_path (Path): Directory holding the cached DocBin files
+        max_bytes (int): Maximum total size of the cache on disk
+        hits (int): Number of lookups served from the cache
+        misses (int): Number of lookups that required parsing
+        evictions (int): Number of entries removed to stay within max_bytes
+    """
+
+    def __init__(self, storage_path: str, max_bytes: int = 1024 ** 3):
+        """Initialize the cache, indexing any entries already on disk.
+
+        Args:
+            storage_path: Base storage path; entries go in its 'doc_cache' directory
+            max_bytes: Maximum total size of the cache on disk
+        """
+        self.storage_path = Path(storage_path) / "doc_cache"
+        self.storage_path.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+
+        # Entry paths ordered from least to most recently used, with their sizes
+        self._entries: "OrderedDict[Path, int]" = OrderedDict()
+        existing = sorted(self.storage_path.glob("*/*.spacy"), key=lambda p: p.stat().st_mtime)
+        for path in existing:
+            self._entries[path] = path.stat().st_size
+        self._size = sum(self._entries.values())
+        self._evict()
+
+    def key(self, nlp: spacy.Language, text: str) -> str:
+        """Compute the cache key for a text parsed by a model.
+
+        Args:
+            nlp: Language model the text is parsed with
+            text: Transcript text
+
+        Returns:
+            str: Hex digest identifying the text, model version and pipeline
+        """
+        model = f"{nlp.meta.get('lang')}_{nlp.meta.get('name')}"
+        digest = hashlib.sha256()
+        for part in (model, nlp.meta.get("version", ""), ",".join(nlp.pipe_names), text):
+            digest.update(part.encode("utf-8"))
+            digest.update(b"\0")
+        return digest.hexdigest()
+
+    def get(self, nlp: spacy.Language, text: str) -> Optional[spacy.tokens.Doc]:
+        """Look up the parsed document for a text.
+
+        Args:
+            nlp: Language model the text would be parsed with
+            text: Transcript text
+
+        Returns:
+            Optional[spacy.tokens.Doc]: Cached document, or None on a miss
+        """
+        path = self._path(self.key(nlp, text))
+        try:
+            data = path.read_bytes()
+        except FileNotFoundError:
+            with self._lock:
+                self.misses += 1
+            return None
+
+        with self._lock:
+            self.hits += 1
+            if path in self._entries:
+                self._entries.move_to_end(path)
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            pass
+        return next(DocBin().from_bytes(data).get_docs(nlp.vocab))
+
+    def put(self, nlp: spacy.Language, text: str, doc: spacy.tokens.Doc) -> None:
+        """Store a parsed document.
+
+        Args:
+            nlp: Language model the document was parsed with
+            text: Transcript text
+            doc: Parsed document
+        """
+        doc_bin = DocBin()
+        doc_bin.add(doc)
+        data = doc_bin.to_bytes()
+
+        path = self._path(self.key(nlp, text))
+        path.parent.mkdir(exist_ok=True)
+        # Write to a temporary file first so readers never see a partial entry
+        tmp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, path)
+
+        with self._lock:
+            self._size += len(data) - self._entries.pop(path, 0)
+            self._entries[path] = len(data)
+            self._evict()
+
+    def stats(self) -> Dict[str, Any]:
+        """Return hit/miss statistics and the current cache size.
+
+        Returns:
+            Dict[str, Any]: Cache statistics
+        """
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+            "entries": len(self._entries),
+            "size_bytes": self._size,
+            "max_bytes": self.max_bytes,
+        }
+
+    def clear(self) -> None:
+        """Remove every cached document."""
+        with self._lock:
+            for path in self._entries:
+                path.unlink(missing_ok=True)
+            self._entries.clear()
+            self._size = 0
+
+    def _path(self, key: str) -> Path:
+        """Return the file path for a cache key."""
+        return self.storage_path / key[:2] / f"{key}.spacy"
+
+    def _evict(self) -> None:
+        """Remove least recently used entries until the cache fits max_bytes.
+
+        Must be called with the lock held.
+        """
+        while self._size > self.max_bytes and self._entries:
+            path, size = self._entries.popitem(last=False)
+            path.unlink(missing_ok=True)
+            self._size -= size
+            self.evictions += 1
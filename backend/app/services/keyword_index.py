@@ -0,0 +1,111 @@
+"""Multi-pattern keyword index for the conversation analyzer.
+
+This module provides an Aho-Corasick automaton that finds every occurrence of a
+set of keywords in a single linear pass over the text. Keywords are organised in
+named groups (a category or an indicator list), so one scan answers which groups
+a sentence mentions, however many keywords each group holds.
+"""
+
+from typing import Dict, Iterable, List, Set
+
+
+class KeywordIndex:
+    """Aho-Corasick automaton over grouped keywords.
+
+    Matching is plain substring matching, the same as `keyword in text`, so
+    'play' also matches inside 'display'. Callers are expected to pass text in
+    the same case as the keywords.
+
+    Attributes:
+        _goto (List[Dict[str, int]]): Trie transitions per state
+        _fail (List[int]): Failure link per state
+        _output (List[List[str]]): Keywords ending at each state, including via failure links
+        _keyword_groups (Dict[str, Set[str]]): Groups each keyword belongs to
+    """
+
+    def __init__(self, groups: Dict[str, Iterable[str]]):
+        """Compile the automaton from grouped keywords.
+
+        Args:
+            groups (Dict[str, Iterable[str]]): Keywords per group name
+        """
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[List[str]] = [[]]
+        self._keyword_groups: Dict[str, Set[str]] = {}
+
+        for group, keywords in groups.items():
+            for keyword in keywords:
+                if not keyword:
+                    continue
+                self._keyword_groups.setdefault(keyword, set()).add(group)
+
+        for keyword in self._keyword_groups:
+            self._add(keyword)
+        self._link()
+
+    def _add(self, keyword: str) -> None:
+        """Insert a keyword into the trie.
+
+        Args:
+            keyword (str): Keyword to insert
+        """
+        state = 0
+        for char in keyword:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append([])
+                self._goto[state][char] = next_state
+            state = next_state
+        self._output[state].append(keyword)
+
+    def _link(self) -> None:
+        """Compute failure links breadth-first and merge their outputs."""
+        queue = list(self._goto[0].values())
+        for state in queue:
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                link = self._goto[fallback].get(char, 0)
+                self._fail[next_state] = link if link != next_state else 0
+                self._output[next_state] = self._output[next_state] + self._output[self._fail[next_state]]
+
+    def keywords_in(self, text: str) -> Set[str]:
+        """Find every keyword occurring in the text.
+
+        Args:
+            text (str): Text to scan
+
+        Returns:
+            Set[str]: Keywords found at least once
+        """
+        goto, fail, output = self._goto, self._fail, self._output
+        found: Set[str] = set()
+        state = 0
+        for char in text:
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if output[state]:
+                found.update(output[state])
+        return found
+
+    def search(self, text: str) -> Dict[str, Set[str]]:
+        """Find the keywords occurring in the text, grouped by group name.
+
+        Args:
+            text (str): Text to scan
+
+        Returns:
+            Dict[str, Set[str]]: Matched keywords per group; groups without hits are omitted
+        """
+        hits: Dict[str, Set[str]] = {}
+        for keyword in self.keywords_in(text):
+            for group in self._keyword_groups[keyword]:
+                hits.setdefault(group, set()).add(keyword)
+        return hits
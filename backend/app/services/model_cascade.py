@@ -0,0 +1,155 @@
+"""Cheap-first model cascade for AI service calls.
+
+This module sends a request to a list of AI models, cheapest and fastest
+first. The caller checks each answer, and the request is escalated to the next
+model only when the answer is rejected (it does not parse, fails schema
+validation or misses required fields). Per-model latency and the escalation
+rate are recorded so the cascade can be tuned.
+"""
+
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Optional, Sequence, Tuple
+
+from app.services.ai_gateway import AIGateway
+
+# Checks an AI service response: returns the decoded answer and why it should be
+# escalated as 'reason: details' (None if it is acceptable), or raises
+# ValueError if it is unusable
+AnswerCheck = Callable[[Dict[str, Any]], Tuple[Any, Optional[str]]]
+
+
+def _percentile(ordered: List[float], q: float) -> Optional[float]:
+    """Nearest-rank percentile of sorted values."""
+    if not ordered:
+        return None
+    rank = max(1, -(-len(ordered) * q // 100))
+    return ordered[int(rank) - 1]
+
+
+class ModelCascade:
+    """Sends requests to AI models from cheapest to most capable.
+
+    With a single model the cascade is a plain call that still records latency.
+
+    Attributes:
+        models (Tuple[str, ...]): Models in the order they are tried
+    """
+
+    def __init__(self, models: Sequence[str], latency_window: int = 1000):
+        """Initialize the cascade.
+
+        Args:
+            models: Models in the order they are tried, the most capable last
+            latency_window: Most recent calls per model kept for latency percentiles
+
+        Raises:
+            ValueError: If no model is given
+        """
+        if not models:
+            raise ValueError("A model cascade needs at least one model")
+        self.models = tuple(models)
+        self._requests = 0
+        self._escalated = 0
+        self._tiers = {
+            model: {"calls": 0, "accepted": 0, "escalated": 0, "rejected_reasons": {}}
+            for model in self.models
+        }
+        self._latencies: Dict[str, Deque[float]] = {
+            model: deque(maxlen=latency_window) for model in self.models
+        }
+
+    @property
+    def key(self) -> str:
+        """Identifies the cascade in cache keys, since answers depend on its models."""
+        return "+".join(self.models)
+
+    @property
+    def final_model(self) -> str:
+        """Most capable model, used where an answer cannot be checked before it is used."""
+        return self.models[-1]
+
+    async def complete(self, gateway: AIGateway, request: Dict[str, Any],
+                       check: AnswerCheck) -> Tuple[Any, Dict[str, Any]]:
+        """Send a chat completion request through the cascade.
+
+        Args:
+            gateway: Gateway for calls to the AI service
+            request: Request body; its 'model' is replaced by each tier's model
+            check: Checks each response, see AnswerCheck
+
+        Returns:
+            Tuple[Any, Dict[str, Any]]: The accepted answer (or the final
+                model's answer, even if rejected), and a report with the
+                answering 'model', the 'escalations' with their reasons, the
+                'latency_ms' per model tried and in total, and the 'usage'
+                summed over all calls
+
+        Raises:
+            ValueError: If the final model's answer is unusable
+            AIServiceError: If an AI service call fails
+        """
+        self._requests += 1
+        report: Dict[str, Any] = {"model": None, "escalations": [], "latency_ms": {}, "usage": {}}
+        start = time.perf_counter()
+        for tier, model in enumerate(self.models):
+            last = tier == len(self.models) - 1
+            stats = self._tiers[model]
+            stats["calls"] += 1
+            call_start = time.perf_counter()
+            response = await gateway.chat_completion({**request, "model": model})
+            elapsed_ms = (time.perf_counter() - call_start) * 1000
+            self._latencies[model].append(elapsed_ms)
+            report["latency_ms"][model] = elapsed_ms
+            for name, count in (response.get("usage") or {}).items():
+                if isinstance(count, (int, float)):
+                    report["usage"][name] = report["usage"].get(name, 0) + count
+
+            try:
+                answer, problem = check(response)
+            except ValueError as e:
+                if last:
+                    raise
+                answer, problem = None, f"unusable: {e}"
+            if problem is None or last:
+                stats["accepted"] += 1
+                report["model"] = model
+                break
+
+            stats["escalated"] += 1
+            reason = problem.split(":", 1)[0]
+            stats["rejected_reasons"][reason] = stats["rejected_reasons"].get(reason, 0) + 1
+            report["escalations"].append({"model": model, "reason": problem})
+
+        if report["escalations"]:
+            self._escalated += 1
+        report["latency_ms"]["total"] = (time.perf_counter() - start) * 1000
+        return answer, report
+
+    def stats(self) -> Dict[str, Any]:
+        """Return the escalation rate and per-model call counts and latency.
+
+        Returns:
+            Dict[str, Any]: Cascade statistics; latency percentiles cover the
+                most recent calls of each model
+        """
+        tiers = {}
+        for model, stats in self._tiers.items():
+            ordered = sorted(self._latencies[model])
+            tiers[model] = {
+                **stats,
+                "rejected_reasons": dict(stats["rejected_reasons"]),
+                "escalation_rate": stats["escalated"] / stats["calls"] if stats["calls"] else 0.0,
+                "latency_ms": {
+                    "p50": _percentile(ordered, 50),
+                    "p95": _percentile(ordered, 95),
+                    "mean": sum(ordered) / len(ordered) if ordered else None,
+                },
+            }
+        return {
+            "models": list(self.models),
+            "requests": self._requests,
+            "escalated": self._escalated,
+            "escalation_rate": self._escalated / self._requests if self._requests else 0.0,
+            "tiers": tiers,
+        }
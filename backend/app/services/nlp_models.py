@@ -0,0 +1,236 @@
+"""Process-wide registry of loaded spaCy models.
+
+Loading a large spaCy model takes seconds and several hundred MB of memory. This
+module loads each model once per process, on first use, and shares it between
+every caller that asks for the same model and component configuration. It also
+provides a persistent pool of parser processes, so long texts can be parsed in
+parallel without loading the model again for every text.
+"""
+
+import multiprocessing
+import sys
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Deque, Dict, Any, Iterable, Iterator, Optional, Tuple
+
+import spacy
+from spacy.tokens import Doc
+
+
+def _resident_memory_bytes() -> Optional[int]:
+    """Return the resident set size of the current process.
+
+    Returns:
+        Optional[int]: Resident memory in bytes (peak RSS where /proc is
+            unavailable), or None on platforms without the resource module
+    """
+    try:
+        # Unix only; Windows has no resource module
+        import resource
+    except ImportError:
+        return None
+    try:
+        with open("/proc/self/statm") as f:
+            resident_pages = int(f.read().split()[1])
+        return resident_pages * resource.getpagesize()
+    except (OSError, IndexError, ValueError):
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # ru_maxrss is reported in bytes on macOS and in kilobytes elsewhere
+        return peak if sys.platform == "darwin" else peak * 1024
+
+
+class ModelRegistry:
+    """Lazily loads spaCy models and shares them across the process.
+
+    Models are keyed by name and the set of excluded pipeline components, so
+    callers asking for the same configuration share one Language object.
+
+    Attributes:
+        _models (Dict[Tuple[str, Tuple[str, ...]], spacy.Language]): Loaded models
+        _stats (Dict[Tuple[str, Tuple[str, ...]], Dict[str, Any]]): Load statistics per model
+    """
+
+    def __init__(self):
+        """Initialize an empty registry."""
+        self._models: Dict[Tuple[str, Tuple[str, ...]], spacy.Language] = {}
+        self._stats: Dict[Tuple[str, Tuple[str, ...]], Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, model_name: str, exclude: Iterable[str] = ()) -> spacy.Language:
+        """Return the shared model, loading it on first use.
+
+        Args:
+            model_name (str): Name of the installed spaCy package (e.g. 'en_core_web_lg')
+            exclude (Iterable[str]): Pipeline components to leave out of the model
+
+        Returns:
+            spacy.Language: The loaded language model
+        """
+        key = (model_name, tuple(sorted(set(exclude))))
+        nlp = self._models.get(key)
+        if nlp is not None:
+            return nlp
+
+        with self._lock:
+            # Another thread may have finished loading while we waited
+            if key in self._models:
+                return self._models[key]
+
+            memory_before = _resident_memory_bytes()
+            start = time.perf_counter()
+            nlp = spacy.load(model_name, exclude=list(key[1]))
+            load_seconds = time.perf_counter() - start
+            memory_after = _resident_memory_bytes()
+
+            self._models[key] = nlp
+            self._stats[key] = {
+                "model": model_name,
+                "version": nlp.meta.get("version"),
+                "excluded": list(key[1]),
+                "pipeline": list(nlp.pipe_names),
+                "load_seconds": load_seconds,
+                "resident_memory_bytes": (
+                    max(memory_after - memory_before, 0)
+                    if memory_before is not None and memory_after is not None else None
+                ),
+            }
+            return nlp
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """Return load time and resident memory for every loaded model.
+
+        Returns:
+            Dict[str, Dict[str, Any]]: Statistics keyed by model name and
+                exclusions; resident memory is None where it cannot be measured
+        """
+        return {
+            f"{name}[-{','.join(excluded)}]" if excluded else name: dict(stats)
+            for (name, excluded), stats in self._stats.items()
+        }
+
+    def clear(self) -> None:
+        """Drop all loaded models so they are reloaded on next use."""
+        with self._lock:
+            self._models.clear()
+            self._stats.clear()
+
+
+# Shared registry for the whole process
+registry = ModelRegistry()
+
+
+def get_model(model_name: str, exclude: Iterable[str] = ()) -> spacy.Language:
+    """Get a shared spaCy model from the process-wide registry.
+
+    Args:
+        model_name (str): Name of the installed spaCy package
+        exclude (Iterable[str]): Pipeline components to leave out of the model
+
+    Returns:
+        spacy.Language: The loaded language model
+    """
+    return registry.get(model_name, exclude)
+
+
+def _parse_in_worker(model_name: str, exclude: Tuple[str, ...], text: str) -> bytes:
+    """Parse a text in a pool process with that process's copy of the model.
+
+    Args:
+        model_name (str): Name of the installed spaCy package
+        exclude (Tuple[str, ...]): Pipeline components left out of the model
+        text (str): Text to parse
+
+    Returns:
+        bytes: Serialized Doc
+    """
+    return get_model(model_name, exclude)(text).to_bytes()
+
+
+class ParserPool:
+    """Persistent pool of processes that parse texts with spaCy models.
+
+    The pool is created once, typically at application startup, and shared by
+    every analyzer. Each process loads a model through its own registry the
+    first time it parses with it and keeps it for its lifetime, unlike
+    nlp.pipe(n_process=...), which starts new processes (and loads new model
+    copies) on every call. Processes are spawned rather than forked, so they
+    do not inherit the threads and locks of the server.
+
+    Attributes:
+        processes (int): Number of parser processes
+    """
+
+    def __init__(self, processes: int):
+        """Initialize the pool; processes start when the first text is parsed.
+
+        Args:
+            processes (int): Number of parser processes
+
+        Raises:
+            ValueError: If processes is less than 1
+        """
+        if processes < 1:
+            raise ValueError("A parser pool needs at least one process")
+        self.processes = processes
+        self._lock = threading.Lock()
+        self._executor = self._create_executor()
+
+    def _create_executor(self) -> ProcessPoolExecutor:
+        """Create the underlying process pool."""
+        return ProcessPoolExecutor(
+            max_workers=self.processes, mp_context=multiprocessing.get_context("spawn")
+        )
+
+    def parse(
+        self, nlp: spacy.Language, model_name: str, exclude: Iterable[str], texts: Iterable[str]
+    ) -> Iterator[Doc]:
+        """Parse texts in the pool, yielding Docs in input order.
+
+        Texts are pulled lazily and at most two per process are in flight, so
+        only a handful of parsed documents are held in memory at a time.
+
+        Args:
+            nlp (spacy.Language): The caller's copy of the model; Docs are
+                rebuilt against its vocab
+            model_name (str): Name of the installed spaCy package
+            exclude (Iterable[str]): Pipeline components left out of the model
+            texts (Iterable[str]): Texts to parse
+
+        Yields:
+            Doc: Parsed document for each text, in input order
+
+        Raises:
+            BrokenProcessPool: If a parser process died; the pool is replaced
+                so later calls can succeed
+        """
+        exclude = tuple(sorted(set(exclude)))
+        pending: Deque[Future] = deque()
+        texts = iter(texts)
+        try:
+            while True:
+                while len(pending) < 2 * self.processes:
+                    text = next(texts, None)
+                    if text is None:
+                        break
+                    with self._lock:
+                        executor = self._executor
+                    pending.append(executor.submit(_parse_in_worker, model_name, exclude, text))
+                if not pending:
+                    return
+                yield Doc(nlp.vocab).from_bytes(pending.popleft().result())
+        except BrokenProcessPool:
+            with self._lock:
+                if self._executor is executor:
+                    self._executor = self._create_executor()
+            raise
+        finally:
+            for future in pending:
+                future.cancel()
+
+    def shutdown(self) -> None:
+        """Stop the parser processes once their current texts are parsed."""
+        with self._lock:
+            self._executor.shutdown()
@@ -0,0 +1,172 @@
+"""Combined regular expression scanner for the conversation analyzer.
+
+This module compiles a set of keyed regex patterns into one alternation, so a
+single scan of the text finds the first match of every pattern instead of
+searching the full text once per pattern.
+"""
+
+import re
+from typing import Dict, Iterable, List, Optional
+
+# Inline flags applying to the whole pattern, e.g. (?i); only valid at the
+# start of a regex, so not inside the combined alternation
+_GLOBAL_FLAGS = re.compile(r"\(\?[aiLmsux]+\)")
+
+
+def _strip_groups(pattern: str) -> Optional[str]:
+    """Rewrite every capturing group in a pattern as a non-capturing group.
+
+    Python's regex engine saves all group marks each time it tries an
+    alternative, so an alternation of many patterns with capturing groups
+    becomes quadratic in the number of patterns. The combined detector is
+    built from group-free copies of the patterns for that reason.
+
+    Args:
+        pattern (str): Regex pattern
+
+    Returns:
+        Optional[str]: Equivalent pattern without capturing groups, or None if
+            it uses backreferences or conditionals that depend on group numbers
+
+    Raises:
+        ValueError: If the pattern sets global inline flags such as (?i)
+    """
+    result: List[str] = []
+    i = 0
+    in_class = False
+    while i < len(pattern):
+        char = pattern[i]
+        if char == "\\":
+            escaped = pattern[i + 1:i + 2]
+            if not in_class and escaped.isdigit() and escaped != "0":
+                return None
+            result.append(pattern[i:i + 2])
+            i += 2
+            continue
+        if in_class:
+            if char == "]":
+                in_class = False
+        elif char == "[":
+            in_class = True
+            # A ']' directly after '[' or '[^' is a literal
+            j = i + 1
+            if pattern[j:j + 1] == "^":
+                j += 1
+            if pattern[j:j + 1] == "]":
+                j += 1
+            result.append(pattern[i:j])
+            i = j
+            continue
+        elif char == "(":
+            if _GLOBAL_FLAGS.match(pattern, i):
+                raise ValueError(
+                    f"Pattern {pattern!r} sets global inline flags; use a scoped group "
+                    "such as (?i:...) or the scanner's flags instead"
+                )
+            if pattern.startswith("(?P=", i) or pattern.startswith("(?(", i):
+                return None
+            if pattern.startswith("(?P<", i):
+                i = pattern.index(">", i) + 1
+                result.append("(?:")
+                continue
+            if not pattern.startswith("(?", i):
+                result.append("(?:")
+                i += 1
+                continue
+        result.append(char)
+        i += 1
+    return "".join(result)
+
+
+class PatternScanner:
+    """Finds the first match of many keyed patterns in one pass over the text.
+
+    The patterns are joined into one alternation (the detector) which scans the
+    text once, stopping only at positions where at least one pattern starts a
+    match. At each such position every pattern still missing is tried. The
+    result for a key is therefore exactly what re.search would return for that
+    pattern alone, even when matches of different patterns overlap.
+
+    Patterns using backreferences cannot be joined and are searched on their own.
+    Global inline flags such as (?i) are rejected, since they are only valid at
+    the start of a regex; scoped flags such as (?i:...) are fine.
+
+    Attributes:
+        patterns (Dict[str, str]): Source patterns by key
+        flags (int): Regex flags applied to every pattern
+    """
+
+    def __init__(self, patterns: Dict[str, str], flags: int = re.IGNORECASE):
+        """Compile the individual patterns and the combined detector.
+
+        Args:
+            patterns (Dict[str, str]): Regex patterns by key
+            flags (int): Regex flags applied to every pattern
+
+        Raises:
+            ValueError: If a pattern sets global inline flags
+            re.error: If a pattern is not a valid regex
+        """
+        self.patterns = dict(patterns)
+        self.flags = flags
+
+        alternatives = []
+        self._combined_keys = set()
+        for key, pattern in self.patterns.items():
+            stripped = _strip_groups(pattern)
+            if stripped is not None:
+                alternatives.append(f"(?:{stripped})")
+                self._combined_keys.add(key)
+        self._compiled = {key: re.compile(pattern, flags) for key, pattern in self.patterns.items()}
+        self._detector = re.compile("|".join(alternatives), flags) if alternatives else None
+
+    def scan(self, text: str, keys: Optional[Iterable[str]] = None) -> Dict[str, str]:
+        """Find the first match of each pattern in the text.
+
+        Args:
+            text (str): Text to search in
+            keys (Optional[Iterable[str]]): Pattern keys to look for; defaults to all
+
+        Returns:
+            Dict[str, str]: Matched text by key; keys without a match are omitted
+        """
+        wanted = set(self.patterns if keys is None else keys)
+        remaining = wanted & self._combined_keys
+        found: Dict[str, str] = {}
+
+        position = 0
+        while remaining:
+            hit = self._detector.search(text, position)
+            if hit is None:
+                break
+            position = hit.start()
+            # The detector only says some pattern starts here, so try every
+            # missing one in case several start at the same place
+            for key in list(remaining):
+                match = self._compiled[key].match(text, position)
+                if match:
+                    found[key] = match.group(0)
+                    remaining.discard(key)
+            position += 1
+
+        for key in wanted - self._combined_keys:
+            match = self._compiled[key].search(text)
+            if match:
+                found[key] = match.group(0)
+        return found
+
+    def with_pattern(self, key: str, pattern: str) -> "PatternScanner":
+        """Return a new scanner with an added or replaced pattern.
+
+        Args:
+            key (str): Pattern key
+            pattern (str): Regex pattern
+
+        Returns:
+            PatternScanner: Scanner compiled from the extended pattern set
+
+        Raises:
+            ValueError: If the pattern sets global inline flags
+            re.error: If the pattern is not a valid regex
+        """
+        return PatternScanner({**self.patterns, key: pattern}, self.flags)
@@ -0,0 +1,219 @@
+"""Compact, token-budgeted serialization of prompt contexts.
+
+This module turns the context dictionaries sent to the AI service into compact
+JSON, drops empty fields, counts tokens locally and trims the least relevant
+fields until the context fits a token budget. Token counts use tiktoken when it
+is installed and a characters-per-token estimate otherwise.
+"""
+
+import copy
+import json
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+try:
+    import tiktoken
+except ImportError:  # Optional; token counts fall back to an estimate
+    tiktoken = None
+
+# Characters per token assumed when tiktoken is not installed
+CHARS_PER_TOKEN = 4
+
+# Marker appended to truncated text
+ELLIPSIS = "..."
+
+
+@lru_cache()
+def _load_encoding(model: str) -> Optional[Any]:
+    """Load the tiktoken encoding for a model once per process.
+
+    Args:
+        model: AI model name
+
+    Returns:
+        Optional[Any]: The encoding, or None if tiktoken is unavailable
+    """
+    if tiktoken is None:
+        return None
+    try:
+        try:
+            return tiktoken.encoding_for_model(model)
+        except KeyError:
+            return tiktoken.get_encoding("cl100k_base")
+    except Exception:
+        # The encoding is downloaded on first use; estimate if that fails
+        return None
+
+
+class TokenCounter:
+    """Counts tokens the way the AI service's tokenizer would.
+
+    Attributes:
+        exact (bool): Whether counts come from tiktoken rather than an estimate
+    """
+
+    def __init__(self, model: str):
+        """Initialize the counter for a model.
+
+        Args:
+            model: AI model whose tokenizer is used; unknown models use cl100k_base
+        """
+        self._encoding = _load_encoding(model)
+        self.exact = self._encoding is not None
+
+    def count(self, text: str) -> int:
+        """Count the tokens in a text.
+
+        Args:
+            text: Text to count
+
+        Returns:
+            int: Number of tokens
+        """
+        if self._encoding is not None:
+            return len(self._encoding.encode(text))
+        return -(-len(text) // CHARS_PER_TOKEN)
+
+    def truncate(self, text: str, max_tokens: int) -> str:
+        """Cut a text down to at most max_tokens tokens, marking the cut.
+
+        Args:
+            text: Text to truncate
+            max_tokens: Maximum tokens of the result, including the marker
+
+        Returns:
+            str: The text, or its beginning followed by ELLIPSIS
+        """
+        if self.count(text) <= max_tokens:
+            return text
+        keep = max(0, max_tokens - self.count(ELLIPSIS))
+        if self._encoding is not None:
+            return self._encoding.decode(self._encoding.encode(text)[:keep]) + ELLIPSIS
+        return text[:keep * CHARS_PER_TOKEN] + ELLIPSIS
+
+
+def compact(value: Any) -> Any:
+    """Drop None, empty strings and empty containers, recursively.
+
+    Args:
+        value: JSON-like value
+
+    Returns:
+        Any: The value without empty fields; None if nothing is left
+    """
+    if isinstance(value, dict):
+        items = ((k, compact(v)) for k, v in value.items())
+        value = {k: v for k, v in items if v is not None}
+    elif isinstance(value, (list, tuple)):
+        value = [v for v in (compact(v) for v in value) if v is not None]
+    elif isinstance(value, str):
+        value = value.strip()
+    return None if value in ("", [], {}) else value
+
+
+def to_json(value: Any) -> str:
+    """Serialize a value as compact JSON.
+
+    Args:
+        value: JSON-like value
+
+    Returns:
+        str: JSON without insignificant whitespace or ASCII escaping
+    """
+    return json.dumps(value, separators=(",", ":"), ensure_ascii=False, default=str)
+
+
+class PromptContextBuilder:
+    """Serializes prompt contexts as compact JSON within a token budget.
+
+    Fields are trimmed in trim_order, least relevant first. Each field is first
+    shortened (text cut at a token boundary, trailing list items or dict keys
+    dropped) just enough to fit, and removed entirely if that is not enough.
+
+    Attributes:
+        counter (TokenCounter): Token counter for the target model
+        max_tokens (int): Token budget for the serialized context
+        trim_order (Tuple[str, ...]): Dotted field paths, least relevant first
+        min_field_tokens (int): Shortest a truncated text field is allowed to get
+    """
+
+    def __init__(self, model: str, max_tokens: int, trim_order: Iterable[str] = (),
+                 min_field_tokens: int = 8):
+        """Initialize the builder.
+
+        Args:
+            model: AI model the context is sent to
+            max_tokens: Token budget for the serialized context
+            trim_order: Dotted field paths that may be trimmed, least relevant first
+            min_field_tokens: Shortest a truncated text field is allowed to get
+        """
+        self.counter = TokenCounter(model)
+        self.max_tokens = max_tokens
+        self.trim_order = tuple(trim_order)
+        self.min_field_tokens = min_field_tokens
+
+    def build(self, context: Dict[str, Any]) -> Tuple[str, int, List[str]]:
+        """Serialize a context, trimming it to the token budget.
+
+        Args:
+            context: Context dictionary; it is not modified
+
+        Returns:
+            Tuple[str, int, List[str]]: Compact JSON, its token count, and the
+                paths of the fields that were truncated or removed. The count
+                can still exceed max_tokens if the fields outside trim_order
+                alone do not fit.
+        """
+        context = compact(copy.deepcopy(context)) or {}
+        text = to_json(context)
+        tokens = self.counter.count(text)
+        trimmed = []
+
+        for path in self.trim_order:
+            if tokens <= self.max_tokens:
+                break
+            *parents, name = path.split(".")
+            parent = context
+            for key in parents:
+                parent = parent.get(key) if isinstance(parent, dict) else None
+            if not isinstance(parent, dict) or name not in parent:
+                continue
+
+            over = tokens - self.max_tokens
+            shortened = self._shorten(parent[name], over)
+            if shortened is None:
+                del parent[name]
+            else:
+                parent[name] = shortened
+            trimmed.append(path)
+            # Removing a field can leave its parent empty
+            context = compact(context) or {}
+            text = to_json(context)
+            tokens = self.counter.count(text)
+
+        return text, tokens, trimmed
+
+    def _shorten(self, value: Any, over: int) -> Optional[Any]:
+        """Shorten a field by about over tokens.
+
+        Args:
+            value: Field value
+            over: Tokens the context is over budget
+
+        Returns:
+            Optional[Any]: Shortened value, or None if the field should be removed
+        """
+        if isinstance(value, str):
+            target = self.counter.count(value) - over
+            if target < self.min_field_tokens:
+                return None
+            return self.counter.truncate(value, target)
+        if isinstance(value, (list, dict)):
+            items = list(value.items()) if isinstance(value, dict) else list(value)
+            # Drop trailing items until enough tokens are freed
+            while items and over > 0:
+                over -= self.counter.count(to_json(items.pop()))
+            if not items:
+                return None
+            return dict(items) if isinstance(value, dict) else items
+        return None
@@ -0,0 +1,198 @@
+"""Two-tier cache for AI service responses.
+
+This module keeps recent responses in an in-memory LRU and persists them as
+JSON files under the storage path, so repeated requests for the same input are
+answered without calling the AI service, including after a restart.
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+CACHE_MODES = ("use", "refresh", "bypass")
+
+
+class ResponseCache:
+    """In-memory LRU backed by a file store with a time-to-live.
+
+    Lookups check memory first, then disk; disk hits are promoted to memory.
+    Entries older than ttl_seconds are treated as missing in both tiers and
+    their files are removed when found.
+
+    Attributes:
+        storage_path (Path): Directory holding the persisted entries
+        max_entries (int): Maximum number of entries kept in memory
+        ttl_seconds (float): Lifetime of an entry; 0 disables expiry
+        memory_hits (int): Lookups served from memory
+        disk_hits (int): Lookups served from disk
+        misses (int): Lookups that found no fresh entry
+        bypasses (int): Calls that skipped the cache lookup
+        writes (int): Entries stored
+    """
+
+    def __init__(self, storage_path: str, namespace: str, max_entries: int = 1024,
+                 ttl_seconds: float = 7 * 24 * 3600):
+        """Initialize the cache.
+
+        Args:
+            storage_path: Base storage path
+            namespace: Subdirectory of storage_path for this cache's files
+            max_entries: Maximum number of entries kept in memory
+            ttl_seconds: Lifetime of an entry; 0 disables expiry
+        """
+        self.storage_path = Path(storage_path) / namespace
+        self.storage_path.mkdir(parents=True, exist_ok=True)
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.bypasses = 0
+        self.writes = 0
+        self._lock = threading.Lock()
+        # Keys ordered from least to most recently used, with (created_at, value)
+        self._memory: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+
+    @staticmethod
+    def make_key(*parts: str) -> str:
+        """Hash the parts identifying a cached response into a key.
+
+        Args:
+            *parts: Strings that together identify the response
+
+        Returns:
+            str: Hex digest usable as a cache key
+        """
+        digest = hashlib.sha256()
+        for part in parts:
+            digest.update(part.encode("utf-8"))
+            digest.update(b"\0")
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[Any]:
+        """Look up a cached response.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Optional[Any]: Cached value, or None if missing or expired; memory
+                hits return the stored object itself, so it must not be mutated
+        """
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None and not self._expired(entry[0]):
+                self._memory.move_to_end(key)
+                self.memory_hits += 1
+                return entry[1]
+            self._memory.pop(key, None)
+
+        path = self._path(key)
+        try:
+            with open(path, encoding="utf-8") as f:
+                stored = json.load(f)
+        except (FileNotFoundError, ValueError):
+            stored = None
+
+        with self._lock:
+            if stored is None or self._expired(stored["created_at"]):
+                self.misses += 1
+                if stored is not None:
+                    path.unlink(missing_ok=True)
+                return None
+            self.disk_hits += 1
+            self._remember(key, stored["created_at"], stored["value"])
+        return stored["value"]
+
+    def put(self, key: str, value: Any) -> None:
+        """Store a response in both tiers.
+
+        Args:
+            key: Cache key
+            value: JSON-serializable response
+        """
+        created_at = time.time()
+        path = self._path(key)
+        path.parent.mkdir(exist_ok=True)
+        # Write to a temporary file first so readers never see a partial entry
+        tmp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"created_at": created_at, "value": value}, f)
+        os.replace(tmp_path, path)
+
+        with self._lock:
+            self.writes += 1
+            self._remember(key, created_at, value)
+
+    def record_bypass(self) -> None:
+        """Count a call that skipped the cache lookup."""
+        with self._lock:
+            self.bypasses += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """Return hit/miss statistics.
+
+        Returns:
+            Dict[str, Any]: Cache statistics
+        """
+        hits = self.memory_hits + self.disk_hits
+        lookups = hits + self.misses
+        return {
+            "memory_hits": self.memory_hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "hit_rate": hits / lookups if lookups else 0.0,
+            "bypasses": self.bypasses,
+            "writes": self.writes,
+            "memory_entries": len(self._memory),
+            "max_entries": self.max_entries,
+            "ttl_seconds": self.ttl_seconds,
+        }
+
+    def clear(self) -> None:
+        """Remove every cached response from both tiers."""
+        with self._lock:
+            self._memory.clear()
+            for path in self.storage_path.glob("*/*.json"):
+                path.unlink(missing_ok=True)
+
+    def _remember(self, key: str, created_at: float, value: Any) -> None:
+        """Add an entry to the memory tier, evicting the least recently used.
+
+        Must be called with the lock held.
+        """
+        self._memory[key] = (created_at, value)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    def _expired(self, created_at: float) -> bool:
+        """Return whether an entry created at the given time has expired."""
+        return bool(self.ttl_seconds) and time.time() - created_at > self.ttl_seconds
+
+    def _path(self, key: str) -> Path:
+        """Return the file path for a cache key."""
+        return self.storage_path / key[:2] / f"{key}.json"
+
+
+def check_cache_mode(cache_mode: str) -> str:
+    """Validate a cache mode.
+
+    Args:
+        cache_mode: 'use' reads and writes the cache, 'refresh' skips the
+            lookup but stores the new response, 'bypass' skips the cache entirely
+
+    Returns:
+        str: The cache mode
+
+    Raises:
+        ValueError: If the mode is not accepted
+    """
+    if cache_mode not in CACHE_MODES:
+        raise ValueError(f"Unknown cache mode '{cache_mode}'; expected one of {', '.join(CACHE_MODES)}")
+    return cache_mode
@@ -3,69 +3,744 @@
 This module handles the extraction of student information from interview transcriptions.
 """
 
-from typing import Dict, Any
-import httpx
+from typing import Callable, Dict, Any, Iterable, List, Optional, Tuple
+import asyncio
+import re
+import time
+import unicodedata
 from sqlmodel import Session
 
+from app.api.models.extraction import (
+    INTERESTS_SECTION, SECTION_MODELS, STUDENT_SECTION, describe_errors, is_missing_only,
+    section_value, validate_extraction, validate_field, validate_section
+)
 from app.db.models import (
     Student, BasicInformation, ProfessionalBackground, PersonalBackground,
     InterestHobby, LearningContext, CulturalElements, SocialAspects
 )
+from app.services.ai_gateway import AIGateway
+from app.services.ai_output import parse_json_object
+from app.services.conversation_analyzer import ConversationAnalyzer, split_text
+from app.services.model_cascade import AnswerCheck, ModelCascade
+from app.services.prompt_context import to_json
+from app.services.response_cache import ResponseCache, check_cache_mode
+
+_WHITESPACE = re.compile(r"\s+")
+_NUMBER = re.compile(r"\d+")
+
+EXTRACTION_MODES = ("llm", "hybrid", "chunked")
+
+# Fields of the save_student_info payload by section; "" holds the top-level
+# student fields. Fields are addressed as "section.field" elsewhere.
+EXTRACTION_FIELDS = {section: tuple(model.__fields__) for section, model in SECTION_MODELS.items()}
+
+# interests_hobbies is a list of {category, name, description, experience_years, frequency}
+INTEREST_FIELD = INTERESTS_SECTION
+
+# ConversationAnalyzer result keys that fill a payload field directly
+LOCAL_FIELD_MAP = {
+    "english_level": "proficiency_level",
+    "native_language": "basic_info.native_language",
+    "current_city": "basic_info.current_address",
+    "job_title": "professional_background.current_occupation",
+    "years_of_experience": "professional_background.years_of_experience",
+    "hometown": "personal_background.hometown",
+    "learning_goals": "learning_context.learning_goals",
+}
+
+# ConversationAnalyzer categories passed to the AI service as interest hints
+LOCAL_INTEREST_CATEGORIES = ("hobbies", "sports", "interests")
+
+def check_extraction_mode(mode: str) -> str:
+    """Validate an extraction mode.
+    
+    Args:
+        mode: Extraction mode
+        
+    Returns:
+        str: The mode, unchanged
+        
+    Raises:
+        ValueError: If the mode is not one of EXTRACTION_MODES
+    """
+    if mode not in EXTRACTION_MODES:
+        raise ValueError(f"Unknown extraction mode: {mode}; expected one of {', '.join(EXTRACTION_MODES)}")
+    return mode
+
+def extraction_paths() -> List[str]:
+    """List every payload field as a dotted path, in payload order.
+    
+    Returns:
+        List[str]: Field paths, with INTEREST_FIELD last
+    """
+    paths = [
+        f"{section}.{field}" if section else field
+        for section, fields in EXTRACTION_FIELDS.items()
+        for field in fields
+    ]
+    return paths + [INTEREST_FIELD]
+
+def map_local_analysis(analysis: Dict[str, Any]) -> Dict[str, Any]:
+    """Map a ConversationAnalyzer result onto payload field paths.
+    
+    Args:
+        analysis: Result of ConversationAnalyzer.analyze_transcription
+        
+    Returns:
+        Dict[str, Any]: Values by dotted field path, for the fields the analyzer filled
+    """
+    fields: Dict[str, Any] = {}
+    name = analysis.get("name")
+    if name:
+        first_name, _, last_name = name.partition(" ")
+        fields["first_name"] = first_name
+        fields["last_name"] = last_name
+    for key, path in LOCAL_FIELD_MAP.items():
+        value = analysis.get(key)
+        if not value:
+            continue
+        if isinstance(value, list):
+            value = "; ".join(sorted(value))
+        if path == "professional_background.years_of_experience":
+            # The analyzer returns the matched phrase, e.g. "10 years of experience"
+            number = _NUMBER.search(value)
+            if number is None:
+                continue
+            value = int(number.group())
+        fields[path] = value
+    return fields
+
+def _same_value(a: Any, b: Any) -> bool:
+    """Compare two extracted values, ignoring case and surrounding whitespace in text."""
+    if isinstance(a, str) and isinstance(b, str):
+        return a.strip().casefold() == b.strip().casefold()
+    return a == b
+
+def merge_partial_extractions(partials: List[Dict[str, Any]]) -> Tuple[Dict[str, Any], Dict[str, int], List[Dict[str, Any]]]:
+    """Merge the fields extracted from consecutive chunks of one transcript.
+    
+    Scalar fields keep the first non-empty value in chunk order; a different
+    value in a later chunk is reported as a conflict. interests_hobbies is the
+    union of every chunk's entries, matched by category and name, with missing
+    attributes of an entry filled in from later mentions.
+    
+    Args:
+        partials: Values by dotted field path, one dictionary per chunk in order
+        
+    Returns:
+        Tuple[Dict[str, Any], Dict[str, int], List[Dict[str, Any]]]: Merged
+            values by path, the index of the chunk each value came from, and
+            the conflicts found
+    """
+    merged: Dict[str, Any] = {}
+    sources: Dict[str, int] = {}
+    conflicts: List[Dict[str, Any]] = []
+    interests: Dict[Tuple[str, str], Dict[str, Any]] = {}
+
+    for index, fields in enumerate(partials):
+        for path, value in fields.items():
+            if value is None or value == "" or value == []:
+                continue
+            if path == INTEREST_FIELD:
+                for interest in value if isinstance(value, list) else []:
+                    if not isinstance(interest, dict) or not interest.get("name"):
+                        continue
+                    match = (str(interest.get("category", "")).strip().casefold(),
+                             str(interest["name"]).strip().casefold())
+                    entry = interests.setdefault(match, {})
+                    for attribute, attribute_value in interest.items():
+                        if entry.get(attribute) is None:
+                            entry[attribute] = attribute_value
+                sources.setdefault(path, index)
+            elif path not in merged:
+                merged[path] = value
+                sources[path] = index
+            elif not _same_value(merged[path], value):
+                conflicts.append({
+                    "field": path,
+                    "kept": merged[path],
+                    "kept_chunk": sources[path],
+                    "discarded": value,
+                    "discarded_chunk": index,
+                })
+
+    if interests:
+        merged[INTEREST_FIELD] = list(interests.values())
+    return merged, sources, conflicts
+
+def _lookup(data: Dict[str, Any], path: str) -> Any:
+    """Read a dotted field path from a nested answer, accepting flat dotted keys too."""
+    if path in data:
+        return data[path]
+    section, _, field = path.partition(".")
+    nested = data.get(section)
+    if field and isinstance(nested, dict):
+        return nested.get(field)
+    return None
+
+def _nest(fields: Dict[str, Any]) -> Dict[str, Any]:
+    """Turn values by dotted field path into the nested save_student_info payload."""
+    payload: Dict[str, Any] = {}
+    for path, value in fields.items():
+        section, _, field = path.partition(".")
+        if field:
+            payload.setdefault(section, {})[field] = value
+        else:
+            payload[path] = value
+    return payload
+
+def answer_problem(answer: Dict[str, Any], paths: List[str],
+                   required: Iterable[str] = ()) -> Optional[str]:
+    """Tell why an extraction answer should be escalated to a more capable model.
+    
+    Args:
+        answer: Decoded answer, nested or with flat dotted keys
+        paths: Dotted paths of the fields asked for
+        required: Paths that must have a value
+        
+    Returns:
+        Optional[str]: 'invalid: ...' if values fail schema validation,
+            'missing: ...' if required fields have no value, None if the
+            answer is acceptable
+    """
+    invalid, missing = [], []
+    for path in paths:
+        value = _lookup(answer, path)
+        if path == INTEREST_FIELD:
+            errors = validate_section(path, value)[1] if value is not None else []
+        else:
+            section, _, name = path.rpartition(".")
+            errors = validate_field(section, name, value)
+        if not is_missing_only(errors):
+            invalid.append(f"{path} ({describe_errors(errors)})")
+        elif errors and path in required:
+            missing.append(path)
+    if invalid:
+        return "invalid: " + "; ".join(invalid)
+    if missing:
+        return "missing: " + ", ".join(missing)
+    return None
+
+def normalize_transcription(transcription: str) -> str:
+    """Normalize a transcription so trivially different copies compare equal.
+    
+    Applies Unicode NFKC normalization (which also folds typographic variants
+    such as non-breaking spaces) and collapses runs of whitespace, so
+    re-pasted or re-wrapped transcripts map to the same cache entry.
+    
+    Args:
+        transcription: Interview transcription text
+        
+    Returns:
+        str: Normalized transcription
+    """
+    text = unicodedata.normalize("NFKC", transcription)
+    return _WHITESPACE.sub(" ", text).strip()
 
 class StudentExtractionService:
-    """Service for extracting student information from transcriptions."""
+    """Service for extracting student information from transcriptions.
+    
+    Attributes:
+        MODEL: AI model used for extraction when no cascade is configured
+        PROMPT_VERSION: Version of the extraction prompt; bump it whenever the
+            messages sent to the model change so cached results are not reused
+        HYBRID_PROMPT_VERSION: Version of the hybrid extraction prompt
+        CHUNKED_PROMPT_VERSION: Version of the per-chunk extraction prompt
+    """
 
-    def __init__(self, ai_service_url: str, ai_service_key: str):
+    MODEL = "gpt-4-turbo-preview"
+    PROMPT_VERSION = "2"
+    HYBRID_PROMPT_VERSION = "1"
+    CHUNKED_PROMPT_VERSION = "1"
+
+    def __init__(self, gateway: AIGateway, cache: Optional[ResponseCache] = None,
+                 get_analyzer: Optional[Callable[[], ConversationAnalyzer]] = None,
+                 chunk_chars: int = 12_000, cascade: Optional[ModelCascade] = None):
         """Initialize the service.
         
         Args:
-            ai_service_url: URL for the AI service
-            ai_service_key: API key for the AI service
+            gateway: Shared gateway for calls to the AI service
+            cache: Optional cache of extraction results
+            get_analyzer: Returns the ConversationAnalyzer used by hybrid
+                extraction; called on first use so the spaCy model is only
+                loaded when needed
+            chunk_chars: Maximum transcript characters per AI service call in
+                chunked extraction
+            cascade: Models tried from cheapest to most capable, shared so its
+                statistics cover every extraction; MODEL alone if omitted
         """
-        self.ai_service_url = ai_service_url
-        self.ai_service_key = ai_service_key
-        self.headers = {"Authorization": f"Bearer {ai_service_key}"}
+        self.gateway = gateway
+        self.cache = cache
+        self.get_analyzer = get_analyzer
+        self.chunk_chars = chunk_chars
+        self.cascade = cascade or ModelCascade((self.MODEL,))
 
-    async def process_transcription(self, transcription: str) -> Dict[str, Any]:
+    def cache_key(self, transcription: str) -> str:
+        """Compute the extraction cache key for a transcription.
+        
+        Args:
+            transcription: Interview transcription text
+            
+        Returns:
+            str: Key derived from the normalized text, models and prompt version
+        """
+        return ResponseCache.make_key(
+            normalize_transcription(transcription), self.cascade.key, self.PROMPT_VERSION
+        )
+
+    async def process_transcription(self, transcription: str, cache_mode: str = "use",
+                                    report: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Process a transcription to extract student information.
         
+        The cheapest model of the cascade answers first; the extraction is
+        escalated to the next model when it fails schema validation or misses
+        the student's name or proficiency level.
+        
         Args:
             transcription: Interview transcription text
+            cache_mode: 'use' returns a cached result when available, 'refresh'
+                calls the AI service and replaces the cached result, 'bypass'
+                calls the AI service without touching the cache
+            report: Optional dictionary updated with whether the result was
+                'cached' and, for a new extraction, the 'cascade' report
+                (answering model, escalations, latency per model, usage)
             
         Returns:
             Dict[str, Any]: Extracted student information
+            
+        Raises:
+            ValueError: If the cache mode is unknown or the AI service does not
+                answer with a JSON object, even after local repair
+            AIServiceError: If the AI service call fails
         """
+        check_cache_mode(cache_mode)
+        key = None
+        if self.cache is not None:
+            key = self.cache_key(transcription)
+            if cache_mode == "use":
+                cached = self.cache.get(key)
+                if cached is not None:
+                    if report is not None:
+                        report["cached"] = True
+                    return cached
+            else:
+                self.cache.record_bypass()
+
         # Call AI service to extract information
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{self.ai_service_url}/chat/completions",
-                headers=self.headers,
-                json={
-                    "model": "gpt-4-turbo-preview",
-                    "messages": [
-                        {
-                            "role": "system",
-                            "content": "You are an expert at extracting structured student information from interview transcripts."
-                        },
-                        {
-                            "role": "user",
-                            "content": f"Extract student information from this interview transcript: {transcription}"
-                        }
-                    ],
-                    "response_format": {"type": "json_object"}
-                }
+        extracted_data, cascade_report = await self.cascade.complete(
+            self.gateway, self._request(transcription),
+            self._checker(extraction_paths(), EXTRACTION_FIELDS[STUDENT_SECTION])
+        )
+        if report is not None:
+            report.update(cached=False, cascade=cascade_report)
+
+        if key is not None and cache_mode != "bypass":
+            self.cache.put(key, extracted_data)
+
+        return extracted_data
+
+    async def extract_hybrid(self, transcription: str, cache_mode: str = "use") -> Dict[str, Any]:
+        """Extract student information with the local analyzer first, then the AI service.
+        
+        The ConversationAnalyzer fills the fields it can recognize (name, level,
+        language, job, locations, experience, goals). The AI service is then
+        asked only for the remaining fields, with the interests the analyzer
+        found as hints, so its answer is much shorter. Fields the analyzer
+        filled are never overwritten. The AI service call goes through the
+        model cascade, escalating when the student's name or level is still
+        missing or a value fails schema validation.
+        
+        Args:
+            transcription: Interview transcription text
+            cache_mode: 'use', 'refresh' or 'bypass' the extraction cache, as
+                for process_transcription
+            
+        Returns:
+            Dict[str, Any]: 'extracted_info' (the save_student_info payload),
+                'field_sources' ('local', 'llm' or 'missing' per field path),
+                'usage' (tokens reported by the AI service), 'latency_ms' per
+                stage, the 'cascade' report of the AI service call (None if
+                the analyzer found every field) and whether the result was
+                'cached'
+            
+        Raises:
+            ValueError: If the cache mode is unknown, no analyzer is configured
+                or the AI service does not answer with a JSON object
+            AIServiceError: If the AI service call fails
+        """
+        check_cache_mode(cache_mode)
+        if self.get_analyzer is None:
+            raise ValueError("Hybrid extraction needs a ConversationAnalyzer")
+        analyzer = self.get_analyzer()
+
+        key = None
+        if self.cache is not None:
+            key = ResponseCache.make_key(
+                normalize_transcription(transcription), self.cascade.key,
+                f"hybrid-{self.HYBRID_PROMPT_VERSION}", analyzer.model_name
+            )
+            if cache_mode == "use":
+                cached = self.cache.get(key)
+                if cached is not None:
+                    return {**cached, "cached": True}
+            else:
+                self.cache.record_bypass()
+
+        start = time.perf_counter()
+        # spaCy parsing is CPU-bound; keep it off the event loop
+        analysis = await asyncio.get_running_loop().run_in_executor(
+            None, analyzer.analyze_transcription, transcription
+        )
+        local_ms = (time.perf_counter() - start) * 1000
+
+        fields = map_local_analysis(analysis)
+        sources = {path: "local" for path in fields}
+        missing = [path for path in extraction_paths() if path not in fields]
+        hints = sorted({
+            value for category in LOCAL_INTEREST_CATEGORIES for value in analysis.get(category) or []
+        })
+
+        usage: Dict[str, Any] = {}
+        cascade_report = None
+        llm_ms = 0.0
+        if missing:
+            start = time.perf_counter()
+            required = [path for path in missing if path in EXTRACTION_FIELDS[STUDENT_SECTION]]
+            answer, cascade_report = await self.cascade.complete(
+                self.gateway, self._fields_request(transcription, missing, hints),
+                self._checker(missing, required)
+            )
+            llm_ms = (time.perf_counter() - start) * 1000
+            usage = cascade_report["usage"]
+            for path in missing:
+                value = _lookup(answer, path)
+                if value is None:
+                    sources[path] = "missing"
+                else:
+                    fields[path] = value
+                    sources[path] = "llm"
+
+        result = {
+            "extracted_info": _nest(fields),
+            "field_sources": sources,
+            "usage": usage,
+            "latency_ms": {"local": local_ms, "llm": llm_ms, "total": local_ms + llm_ms},
+            "cascade": cascade_report,
+            "cached": False,
+        }
+        if key is not None and cache_mode != "bypass":
+            self.cache.put(key, result)
+            # The cache keeps this object; callers get their own copy
+            return {**result}
+        return result
+
+    def _request(self, transcription: str) -> Dict[str, Any]:
+        """Build the chat completion request for a full extraction.
+        
+        Every payload field is named so that answers can be validated against
+        the extraction models.
+        
+        Args:
+            transcription: Interview transcription text
+            
+        Returns:
+            Dict[str, Any]: Request body for the AI service
+        """
+        return self._fields_request(transcription, extraction_paths())
+
+    def _checker(self, paths: List[str], required: Iterable[str] = ()) -> AnswerCheck:
+        """Build the cascade check of an answer asking for some fields.
+        
+        Args:
+            paths: Dotted paths of the fields asked for
+            required: Paths whose absence escalates the answer
+            
+        Returns:
+            AnswerCheck: Decodes the answer and tells why it should be escalated
+        """
+        required = set(required)
+
+        def check(response: Dict[str, Any]) -> Tuple[Dict[str, Any], Optional[str]]:
+            answer = self._answer(response)
+            return answer, answer_problem(answer, paths, required)
+
+        return check
+
+    @staticmethod
+    def _answer(response: Dict[str, Any]) -> Dict[str, Any]:
+        """Decode the JSON object of a chat completion, repairing it if needed.
+        
+        Args:
+            response: Chat completion response
+            
+        Returns:
+            Dict[str, Any]: Decoded answer
+            
+        Raises:
+            ValueError: If the answer is not a JSON object, even after repair
+        """
+        return parse_json_object(response["choices"][0]["message"]["content"])
+
+    async def extract_chunked(self, transcription: str, cache_mode: str = "use") -> Dict[str, Any]:
+        """Extract student information from a long transcript in concurrent chunks.
+        
+        The transcript is split at paragraph and sentence boundaries into
+        chunks of at most chunk_chars, every chunk is extracted by its own AI
+        service call (all running concurrently, within the gateway's limits),
+        and the partial results are merged with merge_partial_extractions.
+        Latency then follows the slowest chunk rather than the full length.
+        Each chunk goes through the model cascade on its own; since a chunk may
+        not mention the student's name, only invalid values escalate it.
+        
+        Args:
+            transcription: Interview transcription text
+            cache_mode: 'use', 'refresh' or 'bypass' the extraction cache, as
+                for process_transcription
+            
+        Returns:
+            Dict[str, Any]: 'extracted_info' (the save_student_info payload),
+                'field_sources' ('chunk:<index>' or 'missing' per field path),
+                'conflicts' between chunks, the number of 'chunks', the summed
+                'usage', 'latency_ms' per chunk and overall, the 'cascade'
+                report of each chunk and whether the result was 'cached'
+            
+        Raises:
+            ValueError: If the cache mode is unknown or the AI service does not
+                answer with a JSON object
+            AIServiceError: If an AI service call fails
+        """
+        check_cache_mode(cache_mode)
+        key = None
+        if self.cache is not None:
+            key = ResponseCache.make_key(
+                normalize_transcription(transcription), self.cascade.key,
+                f"chunked-{self.CHUNKED_PROMPT_VERSION}", str(self.chunk_chars)
+            )
+            if cache_mode == "use":
+                cached = self.cache.get(key)
+                if cached is not None:
+                    return {**cached, "cached": True}
+            else:
+                self.cache.record_bypass()
+
+        chunks = list(split_text(transcription, self.chunk_chars))
+        paths = extraction_paths()
+
+        async def extract_chunk(index: int, chunk: str) -> Tuple[Dict[str, Any], Dict[str, Any], float]:
+            start = time.perf_counter()
+            answer, cascade_report = await self.cascade.complete(
+                self.gateway, self._fields_request(chunk, paths, part=(index + 1, len(chunks))),
+                self._checker(paths)
             )
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            return {path: _lookup(answer, path) for path in paths}, cascade_report, elapsed_ms
+
+        start = time.perf_counter()
+        results = await asyncio.gather(*(extract_chunk(i, chunk) for i, chunk in enumerate(chunks)))
+        total_ms = (time.perf_counter() - start) * 1000
+
+        merged, sources, conflicts = merge_partial_extractions([fields for fields, _, _ in results])
+        usage: Dict[str, Any] = {}
+        for _, cascade_report, _ in results:
+            for name, count in cascade_report["usage"].items():
+                if isinstance(count, (int, float)):
+                    usage[name] = usage.get(name, 0) + count
+        chunk_ms = [elapsed_ms for _, _, elapsed_ms in results]
+
+        result = {
+            "extracted_info": _nest(merged),
+            "field_sources": {
+                path: f"chunk:{sources[path]}" if path in sources else "missing" for path in paths
+            },
+            "conflicts": conflicts,
+            "chunks": len(chunks),
+            "usage": usage,
+            "latency_ms": {"chunks": chunk_ms, "slowest_chunk": max(chunk_ms, default=0.0), "total": total_ms},
+            "cascade": [cascade_report for _, cascade_report, _ in results],
+            "cached": False,
+        }
+        if key is not None and cache_mode != "bypass":
+            self.cache.put(key, result)
+            # The cache keeps this object; callers get their own copy
+            return {**result}
+        return result
+
+    def _fields_request(self, transcription: str, fields: List[str], hints: List[str] = (),
+                        part: Optional[Tuple[int, int]] = None) -> Dict[str, Any]:
+        """Build the chat completion request asking for specific fields.
+        
+        Args:
+            transcription: Interview transcription text, or one chunk of it
+            fields: Dotted paths of the fields to extract
+            hints: Interests and hobbies already found in the transcript
+            part: Chunk number and chunk count when extracting from a chunk
+            
+        Returns:
+            Dict[str, Any]: Request body for the AI service
+        """
+        instructions = [
+            "Return a JSON object with only these fields, nesting 'section.field' names "
+            "as objects and using null when the transcript does not say: " + ", ".join(fields) + "."
+        ]
+        if part is not None:
+            instructions.insert(0, f"This is part {part[0]} of {part[1]} of an interview transcript.")
+        if INTEREST_FIELD in fields:
+            instructions.append(
+                f"{INTEREST_FIELD} is a list of objects with category, name, description, "
+                "experience_years and frequency."
+            )
+            if hints:
+                instructions.append("Interests mentioned: " + ", ".join(hints) + ".")
+        return {
+            "model": self.cascade.final_model,
+            "messages": [
+                {
+                    "role": "system",
+                    "content": "You extract student information from interview transcripts."
+                },
+                {
+                    "role": "user",
+                    "content": " ".join(instructions) + f"\n\nTranscript: {transcription}"
+                }
+            ],
+            "response_format": {"type": "json_object"}
+        }
+
+    async def validate_and_repair(self, transcription: str,
+                                  extracted_data: Dict[str, Any]) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """Validate extracted information, re-requesting only the invalid sections.
+        
+        Every section is validated against its model in
+        app.api.models.extraction. Sections with malformed values are asked for
+        again, one call to the cascade's most capable model per section, all
+        concurrently, with the previous value and the validation errors; the
+        rest of the extraction is kept as is. Fields without a value are fine,
+        except the top-level student fields, which are asked for again when
+        missing. A section still invalid after the second answer keeps the
+        valid fields of both answers; interests lacking only a category or
+        name are dropped without asking again.
+        
+        Args:
+            transcription: Interview transcription text
+            extracted_data: save_student_info payload returned by an extraction
             
-            if response.status_code != 200:
-                raise Exception("Failed to process transcription with AI service")
-                
-            extracted_data = response.json()["choices"][0]["message"]["content"]
+        Returns:
+            Tuple[Dict[str, Any], Dict[str, Any]]: Payload of valid sections
+                ready for save_student_info, and a report listing the
+                'reprompted' sections, the errors of the values 'dropped' from
+                each section, and the 'usage' of the repair calls. Sections are named by
+                their payload key, 'student' for the top-level fields.
             
-            return extracted_data
+        Raises:
+            ValueError: If the top-level student fields are still invalid
+            AIServiceError: If an AI service call fails
+        """
+        valid, errors = validate_extraction(extracted_data)
+        retry = [
+            section for section, section_errors in errors.items()
+            # The student fields are required, so they are always asked for again
+            if section == STUDENT_SECTION or not is_missing_only(section_errors)
+        ]
+
+        async def repair(section: str) -> Tuple[Optional[Any], List[Dict[str, Any]], Dict[str, Any]]:
+            value, section_errors = section_value(extracted_data, section), errors[section]
+            if section == INTERESTS_SECTION and isinstance(value, list):
+                # Ask again only for the invalid entries; the valid ones are kept
+                invalid = {error["loc"][0] for error in section_errors}
+                value = [item for index, item in enumerate(value) if index in invalid]
+                _, section_errors = validate_section(section, value)
+            request = self._section_request(transcription, section, value, section_errors)
+            response = await self.gateway.chat_completion(request)
+            usage = response.get("usage") or {}
+            try:
+                answer = self._answer(response)
+            except ValueError as e:
+                return None, [{"loc": (), "msg": str(e), "type": "value_error.json"}], usage
+            value = section_value(answer, section)
+            if value is None and section != INTERESTS_SECTION:
+                # Answered with the section's fields rather than the payload shape
+                value = answer
+            validated, section_errors = validate_section(section, value)
+            return validated, section_errors, usage
+
+        results = await asyncio.gather(*(repair(section) for section in retry))
+
+        usage: Dict[str, Any] = {}
+        for section, (validated, section_errors, repair_usage) in zip(retry, results):
+            for name, count in repair_usage.items():
+                if isinstance(count, (int, float)):
+                    usage[name] = usage.get(name, 0) + count
+            if section == INTERESTS_SECTION:
+                valid[section] = valid.get(section, []) + (validated or [])
+            elif validated:
+                if section == STUDENT_SECTION:
+                    valid.update(validated)
+                else:
+                    # Fields valid in the first answer stay unless the second one replaces them
+                    valid[section] = {**valid.get(section, {}), **validated}
+            if section_errors:
+                errors[section] = section_errors
+            else:
+                del errors[section]
+
+        if STUDENT_SECTION in errors:
+            raise ValueError(f"Extracted student is invalid: {describe_errors(errors[STUDENT_SECTION])}")
+        report = {
+            "reprompted": [section or "student" for section in retry],
+            "dropped": {section: describe_errors(section_errors) for section, section_errors in errors.items()},
+            "usage": usage,
+        }
+        return valid, report
+
+    def _section_request(self, transcription: str, section: str, value: Any,
+                         errors: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Build the chat completion request re-asking for one invalid section.
+        
+        Args:
+            transcription: Interview transcription text
+            section: Payload key of the section; STUDENT_SECTION for the top-level fields
+            value: The section's invalid value
+            errors: Its validation errors
+            
+        Returns:
+            Dict[str, Any]: Request body for the AI service
+        """
+        if section == INTERESTS_SECTION:
+            shape = (
+                f"a JSON object with a '{INTERESTS_SECTION}' list of objects with category, "
+                "name, description, experience_years (integer) and frequency"
+            )
+        else:
+            model = SECTION_MODELS[section]
+            fields = ", ".join(
+                f"{name} ({field.outer_type_.__name__})" for name, field in model.__fields__.items()
+            )
+            target = f"a '{section}' object" if section else "the top-level fields"
+            shape = f"a JSON object with {target} holding exactly these fields: {fields}"
+        return {
+            "model": self.cascade.final_model,
+            "messages": [
+                {
+                    "role": "system",
+                    "content": "You extract student information from interview transcripts."
+                },
+                {
+                    "role": "user",
+                    "content": (
+                        f"An earlier extraction returned {to_json(value)}, which is invalid: "
+                        f"{describe_errors(errors)}. Return {shape}, with dates as YYYY-MM-DD."
+                        f"\n\nTranscript: {transcription}"
+                    )
+                }
+            ],
+            "response_format": {"type": "json_object"}
+        }
 
     async def save_student_info(self, session: Session, extracted_data: Dict[str, Any]) -> Student:
         """Save extracted student information to the database.
         
+        The inserts run in a worker thread so they do not block the event loop.
+        
         Args:
             session: Database session
             extracted_data: Extracted student information
@@ -73,6 +748,10 @@ class StudentExtractionService:
         Returns:
             Student: Created student record
         """
+        return await asyncio.to_thread(self._save_student_info, session, extracted_data)
+
+    def _save_student_info(self, session: Session, extracted_data: Dict[str, Any]) -> Student:
+        """Insert the student records; the blocking part of save_student_info."""
         # Create student record
         student = Student(
             first_name=extracted_data["first_name"],
@@ -134,4 +813,5 @@ class StudentExtractionService:
             session.add(social_aspects)
 
         session.commit()
+        session.refresh(student)
         return student
@@ -0,0 +1,301 @@
+"""Database-backed queue for transcription processing.
+
+This module stores submitted transcriptions as TranscriptionJob rows and runs
+workers that claim them with SELECT ... FOR UPDATE SKIP LOCKED, extract the
+student information and save it. Workers can run inside the API process or
+as separate processes (see worker.py); throughput scales with their number.
+"""
+
+import asyncio
+import logging
+import os
+import socket
+import time
+import uuid
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List, Optional
+
+from sqlalchemy import and_, or_
+from sqlmodel import Session, select
+
+from app.core.config import Settings
+from app.db.models import TranscriptionJob
+from app.services.ai_gateway import AIServiceError
+from app.services.student_extractor import StudentExtractionService
+
+logger = logging.getLogger(__name__)
+
+def enqueue_transcription(session: Session, transcription: str, cache_mode: str = "use",
+                          submitted_by: Optional[int] = None,
+                          extraction_mode: str = "llm") -> TranscriptionJob:
+    """Queue a transcription for processing.
+
+    Args:
+        session: Database session
+        transcription: Interview transcription text
+        cache_mode: Extraction cache mode used when the job is processed
+        submitted_by: ID of the user submitting the transcription
+        extraction_mode: 'llm', 'hybrid' or 'chunked' extraction
+
+    Returns:
+        TranscriptionJob: The queued job
+    """
+    job = TranscriptionJob(
+        transcription=transcription,
+        cache_mode=cache_mode,
+        extraction_mode=extraction_mode,
+        submitted_by=submitted_by
+    )
+    session.add(job)
+    session.commit()
+    session.refresh(job)
+    return job
+
+
+def claim_next_job(session: Session, worker_id: str, lease_seconds: float,
+                   max_attempts: Optional[int] = None) -> Optional[TranscriptionJob]:
+    """Claim the oldest queued job, or one whose worker's lease has expired.
+
+    Rows locked by other workers are skipped rather than waited on, so
+    concurrent workers never block each other or take the same job. An
+    abandoned job that has already used max_attempts is marked failed instead
+    of being claimed again, since its worker most likely crashed on it.
+
+    Args:
+        session: Database session
+        worker_id: Identifier of the claiming worker
+        lease_seconds: Time after which a job still 'processing' is considered abandoned
+        max_attempts: Attempts after which an abandoned job is failed; None retries it indefinitely
+
+    Returns:
+        Optional[TranscriptionJob]: Claimed job, or None if there is no work
+    """
+    now = datetime.utcnow()
+    statement = (
+        select(TranscriptionJob)
+        .where(or_(
+            TranscriptionJob.status == "queued",
+            and_(
+                TranscriptionJob.status == "processing",
+                TranscriptionJob.started_at < now - timedelta(seconds=lease_seconds)
+            )
+        ))
+        .order_by(TranscriptionJob.created_at)
+        .limit(1)
+        .with_for_update(skip_locked=True)
+    )
+    while True:
+        job = session.exec(statement).first()
+        if job is None:
+            session.rollback()
+            return None
+        if job.status == "queued" or max_attempts is None or job.attempts < max_attempts:
+            break
+        job.status = "failed"
+        job.stage = None
+        job.error = f"Worker lease expired on all {job.attempts} attempts"
+        job.finished_at = now
+        session.add(job)
+        session.commit()
+
+    job.status = "processing"
+    job.stage = "extracting"
+    job.worker_id = worker_id
+    job.attempts += 1
+    job.started_at = now
+    session.add(job)
+    session.commit()
+    session.refresh(job)
+    return job
+
+
+def job_status(job: TranscriptionJob) -> Dict[str, Any]:
+    """Return a job's progress for API responses.
+
+    Args:
+        job: Transcription job
+
+    Returns:
+        Dict[str, Any]: Job status, progress and result
+    """
+    return {
+        "job_id": job.job_id,
+        "status": job.status,
+        "stage": job.stage,
+        "extraction_mode": job.extraction_mode,
+        "attempts": job.attempts,
+        "student_id": job.student_id,
+        "extracted_info": job.result,
+        "extraction_report": job.extraction_report,
+        "error": job.error,
+        "created_at": job.created_at.isoformat(),
+        "started_at": job.started_at.isoformat() if job.started_at else None,
+        "finished_at": job.finished_at.isoformat() if job.finished_at else None,
+    }
+
+
+class TranscriptionWorker:
+    """Worker that processes queued transcriptions one at a time.
+
+    Attributes:
+        worker_id (str): Identifier recorded on claimed jobs
+        processed (int): Jobs completed by this worker
+        failed (int): Jobs this worker marked as failed
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session],
+        service: StudentExtractionService,
+        worker_id: Optional[str] = None,
+        poll_seconds: float = 1.0,
+        lease_seconds: float = 600.0,
+        max_attempts: int = 3
+    ):
+        """Initialize the worker.
+
+        Args:
+            session_factory: Creates database sessions
+            service: Student extraction service
+            worker_id: Identifier recorded on claimed jobs; generated if omitted
+            poll_seconds: Wait between polls while the queue is empty
+            lease_seconds: Time after which an unfinished claimed job is retried
+            max_attempts: Attempts before a job failing with AI service errors is marked failed
+        """
+        self.session_factory = session_factory
+        self.service = service
+        self.worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self.poll_seconds = poll_seconds
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        self.processed = 0
+        self.failed = 0
+
+    async def run(self, stop: asyncio.Event) -> None:
+        """Process jobs until stop is set, polling while the queue is empty.
+
+        Args:
+            stop: Event that ends the loop once the current job is done
+        """
+        while not stop.is_set():
+            try:
+                if await self.process_next():
+                    continue
+            except Exception:
+                # Usually the database is unreachable; keep polling until it is back
+                logger.exception("Transcription worker %s failed to process the queue", self.worker_id)
+            try:
+                await asyncio.wait_for(stop.wait(), timeout=self.poll_seconds)
+            except asyncio.TimeoutError:
+                pass
+
+    async def process_next(self) -> bool:
+        """Claim and process one job.
+
+        Database calls block, so they run in worker threads; in-process
+        workers would otherwise stall the API's event loop on every poll.
+
+        Returns:
+            bool: Whether a job was claimed
+        """
+        retry_delay = None
+        session = self.session_factory()
+        try:
+            job = await asyncio.to_thread(
+                claim_next_job, session, self.worker_id, self.lease_seconds, self.max_attempts
+            )
+            if job is None:
+                return False
+            try:
+                if job.extraction_mode in ("hybrid", "chunked"):
+                    extract = (
+                        self.service.extract_hybrid if job.extraction_mode == "hybrid"
+                        else self.service.extract_chunked
+                    )
+                    extraction = await extract(job.transcription, cache_mode=job.cache_mode)
+                    # The result can be shared with the extraction cache; read it, never change it
+                    extracted_data = extraction["extracted_info"]
+                    report = {name: value for name, value in extraction.items() if name != "extracted_info"}
+                else:
+                    report = {}
+                    start = time.perf_counter()
+                    extracted_data = await self.service.process_transcription(
+                        job.transcription, cache_mode=job.cache_mode, report=report
+                    )
+                    report["latency_ms"] = {"llm": (time.perf_counter() - start) * 1000}
+
+                job.stage = "validating"
+                await asyncio.to_thread(_save_job, session, job)
+                extracted_data, report["validation"] = await self.service.validate_and_repair(
+                    job.transcription, extracted_data
+                )
+
+                job.stage = "saving"
+                await asyncio.to_thread(_save_job, session, job)
+                student = await self.service.save_student_info(session, extracted_data)
+
+                job.status = "completed"
+                job.stage = None
+                job.student_id = student.student_id
+                job.result = extracted_data
+                job.extraction_report = report
+                job.error = None
+                job.finished_at = datetime.utcnow()
+                self.processed += 1
+            except Exception as e:
+                await asyncio.to_thread(_rollback_job, session, job)
+                job.error = str(e)
+                job.stage = None
+                if isinstance(e, AIServiceError) and job.attempts < self.max_attempts:
+                    # Transient provider trouble; let any worker pick the job up again,
+                    # but back off before claiming more work from the same provider
+                    job.status = "queued"
+                    retry_delay = e.retry_after or self.poll_seconds
+                else:
+                    job.status = "failed"
+                    job.finished_at = datetime.utcnow()
+                    self.failed += 1
+            await asyncio.to_thread(_save_job, session, job)
+        finally:
+            await asyncio.to_thread(session.close)
+        if retry_delay:
+            await asyncio.sleep(retry_delay)
+        return True
+
+
+def _save_job(session: Session, job: TranscriptionJob) -> None:
+    """Commit a job's changes and reload it, so reading it later does not hit the database."""
+    session.add(job)
+    session.commit()
+    session.refresh(job)
+
+
+def _rollback_job(session: Session, job: TranscriptionJob) -> None:
+    """Roll back a failed job's transaction and reload the job."""
+    session.rollback()
+    session.refresh(job)
+
+
+def create_workers(settings: Settings, session_factory: Callable[[], Session],
+                   service: StudentExtractionService, count: int) -> List[TranscriptionWorker]:
+    """Create transcription workers configured from the application settings.
+
+    Args:
+        settings: Application settings
+        session_factory: Creates database sessions
+        service: Student extraction service shared by the workers
+        count: Number of workers
+
+    Returns:
+        List[TranscriptionWorker]: Workers ready to run
+    """
+    return [
+        TranscriptionWorker(
+            session_factory,
+            service,
+            poll_seconds=settings.TRANSCRIPTION_POLL_SECONDS,
+            lease_seconds=settings.TRANSCRIPTION_LEASE_SECONDS,
+            max_attempts=settings.TRANSCRIPTION_MAX_ATTEMPTS
+        )
+        for _ in range(count)
+    ]
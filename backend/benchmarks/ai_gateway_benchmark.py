@@ -0,0 +1,114 @@
+"""Benchmark of the AI gateway against a fake provider that injects failures.
+
+Sends a burst of chat completion requests to a local fake provider that
+answers a fraction of them with 429 or 500, first as plain single attempts and
+then through AIGateway, and reports the success rate and latency of both. A
+final phase makes the provider fail every request to show the circuit breaker
+rejecting calls without contacting it.
+
+Usage:
+    python benchmarks/ai_gateway_benchmark.py [--requests 200] [--rate-limit-rate 0.2]
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+
+import httpx
+
+# Add the backend directory to the Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.core.config import get_settings
+from app.core.http_client import create_http_client
+from app.services.ai_gateway import AIGateway, AIServiceError
+from fake_ai_provider import start_server
+
+PAYLOAD = {
+    "model": "gpt-4-turbo-preview",
+    "messages": [{"role": "user", "content": "Generate personalized content based on this context: ..."}],
+    "max_tokens": 200,
+}
+
+
+async def burst(send, total: int):
+    """Run total calls concurrently; return successes and latencies in ms."""
+    latencies = []
+
+    async def call():
+        start = time.perf_counter()
+        try:
+            ok = await send()
+        except (AIServiceError, httpx.TransportError):
+            ok = False
+        latencies.append((time.perf_counter() - start) * 1000)
+        return ok
+
+    results = await asyncio.gather(*(call() for _ in range(total)))
+    return sum(results), latencies
+
+
+def report(label: str, successes: int, total: int, latencies) -> None:
+    """Print the success rate and latency percentiles of a run."""
+    cuts = statistics.quantiles(latencies, n=100)
+    print(f"{label:<22} success {successes / total:6.1%}   "
+          f"p50 {statistics.median(latencies):8.1f} ms   p99 {cuts[98]:8.1f} ms")
+
+
+async def benchmark(args) -> None:
+    client = create_http_client(get_settings())
+    _, url = start_server(
+        latency_ms=args.latency_ms, rate_limit_rate=args.rate_limit_rate,
+        error_rate=args.error_rate, retry_after=args.retry_after
+    )
+    try:
+        async def single_attempt():
+            response = await client.post(f"{url}/chat/completions", json=PAYLOAD)
+            return response.status_code == 200
+
+        successes, latencies = await burst(single_attempt, args.requests)
+        report("single attempt", successes, args.requests, latencies)
+
+        gateway = AIGateway(
+            client, url, "fake-key", max_concurrency=args.concurrency,
+            requests_per_minute=args.requests_per_minute, tokens_per_minute=args.requests_per_minute * 1000,
+            backoff_base=0.05,
+            failure_threshold=args.requests
+        )
+
+        async def through_gateway():
+            await gateway.chat_completion(PAYLOAD)
+            return True
+
+        successes, latencies = await burst(through_gateway, args.requests)
+        report("gateway", successes, args.requests, latencies)
+        print(f"gateway stats: {gateway.stats()}")
+
+        _, failing_url = start_server(error_rate=1.0)
+        gateway = AIGateway(client, failing_url, "fake-key", max_retries=0, failure_threshold=5)
+        successes, latencies = await burst(through_gateway, args.requests)
+        stats = gateway.stats()
+        print(f"provider down          attempts {stats['attempts']}   "
+              f"short-circuited {stats['short_circuited']}   circuit {stats['circuit_state']}")
+    finally:
+        await client.aclose()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=200, help="Requests per burst")
+    parser.add_argument("--concurrency", type=int, default=16, help="Gateway concurrency limit")
+    parser.add_argument("--requests-per-minute", type=float, default=12_000, help="Gateway request rate limit")
+    parser.add_argument("--latency-ms", type=float, default=20.0, help="Stub server response delay")
+    parser.add_argument("--rate-limit-rate", type=float, default=0.2, help="Fraction of 429 responses")
+    parser.add_argument("--error-rate", type=float, default=0.05, help="Fraction of 500 responses")
+    parser.add_argument("--retry-after", type=float, default=0.1, help="Retry-After seconds for 429s")
+    args = parser.parse_args()
+    asyncio.run(benchmark(args))
+
+
+if __name__ == "__main__":
+    main()
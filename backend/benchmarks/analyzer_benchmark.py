@@ -0,0 +1,173 @@
+"""Benchmark for the ConversationAnalyzer extraction pass.
+
+Parses synthetic interview transcripts of roughly 10KB and 100KB once, then times
+the rule-based extraction that runs on top of the parsed Doc: the fused single
+sentence pass used by ConversationAnalyzer against the previous implementation,
+which walked doc.sents once per extractor. Both must produce identical output.
+
+Usage:
+    python benchmarks/analyzer_benchmark.py [--model en_core_web_lg] [--repeat 5]
+"""
+
+import argparse
+import os
+import re
+import statistics
+import sys
+import time
+
+# Add the backend directory to the Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.services.conversation_analyzer import ConversationAnalyzer
+
+INTERVIEW = (
+    "Hi, my name is Maria Lopez and I am 34 years old. My native language is Spanish. "
+    "I grew up in Madrid, but I live in Boston now. I work as a software engineer at a small company. "
+    "I have 10 years of experience in the industry. I have been 3 years in the United States. "
+    "My English level is intermediate, but I want to improve my pronunciation. "
+    "In my free time I enjoy painting and hiking in the mountains. "
+    "I play tennis and soccer on weekends. I love jazz music and old movies. "
+    "My goal is to speak better at meetings. I prefer a hybrid office because I like to meet my team.\n\n"
+)
+
+
+def make_transcript(size: int) -> str:
+    """Build a synthetic transcript of at least size characters.
+
+    Args:
+        size: Minimum transcript length in characters
+
+    Returns:
+        str: Transcript text
+    """
+    return INTERVIEW * (size // len(INTERVIEW) + 1)
+
+
+def legacy_analyze(analyzer: ConversationAnalyzer, doc, text: str) -> dict:
+    """Reference multi-pass extraction, one doc.sents walk per extractor.
+
+    Mirrors the original implementation: every extractor walks the sentences on
+    its own, lowercases them again and checks each keyword with a substring test.
+
+    Args:
+        analyzer: Analyzer providing the model, patterns, indicators and categories
+        doc: Parsed transcript
+        text: Raw transcript text
+
+    Returns:
+        dict: Extracted information in the analyzer's output format
+    """
+    def language():
+        for sent in doc.sents:
+            for indicator in analyzer.LANGUAGE_INDICATORS:
+                if indicator in sent.text.lower():
+                    for ent in sent.ents:
+                        if ent.label_ == "LANGUAGE":
+                            return ent.text
+        return None
+
+    def english_level():
+        for sent in doc.sents:
+            sent_lower = sent.text.lower()
+            if any(indicator in sent_lower for indicator in analyzer.LEVEL_INDICATORS):
+                for level in analyzer.LEVELS:
+                    if level in sent_lower:
+                        return level
+        return None
+
+    def job_title():
+        for sent in doc.sents:
+            for indicator in analyzer.JOB_INDICATORS:
+                if indicator in sent.text.lower():
+                    start_char = sent.start_char + sent.text.lower().find(indicator) + len(indicator)
+                    remaining = doc.char_span(start_char, sent.end_char, alignment_mode="contract")
+                    if remaining is None:
+                        continue
+                    for chunk in remaining.noun_chunks:
+                        return chunk.text
+        return None
+
+    def location(location_type):
+        for sent in doc.sents:
+            if any(indicator in sent.text.lower() for indicator in analyzer.LOCATION_INDICATORS[location_type]):
+                for ent in sent.ents:
+                    if ent.label_ in ["GPE", "LOC"]:
+                        return ent.text
+        return None
+
+    def category(name):
+        results = []
+        for sent in doc.sents:
+            if any(keyword in sent.text.lower() for keyword in analyzer.categories[name]):
+                for chunk in sent.noun_chunks:
+                    if not any(keyword in chunk.text.lower() for keyword in analyzer.categories[name]):
+                        results.append(chunk.text.strip())
+        return list(set(results)) if results else None
+
+    def pattern(key):
+        match = re.search(analyzer.patterns[key], text, re.IGNORECASE)
+        return match.group(0) if match else None
+
+    result = {
+        "name": analyzer._extract_name(doc),
+        "age_range": pattern("age_range"),
+        "native_language": language(),
+        "english_level": english_level(),
+        "job_title": job_title(),
+        "years_of_experience": pattern("years_experience"),
+        "years_in_current_country": pattern("years_in_country"),
+        "hometown": location("hometown"),
+        "current_city": location("current_city"),
+        "hobbies": category("hobbies"),
+        "sports": category("sports"),
+        "interests": category("interests"),
+        "learning_goals": category("learning_goals"),
+        "work_environment": category("work_environment"),
+    }
+    return {k: v for k, v in result.items() if v is not None}
+
+
+def normalize(result: dict) -> dict:
+    """Make results comparable regardless of set iteration order."""
+    return {k: sorted(v) if isinstance(v, list) else v for k, v in result.items()}
+
+
+def time_call(func, repeat: int) -> float:
+    """Return the median wall time of func over repeat runs, in seconds."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--model", default="en_core_web_lg", help="spaCy model to load")
+    parser.add_argument("--repeat", type=int, default=5, help="Timed runs per measurement")
+    args = parser.parse_args()
+
+    analyzer = ConversationAnalyzer(model_name=args.model)
+    # The default spaCy limit is 1,000,000 characters, enough for 100KB inputs
+    for label, size in (("10KB", 10_000), ("100KB", 100_000)):
+        text = make_transcript(size)
+        doc = analyzer.nlp(text)
+
+        legacy = legacy_analyze(analyzer, doc, text)
+        fused = analyzer._analyze_doc(doc, text)
+        if normalize(legacy) != normalize(fused):
+            raise SystemExit(f"{label}: fused output differs from the multi-pass reference")
+
+        legacy_seconds = time_call(lambda: legacy_analyze(analyzer, doc, text), args.repeat)
+        fused_seconds = time_call(lambda: analyzer._analyze_doc(doc, text), args.repeat)
+        print(
+            f"{label:>6}: multi-pass {legacy_seconds * 1000:8.1f} ms | "
+            f"fused {fused_seconds * 1000:8.1f} ms | "
+            f"speedup {legacy_seconds / fused_seconds:5.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""Benchmark comparing ConversationAnalyzer speed/accuracy tiers.
+
+Analyzes the same synthetic transcripts with every tier and reports the
+median latency, the measured throughput and the field-level agreement of
+each tier with the 'accurate' tier. The throughput figures are what
+ConversationAnalyzer.TIER_CHARS_PER_SECOND should be calibrated to on the
+deployment hardware.
+
+Usage:
+    python benchmarks/analyzer_tiers_benchmark.py [--repeat 3]
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+
+# Add the backend directory to the Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.services.conversation_analyzer import ConversationAnalyzer
+
+TRANSCRIPTS = [
+    "Hi, my name is Maria Lopez and I am 34 years old. My native language is Spanish. "
+    "I grew up in Madrid, but I live in Boston now. I work as a software engineer. "
+    "I have 10 years of experience. My English level is intermediate. "
+    "In my free time I enjoy painting and hiking. I play tennis on weekends.",
+    "Good morning! I'm Nguyen Van An, 27 years old, from Hanoi. My first language is Vietnamese. "
+    "I moved to Toronto two years ago and I have been 2 years in Canada. My job is nurse at a clinic. "
+    "I would say my English proficiency is advanced. I love cooking and I play badminton. "
+    "My goal is to pass the nursing exam and improve my writing.",
+    "Hello, I am Ahmed Hassan. I am 45 years old and my mother tongue is Arabic. "
+    "I was born in Cairo and I am currently in Chicago. My position is project manager. "
+    "I have 20 years of experience in construction. I am a beginner in English. "
+    "I like to watch football and I enjoy reading history books. I prefer a hybrid office.",
+]
+
+
+def agreement(result: dict, reference: dict) -> float:
+    """Fraction of fields on which a result matches the reference.
+
+    List fields are compared as sets; a field missing from both counts as agreement.
+    """
+    fields = ConversationAnalyzer.RESULT_FIELDS
+    matches = 0
+    for field in fields:
+        value, expected = result.get(field), reference.get(field)
+        if isinstance(value, list) and isinstance(expected, list):
+            matches += set(value) == set(expected)
+        else:
+            matches += value == expected
+    return matches / len(fields)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs per transcript")
+    parser.add_argument("--scale", type=int, default=10, help="Times each transcript is repeated")
+    args = parser.parse_args()
+
+    texts = [" ".join([text] * args.scale) for text in TRANSCRIPTS]
+    analyzers = {tier: ConversationAnalyzer(tier=tier) for tier in ConversationAnalyzer.TIER_MODELS}
+    reference = [analyzers["accurate"].analyze_transcription(text) for text in texts]
+
+    for tier, analyzer in analyzers.items():
+        latencies = []
+        agreements = []
+        for text, expected in zip(texts, reference):
+            for _ in range(args.repeat):
+                start = time.perf_counter()
+                result = analyzer.analyze_transcription(text)
+                latencies.append(time.perf_counter() - start)
+            agreements.append(agreement(result, expected))
+
+        median = statistics.median(latencies)
+        chars_per_second = statistics.mean(len(text) for text in texts) / median
+        print(
+            f"{tier:>9} ({analyzer.model_name}): median {median * 1000:7.1f} ms | "
+            f"{chars_per_second:9,.0f} chars/s | agreement with accurate "
+            f"{statistics.mean(agreements) * 100:5.1f}%"
+        )
+
+
+if __name__ == "__main__":
+    main()
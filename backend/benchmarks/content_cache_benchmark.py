@@ -0,0 +1,92 @@
+"""Benchmark of class regeneration with the profile-fingerprint content cache.
+
+Generates content for a synthetic class against a local fake AI provider, then
+changes a few student profiles and regenerates the whole class. Students whose
+fingerprint is unchanged are served from the cache; the per-student latency of
+both runs is reported.
+
+Usage:
+    python benchmarks/content_cache_benchmark.py [--students 30] [--changed 3]
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import tempfile
+import time
+from types import SimpleNamespace
+from typing import List
+
+# Add the backend directory to the Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.core.config import get_settings
+from app.core.http_client import create_http_client
+from app.services.ai_gateway import AIGateway
+from app.services.content_generator import ContentGenerationService
+from app.services.response_cache import ResponseCache
+from fake_ai_provider import start_server
+
+TEMPLATE = {"title": "Talking about work", "activities": [{"type": "gap_fill", "items": 10}]}
+
+
+def make_student(index: int) -> SimpleNamespace:
+    """Build a stand-in for a Student record with the fields generate reads."""
+    return SimpleNamespace(
+        first_name=f"Student{index}",
+        last_name="Example",
+        proficiency_level="intermediate",
+        interests_hobbies=[SimpleNamespace(category="sports", name="tennis")],
+        learning_context=SimpleNamespace(
+            learning_goals="Speak confidently at work",
+            preferred_learning_style="visual",
+            challenges="phrasal verbs",
+        ),
+    )
+
+
+async def generate_class(service: ContentGenerationService, students) -> List[float]:
+    """Generate content for every student in turn and return latencies in ms."""
+    latencies = []
+    for student in students:
+        start = time.perf_counter()
+        await service.generate(student, TEMPLATE)
+        latencies.append((time.perf_counter() - start) * 1000)
+    return latencies
+
+
+async def benchmark(args, url: str) -> None:
+    students = [make_student(i) for i in range(args.students)]
+    client = create_http_client(get_settings())
+    cache = ResponseCache(tempfile.mkdtemp(), "content_cache")
+    service = ContentGenerationService(AIGateway(client, url, "fake-key"), cache)
+    try:
+        latencies = await generate_class(service, students)
+        print(f"first generation   median {statistics.median(latencies):8.2f} ms/student   "
+              f"total {sum(latencies):9.1f} ms")
+
+        for student in students[:args.changed]:
+            student.proficiency_level = "upper-intermediate"
+        latencies = await generate_class(service, students)
+        print(f"regeneration       median {statistics.median(latencies):8.2f} ms/student   "
+              f"total {sum(latencies):9.1f} ms   ({args.changed} profiles changed)")
+        print(f"cache stats: {cache.stats()}")
+    finally:
+        await client.aclose()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--students", type=int, default=30, help="Students in the class")
+    parser.add_argument("--changed", type=int, default=3, help="Profiles changed before regenerating")
+    parser.add_argument("--latency-ms", type=float, default=500.0, help="Stub server response delay")
+    args = parser.parse_args()
+
+    server, url = start_server(latency_ms=args.latency_ms)
+    asyncio.run(benchmark(args, url))
+
+
+if __name__ == "__main__":
+    main()
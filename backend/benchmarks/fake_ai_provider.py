@@ -0,0 +1,283 @@
+"""Minimal local stand-in for the AI service's chat completions API.
+
+Answers POST /chat/completions with a fixed JSON completion after a delay drawn
+from a configurable latency distribution, plus an optional delay per
+completion token so longer answers take longer, as they do with a real model.
+Extraction requests (whose system message mentions extracting) get a student
+profile the transcription workers can save, skeleton and slot-filling requests
+get a worksheet skeleton or slot values, and all others get a full worksheet.
+Usage reports estimated token counts.
+It speaks HTTP/1.1 with keep-alive, so benchmarks against it measure
+connection reuse the same way they would against the real service (minus TLS).
+A fraction of requests can be answered with 429 (with Retry-After) or 500 to
+exercise retries and the circuit breaker. Requests with "stream": true are
+answered with server-sent events, spreading the latency evenly over the chunks
+so the first token arrives early as it does with the real service.
+
+Point the API at it to run the whole application without an AI service key:
+
+    python benchmarks/fake_ai_provider.py --latency-ms 800 --latency-dist lognormal
+    AI_SERVICE_URL=http://127.0.0.1:8765 AI_SERVICE_KEY=fake python run.py
+
+Usage:
+    python benchmarks/fake_ai_provider.py [--port 8765] [--latency-ms 20]
+        [--latency-dist fixed|uniform|normal|lognormal] [--latency-spread 0.5]
+        [--ms-per-token 0]
+        [--rate-limit-rate 0.1] [--error-rate 0.05]
+
+Benchmarks can also start it in a background thread with start_server().
+"""
+
+import argparse
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Tuple
+
+LATENCY_DISTRIBUTIONS = ("fixed", "uniform", "normal", "lognormal")
+
+STUDENT_PROFILE = {
+    "first_name": "Maria",
+    "last_name": "Lopez",
+    "proficiency_level": "intermediate",
+    "interests_hobbies": [
+        {"category": "hobbies", "name": "painting", "description": "Watercolor landscapes",
+         "experience_years": 5, "frequency": "weekly"},
+        {"category": "sports", "name": "tennis", "description": "Plays doubles with friends",
+         "experience_years": 3, "frequency": "weekends"},
+    ],
+}
+
+SKELETON_SLOTS = {
+    "work_task": {"description": "A task from the student's job", "default": "one task you do"},
+    "workplace": {"description": "The student's workplace", "default": "your workplace"},
+    "hobby": {"description": "One of the student's hobbies", "default": "your favourite hobby"},
+}
+
+SKELETON = {
+    "title": "Talking about work",
+    "instructions": "Answer each question in full sentences.",
+    "questions": [
+        {"number": i, "prompt": f"Describe {{{{{slot}}}}} in your own words ({i}).", "answer_lines": 3}
+        for i, slot in enumerate(list(SKELETON_SLOTS) * 3 + ["work_task"], start=1)
+    ],
+    "slots": SKELETON_SLOTS,
+}
+
+SLOT_VALUES = {"slots": {"work_task": "reviewing code", "workplace": "a small software company", "hobby": "tennis"}}
+
+COMPLETION = {
+    "id": "chatcmpl-fake",
+    "object": "chat.completion",
+    "model": "fake-model",
+    "choices": [
+        {
+            "index": 0,
+            "message": {
+                "role": "assistant",
+                "content": json.dumps({
+                    "title": "Talking about work",
+                    "questions": [
+                        {"number": i, "prompt": f"Describe one task you do at work ({i}).", "answer_lines": 3}
+                        for i in range(1, 11)
+                    ],
+                }),
+            },
+            "finish_reason": "stop",
+        }
+    ],
+    "usage": {"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0},
+}
+
+
+def make_latency(latency_ms: float, distribution: str = "fixed", spread: float = 0.0) -> Callable[[], float]:
+    """Build a sampler of response latencies.
+
+    Args:
+        latency_ms: Fixed latency, or the median of the distribution
+        distribution: One of LATENCY_DISTRIBUTIONS
+        spread: Relative spread; half-width for 'uniform', standard deviation
+            as a fraction of latency_ms for 'normal', sigma for 'lognormal'
+            (0.5 gives a p99 of about 3.2 times the median)
+
+    Returns:
+        Callable[[], float]: Function returning a latency in seconds
+    """
+    if distribution not in LATENCY_DISTRIBUTIONS:
+        raise ValueError(f"Unknown latency distribution: {distribution}")
+    median = latency_ms / 1000
+    if distribution == "uniform":
+        return lambda: random.uniform(median * (1 - spread), median * (1 + spread))
+    if distribution == "normal":
+        return lambda: max(0.0, random.gauss(median, median * spread))
+    if distribution == "lognormal":
+        return lambda: median * random.lognormvariate(0.0, spread)
+    return lambda: median
+
+
+def make_completion(request: dict) -> dict:
+    """Build the completion answering a chat request.
+
+    Args:
+        request: Chat completions request body
+
+    Returns:
+        dict: Completion with estimated usage
+    """
+    messages = request.get("messages", [])
+    system = " ".join(m.get("content", "") for m in messages if m.get("role") == "system").lower()
+    if "extract" in system:
+        content = json.dumps(STUDENT_PROFILE)
+    elif "skeleton" in system:
+        content = json.dumps(SKELETON)
+    elif "personalizing" in system:
+        content = json.dumps(SLOT_VALUES)
+    else:
+        content = COMPLETION["choices"][0]["message"]["content"]
+    prompt_tokens = sum(len(str(m.get("content", ""))) for m in messages) // 4
+    completion_tokens = len(content) // 4
+    completion = dict(COMPLETION, model=request.get("model", COMPLETION["model"]))
+    completion["choices"] = [dict(COMPLETION["choices"][0], message={"role": "assistant", "content": content})]
+    completion["usage"] = {
+        "prompt_tokens": prompt_tokens,
+        "completion_tokens": completion_tokens,
+        "total_tokens": prompt_tokens + completion_tokens,
+    }
+    return completion
+
+
+class FakeProviderServer(ThreadingHTTPServer):
+    """Threaded HTTP server with a listen backlog large enough for burst tests."""
+
+    daemon_threads = True
+    request_queue_size = 1024
+
+
+def make_handler(latency_ms: float, rate_limit_rate: float = 0.0, error_rate: float = 0.0,
+                 retry_after: float = 0.1, stream_chunks: int = 20,
+                 latency_dist: str = "fixed", latency_spread: float = 0.0,
+                 ms_per_token: float = 0.0):
+    """Build a request handler class that answers after a sampled latency.
+
+    Args:
+        latency_ms: Delay before each response, or the whole stream when
+            streaming; the median when latency_dist is not 'fixed'
+        rate_limit_rate: Fraction of requests answered with 429
+        error_rate: Fraction of requests answered with 500
+        retry_after: Retry-After seconds sent with 429 responses
+        stream_chunks: Number of chunks a streamed completion is split into
+        latency_dist: Latency distribution, one of LATENCY_DISTRIBUTIONS
+        latency_spread: Spread of the distribution, see make_latency
+        ms_per_token: Extra delay per completion token
+    """
+    sample_latency = make_latency(latency_ms, latency_dist, latency_spread)
+
+    class FakeProviderHandler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_POST(self):
+            length = int(self.headers.get("Content-Length", 0))
+            request = json.loads(self.rfile.read(length) or b"{}")
+            if not self.path.endswith("/chat/completions"):
+                self.send_error(404)
+                return
+            streaming = bool(request.get("stream"))
+            completion = make_completion(request)
+            latency = sample_latency() + completion["usage"]["completion_tokens"] * ms_per_token / 1000
+            if not streaming:
+                time.sleep(latency)
+            roll = random.random()
+            if roll < rate_limit_rate:
+                self.respond(429, {"error": {"message": "Rate limit reached"}},
+                             {"Retry-After": str(retry_after)})
+            elif roll < rate_limit_rate + error_rate:
+                self.respond(500, {"error": {"message": "Internal error"}})
+            elif streaming:
+                self.stream(completion["choices"][0]["message"]["content"], latency)
+            else:
+                self.respond(200, completion)
+
+        def stream(self, content, latency):
+            self.send_response(200)
+            self.send_header("Content-Type", "text/event-stream")
+            self.send_header("Transfer-Encoding", "chunked")
+            self.end_headers()
+            size = max(1, -(-len(content) // stream_chunks))
+            for start in range(0, len(content), size):
+                time.sleep(latency / stream_chunks)
+                chunk = {"choices": [{"index": 0, "delta": {"content": content[start:start + size]}}]}
+                self.write_chunk(f"data: {json.dumps(chunk)}\n\n")
+            self.write_chunk("data: [DONE]\n\n")
+            self.wfile.write(b"0\r\n\r\n")
+
+        def write_chunk(self, text):
+            data = text.encode("utf-8")
+            self.wfile.write(f"{len(data):x}\r\n".encode("ascii") + data + b"\r\n")
+            self.wfile.flush()
+
+        def respond(self, status, payload, headers=None):
+            body = json.dumps(payload).encode("utf-8")
+            self.send_response(status)
+            for name, value in (headers or {}).items():
+                self.send_header(name, value)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    return FakeProviderHandler
+
+
+def start_server(port: int = 0, latency_ms: float = 0.0, **faults) -> Tuple[FakeProviderServer, str]:
+    """Start the fake provider in a daemon thread.
+
+    Args:
+        port: Port to listen on; 0 picks a free port
+        latency_ms: Delay before each response
+        **faults: rate_limit_rate, error_rate, retry_after, stream_chunks,
+            latency_dist, latency_spread and ms_per_token for make_handler
+
+    Returns:
+        Tuple[FakeProviderServer, str]: Running server and its base URL
+    """
+    server = FakeProviderServer(("127.0.0.1", port), make_handler(latency_ms, **faults))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--port", type=int, default=8765, help="Port to listen on")
+    parser.add_argument("--latency-ms", type=float, default=20.0, help="Delay (median) before each response")
+    parser.add_argument("--latency-dist", choices=LATENCY_DISTRIBUTIONS, default="fixed",
+                        help="Latency distribution")
+    parser.add_argument("--latency-spread", type=float, default=0.5,
+                        help="Relative spread of the latency distribution")
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0, help="Fraction of 429 responses")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of 500 responses")
+    parser.add_argument("--retry-after", type=float, default=0.1, help="Retry-After seconds for 429s")
+    parser.add_argument("--ms-per-token", type=float, default=0.0, help="Extra delay per completion token")
+    parser.add_argument("--stream-chunks", type=int, default=20, help="Chunks per streamed completion")
+    args = parser.parse_args()
+
+    handler = make_handler(
+        args.latency_ms, args.rate_limit_rate, args.error_rate, args.retry_after,
+        stream_chunks=args.stream_chunks, latency_dist=args.latency_dist,
+        latency_spread=args.latency_spread, ms_per_token=args.ms_per_token
+    )
+    server = FakeProviderServer(("127.0.0.1", args.port), handler)
+    print(f"Fake AI provider listening on http://127.0.0.1:{args.port} "
+          f"({args.latency_dist} latency, median {args.latency_ms:g} ms)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
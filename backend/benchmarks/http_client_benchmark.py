@@ -0,0 +1,113 @@
+"""Benchmark of a shared pooled HTTP client against a client per call.
+
+Sends the same chat completion requests to a local fake AI provider, first
+opening a new httpx.AsyncClient for every call (the old behaviour of the
+AI-backed services) and then through one client from create_http_client, and
+reports p50/p99 latency and throughput for both. Pool statistics of the shared
+client are printed at the end.
+
+Usage:
+    python benchmarks/http_client_benchmark.py [--requests 500] [--concurrency 20]
+
+Pass --url to benchmark against an already running server instead of the
+built-in stub.
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+from typing import List
+
+import httpx
+
+# Add the backend directory to the Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.core.config import get_settings
+from app.core.http_client import create_http_client, pool_stats
+from fake_ai_provider import start_server
+
+PAYLOAD = {
+    "model": "gpt-4-turbo-preview",
+    "messages": [{"role": "user", "content": "Extract student information from this interview transcript: ..."}],
+    "response_format": {"type": "json_object"},
+}
+
+
+async def run(url: str, total: int, concurrency: int, client: httpx.AsyncClient = None) -> List[float]:
+    """Send total requests with bounded concurrency and return their latencies.
+
+    Args:
+        url: Chat completions URL
+        total: Number of requests
+        concurrency: Maximum requests in flight
+        client: Shared client; if None, every request opens its own client
+
+    Returns:
+        List[float]: Request latencies in milliseconds
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: List[float] = []
+
+    async def call():
+        async with semaphore:
+            start = time.perf_counter()
+            if client is None:
+                async with httpx.AsyncClient() as own_client:
+                    response = await own_client.post(url, json=PAYLOAD)
+            else:
+                response = await client.post(url, json=PAYLOAD)
+            response.raise_for_status()
+            latencies.append((time.perf_counter() - start) * 1000)
+
+    await asyncio.gather(*(call() for _ in range(total)))
+    return latencies
+
+
+def report(label: str, latencies: List[float], seconds: float) -> None:
+    """Print latency percentiles and throughput for one run."""
+    cuts = statistics.quantiles(latencies, n=100)
+    print(
+        f"{label:<20} p50 {statistics.median(latencies):8.2f} ms   "
+        f"p99 {cuts[98]:8.2f} ms   {len(latencies) / seconds:8.1f} req/s"
+    )
+
+
+async def benchmark(args) -> None:
+    url = f"{args.url.rstrip('/')}/chat/completions"
+
+    # Warm up the stub server's threads before timing anything
+    await run(url, args.concurrency, args.concurrency)
+
+    start = time.perf_counter()
+    latencies = await run(url, args.requests, args.concurrency)
+    report("client per call", latencies, time.perf_counter() - start)
+
+    client = create_http_client(get_settings())
+    try:
+        start = time.perf_counter()
+        latencies = await run(url, args.requests, args.concurrency, client)
+        report("shared client", latencies, time.perf_counter() - start)
+        print(f"pool stats: {pool_stats(client)}")
+    finally:
+        await client.aclose()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=500, help="Requests per run")
+    parser.add_argument("--concurrency", type=int, default=20, help="Requests in flight")
+    parser.add_argument("--latency-ms", type=float, default=5.0, help="Stub server response delay")
+    parser.add_argument("--url", help="Base URL of a running AI service stub")
+    args = parser.parse_args()
+
+    if args.url is None:
+        server, args.url = start_server(latency_ms=args.latency_ms)
+    asyncio.run(benchmark(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""Benchmark of hybrid extraction against full AI extraction.
+
+Runs the ConversationAnalyzer on a synthetic interview, then builds the AI
+service request each extraction mode would send. Reports the local analysis
+time, how many payload fields the analyzer filled, and the estimated prompt
+tokens of both requests. The answer, which dominates the AI service's latency,
+shrinks with the number of fields it no longer has to contain; measured token
+usage and latency of real calls are recorded in each hybrid job's report.
+
+Usage:
+    python benchmarks/hybrid_extraction_benchmark.py [--tier accurate] [--repeat 5]
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+
+# Add the backend directory to the Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import httpx
+
+from app.services.ai_gateway import AIGateway
+from app.services.conversation_analyzer import ConversationAnalyzer
+from app.services.student_extractor import (
+    LOCAL_INTEREST_CATEGORIES, StudentExtractionService, extraction_paths, map_local_analysis
+)
+from analyzer_benchmark import INTERVIEW
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tier", default=ConversationAnalyzer.DEFAULT_TIER, help="Analyzer tier")
+    parser.add_argument("--repeat", type=int, default=5, help="Timed analyzer runs")
+    args = parser.parse_args()
+
+    analyzer = ConversationAnalyzer(tier=args.tier)
+    timings = []
+    for _ in range(args.repeat):
+        start = time.perf_counter()
+        analysis = analyzer.analyze_transcription(INTERVIEW)
+        timings.append((time.perf_counter() - start) * 1000)
+
+    fields = map_local_analysis(analysis)
+    paths = extraction_paths()
+    missing = [path for path in paths if path not in fields]
+    hints = sorted({v for c in LOCAL_INTEREST_CATEGORIES for v in analysis.get(c) or []})
+
+    gateway = AIGateway(httpx.AsyncClient(), "http://unused", "unused", default_completion_tokens=0)
+    service = StudentExtractionService(gateway)
+    full_tokens = gateway.estimate_tokens(service._request(INTERVIEW))
+    hybrid_tokens = gateway.estimate_tokens(service._fields_request(INTERVIEW, missing, hints))
+
+    print(f"Analyzer tier {args.tier} ({analyzer.model_name}), transcript {len(INTERVIEW)} chars")
+    print(f"  local analysis: median {statistics.median(timings):.1f} ms over {args.repeat} runs")
+    print(f"  fields filled locally: {len(fields)}/{len(paths)} ({', '.join(sorted(fields))})")
+    print(f"  fields the answer must contain, full: {len(paths)}, hybrid: {len(missing)}")
+    print(f"  estimated prompt tokens, full: {full_tokens}, hybrid: {hybrid_tokens}")
+
+
+if __name__ == "__main__":
+    main()
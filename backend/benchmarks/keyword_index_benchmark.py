@@ -0,0 +1,64 @@
+"""Benchmark for the analyzer's keyword index.
+
+Compares the Aho-Corasick KeywordIndex with per-keyword substring checks
+(`any(keyword in text for keyword in keywords)`) as the keyword list grows.
+The substring approach scales with the number of keywords, while the
+index stays roughly flat.
+
+Usage:
+    python benchmarks/keyword_index_benchmark.py [--sentences 2000]
+"""
+
+import argparse
+import os
+import random
+import string
+import sys
+import time
+
+# Add the backend directory to the Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.services.keyword_index import KeywordIndex
+
+SENTENCE = "in my free time i enjoy painting, hiking and playing tennis with my friends from work."
+
+
+def random_keywords(count: int, rng: random.Random) -> list:
+    """Generate distinct lowercase keywords of 4 to 12 letters."""
+    keywords = set()
+    while len(keywords) < count:
+        length = rng.randint(4, 12)
+        keywords.add("".join(rng.choice(string.ascii_lowercase) for _ in range(length)))
+    return sorted(keywords)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sentences", type=int, default=2000, help="Sentences scanned per measurement")
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    sentences = [SENTENCE] * args.sentences
+    for count in (10, 100, 1000, 5000):
+        keywords = random_keywords(count, rng) + ["enjoy", "tennis"]
+        index = KeywordIndex({"keywords": keywords})
+
+        start = time.perf_counter()
+        for sentence in sentences:
+            [keyword for keyword in keywords if keyword in sentence]
+        substring_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for sentence in sentences:
+            index.search(sentence)
+        index_seconds = time.perf_counter() - start
+
+        print(
+            f"{count:>5} keywords: substring {substring_seconds * 1000:8.1f} ms | "
+            f"index {index_seconds * 1000:8.1f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,322 @@
+"""End-to-end load test of the running API.
+
+Sends requests to the API at a fixed target rate (open loop: requests are
+started on schedule whether or not earlier ones have finished, so a slow
+server shows up as latency instead of a lower request rate) and reports
+throughput, p50/p95/p99 latency and error rates. The report is written as JSON
+and can be compared against a saved baseline to catch regressions.
+
+Run the API against the fake provider so the AI service's latency is
+controlled and no key is needed:
+
+    python benchmarks/fake_ai_provider.py --latency-ms 800 --latency-dist lognormal
+    AI_SERVICE_URL=http://127.0.0.1:8765 AI_SERVICE_KEY=fake python run.py
+
+Scenarios:
+    transcriptions  POST /transcriptions/, then poll the job until it finishes
+    generate        POST /students/{id}/homework/{id}/generate/stream, read to the end
+    analyze         POST /transcriptions/analyze (local analysis only)
+
+Usage:
+    python benchmarks/load_test.py --scenario transcriptions --rps 5 --duration 30
+        --username teacher --password secret [--output baseline.json]
+        [--compare baseline.json --tolerance 0.1]
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+import time
+import uuid
+from collections import Counter
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+import httpx
+
+SCENARIOS = ("transcriptions", "generate", "analyze")
+
+TRANSCRIPT = (
+    "Hi, my name is Maria Lopez and I am 34 years old. My native language is Spanish. "
+    "I grew up in Madrid, but I live in Boston now. I work as a software engineer at a small company. "
+    "I have 10 years of experience in the industry. My English level is intermediate. "
+    "In my free time I enjoy painting and I play tennis on weekends. "
+    "My goal is to speak better at meetings. "
+)
+
+# Report metrics compared against a baseline, and whether higher is better
+COMPARED_METRICS = {
+    "throughput_rps": True,
+    "error_rate": False,
+    "latency_ms.p50": False,
+    "latency_ms.p95": False,
+    "latency_ms.p99": False,
+    "submit_latency_ms.p95": False,
+}
+
+
+def percentile(values: List[float], q: float) -> Optional[float]:
+    """Nearest-rank percentile of a list of values.
+
+    Args:
+        values: Sample values
+        q: Percentile between 0 and 100
+
+    Returns:
+        Optional[float]: Percentile value, or None for an empty sample
+    """
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = max(1, -(-len(ordered) * q // 100))
+    return ordered[int(rank) - 1]
+
+
+def summarize(values: List[float]) -> Dict[str, Optional[float]]:
+    """Summarize latencies in milliseconds.
+
+    Args:
+        values: Latencies in milliseconds
+
+    Returns:
+        Dict[str, Optional[float]]: p50, p95, p99, mean and max
+    """
+    return {
+        "p50": percentile(values, 50),
+        "p95": percentile(values, 95),
+        "p99": percentile(values, 99),
+        "mean": sum(values) / len(values) if values else None,
+        "max": max(values) if values else None,
+    }
+
+
+async def login(client: httpx.AsyncClient, username: str, password: str) -> str:
+    """Get an access token for the load-test user."""
+    response = await client.post("/auth/token", data={"username": username, "password": password})
+    response.raise_for_status()
+    return response.json()["access_token"]
+
+
+def make_request(args, client: httpx.AsyncClient, submit_latencies: List[float]) -> Callable[[], Awaitable[str]]:
+    """Build the coroutine function sending one request of the scenario.
+
+    The coroutine returns the outcome: 'ok', an HTTP status code or an
+    exception class name. Transcriptions are timed until their job finishes
+    (unless --no-wait-jobs); the time to queue them goes to submit_latencies.
+    """
+
+    def transcript() -> str:
+        # A unique suffix keeps the extraction cache from answering
+        return f"{TRANSCRIPT}Reference {uuid.uuid4().hex}."
+
+    async def transcriptions() -> str:
+        start = time.perf_counter()
+        response = await client.post("/transcriptions/", json={
+            "transcription": transcript(),
+            "cache_mode": "bypass",
+            "extraction_mode": args.extraction_mode,
+        })
+        if response.status_code != 202:
+            return str(response.status_code)
+        submit_latencies.append((time.perf_counter() - start) * 1000)
+        if not args.wait_jobs:
+            return "ok"
+        status_url = response.json()["status_url"]
+        while True:
+            await asyncio.sleep(args.poll_seconds)
+            status = await client.get(status_url)
+            if status.status_code != 200:
+                return str(status.status_code)
+            job = status.json()
+            if job["status"] in ("completed", "failed"):
+                return "ok" if job["status"] == "completed" else "job_failed"
+
+    async def generate() -> str:
+        url = f"/students/{args.student_id}/homework/{args.template_id}/generate/stream"
+        async with client.stream("POST", url, params={"cache_mode": "bypass"}) as response:
+            if response.status_code != 200:
+                return str(response.status_code)
+            outcome = "incomplete_stream"
+            async for line in response.aiter_lines():
+                if line.startswith("event: "):
+                    event = line[len("event: "):]
+                    if event == "done":
+                        outcome = "ok"
+                    elif event == "error":
+                        outcome = "stream_error"
+            return outcome
+
+    async def analyze() -> str:
+        response = await client.post("/transcriptions/analyze", json={
+            "transcription": transcript(), "tier": args.tier,
+        })
+        return "ok" if response.status_code == 200 else str(response.status_code)
+
+    return {"transcriptions": transcriptions, "generate": generate, "analyze": analyze}[args.scenario]
+
+
+async def run_load(send: Callable[[], Awaitable[str]], rps: float, duration: float,
+                   max_in_flight: int) -> Tuple[List[Tuple[float, str]], int, float]:
+    """Start requests at rps for duration seconds and wait for all of them.
+
+    Args:
+        send: Coroutine function sending one request and returning its outcome
+        rps: Target request rate
+        duration: Seconds during which requests are started
+        max_in_flight: Requests in flight beyond which new ones are dropped
+            (counted, not sent) so an overloaded server cannot exhaust the client
+
+    Returns:
+        Tuple[List[Tuple[float, str]], int, float]: Latency in ms and outcome
+            of every sent request, number of dropped requests, elapsed seconds
+    """
+    results: List[Tuple[float, str]] = []
+    in_flight = 0
+    dropped = 0
+
+    async def one() -> None:
+        nonlocal in_flight
+        start = time.perf_counter()
+        try:
+            outcome = await send()
+        except Exception as e:
+            outcome = type(e).__name__
+        results.append(((time.perf_counter() - start) * 1000, outcome))
+        in_flight -= 1
+
+    tasks = []
+    start = time.perf_counter()
+    for i in range(int(rps * duration)):
+        delay = start + i / rps - time.perf_counter()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        if in_flight >= max_in_flight:
+            dropped += 1
+            continue
+        in_flight += 1
+        tasks.append(asyncio.ensure_future(one()))
+    await asyncio.gather(*tasks)
+    return results, dropped, time.perf_counter() - start
+
+
+def build_report(args, results: List[Tuple[float, str]], dropped: int, elapsed: float,
+                 submit_latencies: List[float]) -> Dict[str, Any]:
+    """Assemble the JSON report of a run."""
+    outcomes = Counter(outcome for _, outcome in results)
+    succeeded = outcomes.pop("ok", 0)
+    sent = len(results)
+    report = {
+        "scenario": args.scenario,
+        "base_url": args.base_url,
+        "started_at": datetime.utcnow().isoformat(),
+        "target_rps": args.rps,
+        "duration_seconds": args.duration,
+        "elapsed_seconds": elapsed,
+        "requests": sent,
+        "succeeded": succeeded,
+        "dropped": dropped,
+        "errors": dict(outcomes),
+        "error_rate": (sent - succeeded) / sent if sent else 0.0,
+        "throughput_rps": succeeded / elapsed if elapsed else 0.0,
+        "latency_ms": summarize([latency for latency, outcome in results if outcome == "ok"]),
+    }
+    if submit_latencies:
+        report["submit_latency_ms"] = summarize(submit_latencies)
+    return report
+
+
+def compare(report: Dict[str, Any], baseline: Dict[str, Any], tolerance: float) -> List[str]:
+    """Compare a report with a baseline.
+
+    Args:
+        report: Report of this run
+        baseline: Previously saved report
+        tolerance: Relative change allowed before a metric counts as regressed
+
+    Returns:
+        List[str]: Descriptions of the regressed metrics
+    """
+    regressions = []
+    for metric, higher_is_better in COMPARED_METRICS.items():
+        current, previous = report, baseline
+        for key in metric.split("."):
+            current = (current or {}).get(key)
+            previous = (previous or {}).get(key)
+        if current is None or previous is None:
+            continue
+        change = (current - previous) / previous if previous else (1.0 if current else 0.0)
+        print(f"  {metric:<20} {previous:>10.3f} -> {current:>10.3f} ({change:+.1%})")
+        if (change < -tolerance) if higher_is_better else (change > tolerance):
+            regressions.append(f"{metric} {previous:.3f} -> {current:.3f}")
+    return regressions
+
+
+async def main(args) -> int:
+    headers = {}
+    timeout = httpx.Timeout(args.timeout)
+    limits = httpx.Limits(max_connections=args.max_in_flight, max_keepalive_connections=args.max_in_flight)
+    async with httpx.AsyncClient(base_url=args.base_url, timeout=timeout, limits=limits) as client:
+        if args.token:
+            headers["Authorization"] = f"Bearer {args.token}"
+        elif args.username:
+            headers["Authorization"] = f"Bearer {await login(client, args.username, args.password)}"
+        client.headers.update(headers)
+
+        submit_latencies: List[float] = []
+        send = make_request(args, client, submit_latencies)
+        print(f"Running {args.scenario} at {args.rps:g} req/s for {args.duration:g}s against {args.base_url}")
+        results, dropped, elapsed = await run_load(send, args.rps, args.duration, args.max_in_flight)
+
+    report = build_report(args, results, dropped, elapsed, submit_latencies)
+    latency = report["latency_ms"]
+    print(f"  {report['succeeded']}/{report['requests']} succeeded, {dropped} dropped, "
+          f"throughput {report['throughput_rps']:.2f} req/s, error rate {report['error_rate']:.1%}")
+    if latency["p50"] is not None:
+        print(f"  latency p50 {latency['p50']:.0f} ms, p95 {latency['p95']:.0f} ms, p99 {latency['p99']:.0f} ms")
+    if report["errors"]:
+        print(f"  errors: {report['errors']}")
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"Report written to {args.output}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        print(f"Compared with {args.compare}:")
+        regressions = compare(report, baseline, args.tolerance)
+        if regressions:
+            print("Regressions: " + "; ".join(regressions))
+            return 1
+        print("No regressions")
+    return 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--base-url", default="http://127.0.0.1:8002", help="API base URL")
+    parser.add_argument("--scenario", choices=SCENARIOS, default="transcriptions", help="Endpoint to load")
+    parser.add_argument("--rps", type=float, default=5.0, help="Target requests per second")
+    parser.add_argument("--duration", type=float, default=30.0, help="Seconds to send requests for")
+    parser.add_argument("--max-in-flight", type=int, default=200, help="Concurrent request cap")
+    parser.add_argument("--timeout", type=float, default=120.0, help="Per-request timeout in seconds")
+    parser.add_argument("--token", help="Access token; or use --username and --password")
+    parser.add_argument("--username", help="User to log in as")
+    parser.add_argument("--password", help="Password of --username")
+    parser.add_argument("--extraction-mode", choices=("llm", "hybrid", "chunked"), default="llm",
+                        help="Extraction mode for the transcriptions scenario")
+    parser.add_argument("--wait-jobs", action=argparse.BooleanOptionalAction, default=True,
+                        help="Poll transcription jobs until they finish")
+    parser.add_argument("--poll-seconds", type=float, default=0.2, help="Job polling interval")
+    parser.add_argument("--student-id", type=int, help="Student for the generate scenario")
+    parser.add_argument("--template-id", type=int, help="Homework template for the generate scenario")
+    parser.add_argument("--tier", default="fast", help="Analyzer tier for the analyze scenario")
+    parser.add_argument("--output", help="Write the JSON report to this file")
+    parser.add_argument("--compare", help="Baseline report to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.1, help="Allowed relative regression")
+    args = parser.parse_args()
+    if args.scenario == "generate" and (args.student_id is None or args.template_id is None):
+        parser.error("the generate scenario needs --student-id and --template-id")
+    sys.exit(asyncio.run(main(args)))
@@ -0,0 +1,82 @@
+"""Micro-benchmark for the combined regex PatternScanner.
+
+Compares one re.search per pattern over the full transcript with a single
+PatternScanner scan, for pattern sets of a few up to several hundred keyed
+patterns. Both approaches must return the same matches.
+
+Usage:
+    python benchmarks/pattern_scanner_benchmark.py [--size 100000] [--repeat 5]
+"""
+
+import argparse
+import os
+import re
+import statistics
+import sys
+import time
+
+# Add the backend directory to the Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.services.conversation_analyzer import ConversationAnalyzer
+from app.services.pattern_scanner import PatternScanner
+
+FILLER = (
+    "I grew up in a small town and moved here with my family. On weekends I like to cook "
+    "and visit the market. My English is getting better but I still need practice.\n"
+)
+FACTS = "I am 34 years old. I have 10 years of experience. I have been 3 years in Canada.\n"
+
+
+def make_patterns(count: int) -> dict:
+    """Build the analyzer patterns plus generated ones up to count entries."""
+    patterns = dict(ConversationAnalyzer.patterns)
+    for i in range(count - len(patterns)):
+        patterns[f"generated_{i}"] = rf"\b(\d+)\s*(?:times|hours)\s*(?:a|per)\s*topic{i}\b"
+    return patterns
+
+
+def search_each(patterns: dict, text: str) -> dict:
+    """Reference implementation: one re.search per pattern."""
+    found = {}
+    for key, compiled in patterns.items():
+        match = compiled.search(text)
+        if match:
+            found[key] = match.group(0)
+    return found
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size", type=int, default=100_000, help="Transcript size in characters")
+    parser.add_argument("--repeat", type=int, default=5, help="Timed runs per measurement")
+    args = parser.parse_args()
+
+    # Facts appear at the end so both approaches scan most of the text
+    text = FILLER * (args.size // len(FILLER)) + FACTS
+    for count in (3, 50, 200, 500):
+        patterns = make_patterns(count)
+        compiled = {key: re.compile(pattern, re.IGNORECASE) for key, pattern in patterns.items()}
+        scanner = PatternScanner(patterns)
+        if scanner.scan(text) != search_each(compiled, text):
+            raise SystemExit(f"{count} patterns: scanner output differs from per-pattern search")
+
+        timings = {"per-pattern": [], "scanner": []}
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            search_each(compiled, text)
+            timings["per-pattern"].append(time.perf_counter() - start)
+            start = time.perf_counter()
+            scanner.scan(text)
+            timings["scanner"].append(time.perf_counter() - start)
+
+        per_pattern = statistics.median(timings["per-pattern"])
+        combined = statistics.median(timings["scanner"])
+        print(
+            f"{count:>4} patterns: per-pattern {per_pattern * 1000:8.2f} ms | "
+            f"scanner {combined * 1000:8.2f} ms | speedup {per_pattern / combined:5.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
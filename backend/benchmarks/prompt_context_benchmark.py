@@ -0,0 +1,71 @@
+"""Benchmark of prompt context size: Python repr against compact, budgeted JSON.
+
+Builds the generation context for synthetic students with sparse and rich
+profiles and compares the tokens of the previous repr-formatted context with
+the compact JSON built by ContentGenerationService at several token budgets.
+
+Usage:
+    python benchmarks/prompt_context_benchmark.py [--budgets 1500 400 200]
+"""
+
+import argparse
+import os
+import sys
+from types import SimpleNamespace
+
+# Add the backend directory to the Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import httpx
+
+from app.services.ai_gateway import AIGateway
+from app.services.content_generator import ContentGenerationService
+from app.services.prompt_context import TokenCounter
+
+TEMPLATE = {
+    "name": "Talking about work",
+    "objective": "Practice present simple and work vocabulary through questions about the student's job.",
+    "base_questions": [f"Question {i}: describe a typical task at your workplace." for i in range(1, 16)],
+}
+
+
+def make_student(rich: bool) -> SimpleNamespace:
+    """Build a stand-in Student; sparse profiles leave most fields empty."""
+    return SimpleNamespace(
+        first_name="Maria",
+        last_name="Lopez",
+        proficiency_level="intermediate",
+        interests_hobbies=[
+            SimpleNamespace(category="hobbies", name=name)
+            for name in (["painting", "hiking", "jazz", "cooking", "tennis", "chess"] if rich else [])
+        ],
+        learning_context=SimpleNamespace(
+            learning_goals="Speak confidently in meetings and write clearer emails to clients." if rich else None,
+            preferred_learning_style="visual" if rich else None,
+            challenges="Phrasal verbs, pronunciation of th, and listening to fast speakers. " * (4 if rich else 0) or None,
+        ),
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--budgets", type=int, nargs="+", default=[1500, 400, 200], help="Token budgets")
+    args = parser.parse_args()
+
+    gateway = AIGateway(httpx.AsyncClient(), "http://unused", "unused")
+    counter = TokenCounter(ContentGenerationService.MODEL)
+    print(f"Token counts are {'exact (tiktoken)' if counter.exact else 'estimated'}")
+    for label, rich in (("sparse", False), ("rich", True)):
+        student = make_student(rich)
+        baseline = ContentGenerationService(gateway)
+        context = baseline.build_context(student, TEMPLATE)
+        print(f"{label} profile: repr context {counter.count(str(context))} tokens")
+        for budget in args.budgets:
+            service = ContentGenerationService(gateway, context_token_budget=budget)
+            _, usage = service.prepare_request(context)
+            print(f"  budget {budget:>5}: compact context {usage['context_tokens']} tokens, "
+                  f"trimmed {', '.join(usage['trimmed_fields']) or 'nothing'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""Benchmark of class-wide generation: full per-student content against skeleton plus slots.
+
+Personalizes one template for a synthetic class with generate_for_class in
+both modes, against a local fake AI provider whose latency grows with the
+completion length. Reports, per class, the prompt tokens counted locally, the
+completion tokens reported by the provider and the wall-clock time.
+
+Usage:
+    python benchmarks/skeleton_generation_benchmark.py [--students 30] [--fan-out 8]
+        [--latency-ms 300] [--ms-per-token 10]
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+# Add the backend directory to the Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.core.config import get_settings
+from app.core.http_client import create_http_client
+from app.services.ai_gateway import AIGateway
+from app.services.batch_generation import BatchGenerationJob, generate_for_class
+from app.services.content_generator import GENERATION_MODES, ContentGenerationService
+from content_cache_benchmark import make_student
+from fake_ai_provider import start_server
+from prompt_context_benchmark import TEMPLATE
+
+
+class DiscardingSession:
+    """Stand-in database session that drops the generated rows."""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def add_all(self, rows):
+        pass
+
+    def flush(self):
+        pass
+
+    def commit(self):
+        pass
+
+
+async def benchmark(args, url: str) -> None:
+    students = [make_student(i) for i in range(args.students)]
+    for index, student in enumerate(students):
+        student.student_id = index
+    client = create_http_client(get_settings())
+    gateway = AIGateway(client, url, "fake-key", requests_per_minute=1_000_000, tokens_per_minute=10_000_000)
+    service = ContentGenerationService(gateway)
+    try:
+        results = {}
+        for mode in GENERATION_MODES:
+            job = BatchGenerationJob(class_id=1, template_id=1, total=len(students), mode=mode)
+            start = time.perf_counter()
+            await generate_for_class(job, service, students, TEMPLATE, DiscardingSession, fan_out=args.fan_out)
+            elapsed = time.perf_counter() - start
+            results[mode] = (job.prompt_tokens, job.completion_tokens, elapsed)
+            print(f"{mode:<9} {job.completed}/{job.total} students   prompt {job.prompt_tokens:7d} tokens   "
+                  f"completion {job.completion_tokens:7d} tokens   {elapsed:6.2f} s   {job.error or ''}")
+
+        full, skeleton = results["full"], results["skeleton"]
+        print(f"reduction: prompt {1 - skeleton[0] / full[0]:.0%}, completion {1 - skeleton[1] / full[1]:.0%}, "
+              f"time {1 - skeleton[2] / full[2]:.0%}")
+    finally:
+        await client.aclose()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--students", type=int, default=30, help="Students in the class")
+    parser.add_argument("--fan-out", type=int, default=8, help="Concurrent generations")
+    parser.add_argument("--latency-ms", type=float, default=300.0, help="Fixed latency of each response")
+    parser.add_argument("--ms-per-token", type=float, default=10.0, help="Extra latency per completion token")
+    args = parser.parse_args()
+
+    server, url = start_server(latency_ms=args.latency_ms, ms_per_token=args.ms_per_token)
+    asyncio.run(benchmark(args, url))
+
+
+if __name__ == "__main__":
+    main()
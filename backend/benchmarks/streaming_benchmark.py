@@ -0,0 +1,69 @@
+"""Benchmark of time to first content for streamed and buffered generation.
+
+Generates content for one student against a local fake AI provider, once with
+ContentGenerationService.generate (which waits for the whole completion) and
+once with generate_stream, and reports the time until the first piece of
+content is available and until generation is complete.
+
+Usage:
+    python benchmarks/streaming_benchmark.py [--latency-ms 5000] [--repeat 3]
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+
+# Add the backend directory to the Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.core.config import get_settings
+from app.core.http_client import create_http_client
+from app.services.ai_gateway import AIGateway
+from app.services.content_generator import ContentGenerationService
+from content_cache_benchmark import TEMPLATE, make_student
+from fake_ai_provider import start_server
+
+
+async def benchmark(args, url: str) -> None:
+    client = create_http_client(get_settings())
+    service = ContentGenerationService(AIGateway(client, url, "fake-key"))
+    student = make_student(0)
+    buffered, streamed_first, streamed_total = [], [], []
+    try:
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            await service.generate(student, TEMPLATE)
+            buffered.append(time.perf_counter() - start)
+
+            start = time.perf_counter()
+            first = None
+            async for _ in service.generate_stream(student, TEMPLATE):
+                if first is None:
+                    first = time.perf_counter() - start
+            streamed_first.append(first)
+            streamed_total.append(time.perf_counter() - start)
+    finally:
+        await client.aclose()
+
+    print(f"buffered   first content {statistics.median(buffered) * 1000:8.1f} ms   "
+          f"complete {statistics.median(buffered) * 1000:8.1f} ms")
+    print(f"streamed   first content {statistics.median(streamed_first) * 1000:8.1f} ms   "
+          f"complete {statistics.median(streamed_total) * 1000:8.1f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--latency-ms", type=float, default=5000.0, help="Stub server generation time")
+    parser.add_argument("--chunks", type=int, default=50, help="Chunks per streamed completion")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs")
+    args = parser.parse_args()
+
+    server, url = start_server(latency_ms=args.latency_ms, stream_chunks=args.chunks)
+    asyncio.run(benchmark(args, url))
+
+
+if __name__ == "__main__":
+    main()
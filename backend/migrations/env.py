@@ -12,7 +12,7 @@ from app.db.models import (
     InterestHobby, LearningContext, CulturalElements, SocialAspects,
     Professor, Class, StudentClass, InterviewTemplate, Interview,
     HomeworkTemplate, PersonalizedHomework, ActivityTemplate,
-    PersonalizedActivity, ActivityGroup
+    PersonalizedActivity, ActivityGroup, TranscriptionJob
 )
 
 # this is the Alembic Config object, which provides
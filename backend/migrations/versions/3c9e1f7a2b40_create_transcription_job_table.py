@@ -0,0 +1,49 @@
+"""create transcription job table
+
+Revision ID: 3c9e1f7a2b40
+Revises: a5cd34adc8f8
+Create Date: 2026-10-17 10:12:31.402118
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3c9e1f7a2b40'
+down_revision: Union[str, None] = 'a5cd34adc8f8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('transcriptionjob',
+    sa.Column('job_id', sa.Integer(), nullable=False),
+    sa.Column('status', sa.String(), nullable=False),
+    sa.Column('stage', sa.String(), nullable=True),
+    sa.Column('transcription', sa.String(), nullable=False),
+    sa.Column('cache_mode', sa.String(), nullable=False),
+    sa.Column('attempts', sa.Integer(), nullable=False),
+    sa.Column('worker_id', sa.String(), nullable=True),
+    sa.Column('student_id', sa.Integer(), nullable=True),
+    sa.Column('submitted_by', sa.Integer(), nullable=True),
+    sa.Column('result', postgresql.JSONB(astext_type=sa.Text()), nullable=True),
+    sa.Column('error', sa.String(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('started_at', sa.DateTime(), nullable=True),
+    sa.Column('finished_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['student_id'], ['student.student_id'], ),
+    sa.ForeignKeyConstraint(['submitted_by'], ['user.user_id'], ),
+    sa.PrimaryKeyConstraint('job_id')
+    )
+    op.create_index(op.f('ix_transcriptionjob_status'), 'transcriptionjob', ['status'], unique=False)
+    op.create_index(op.f('ix_transcriptionjob_created_at'), 'transcriptionjob', ['created_at'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_transcriptionjob_created_at'), table_name='transcriptionjob')
+    op.drop_index(op.f('ix_transcriptionjob_status'), table_name='transcriptionjob')
+    op.drop_table('transcriptionjob')
@@ -0,0 +1,29 @@
+"""add transcription job extraction mode
+
+Revision ID: 8e41d2c6f915
+Revises: 3c9e1f7a2b40
+Create Date: 2026-10-17 14:03:52.615230
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8e41d2c6f915'
+down_revision: Union[str, None] = '3c9e1f7a2b40'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('transcriptionjob', sa.Column('extraction_mode', sa.String(), nullable=False, server_default='llm'))
+    op.add_column('transcriptionjob', sa.Column('extraction_report', postgresql.JSONB(astext_type=sa.Text()), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('transcriptionjob', 'extraction_report')
+    op.drop_column('transcriptionjob', 'extraction_mode')
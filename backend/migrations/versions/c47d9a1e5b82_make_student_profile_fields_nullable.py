@@ -0,0 +1,65 @@
+"""make student profile fields nullable
+
+Revision ID: c47d9a1e5b82
+Revises: 8e41d2c6f915
+Create Date: 2026-10-17 18:21:07.482913
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c47d9a1e5b82'
+down_revision: Union[str, None] = '8e41d2c6f915'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Profile columns a transcript may not give, by table
+PROFILE_COLUMNS = {
+    'basicinformation': [
+        ('date_of_birth', sa.Date()), ('email', sa.String()), ('phone', sa.String()),
+        ('native_language', sa.String()), ('current_address', sa.String()),
+    ],
+    'professionalbackground': [
+        ('current_occupation', sa.String()), ('company', sa.String()), ('industry', sa.String()),
+        ('work_responsibilities', sa.String()), ('years_of_experience', sa.Integer()),
+        ('education_level', sa.String()),
+    ],
+    'personalbackground': [
+        ('hometown', sa.String()), ('country_of_origin', sa.String()), ('family_background', sa.String()),
+        ('life_experiences', sa.String()), ('personal_goals', sa.String()),
+    ],
+    'interesthobby': [
+        ('description', sa.String()), ('experience_years', sa.Integer()), ('frequency', sa.String()),
+    ],
+    'learningcontext': [
+        ('learning_goals', sa.String()), ('preferred_learning_style', sa.String()),
+        ('previous_language_experience', sa.String()), ('challenges', sa.String()),
+        ('strengths', sa.String()), ('areas_for_improvement', sa.String()),
+    ],
+    'culturalelements': [
+        ('cultural_background', sa.String()), ('traditions', sa.String()), ('value_systems', sa.String()),
+        ('cultural_practices', sa.String()), ('dietary_preferences', sa.String()),
+    ],
+    'socialaspects': [
+        ('communication_style', sa.String()), ('group_work_preference', sa.String()),
+        ('social_interests', sa.String()), ('community_involvement', sa.String()),
+        ('interaction_preferences', sa.String()),
+    ],
+}
+
+
+def upgrade() -> None:
+    for table, columns in PROFILE_COLUMNS.items():
+        for column, type_ in columns:
+            op.alter_column(table, column, existing_type=type_, nullable=True)
+
+
+def downgrade() -> None:
+    # Fails if rows saved from partial extractions still hold nulls
+    for table, columns in PROFILE_COLUMNS.items():
+        for column, type_ in columns:
+            op.alter_column(table, column, existing_type=type_, nullable=False)
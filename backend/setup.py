@@ -11,7 +11,7 @@ setup(
         "alembic>=1.13.0",
         "psycopg2-binary>=2.9.9",
         "python-multipart>=0.0.6",
-        "httpx>=0.26.0",
+        "httpx[http2]>=0.26.0",
         "pydantic-settings>=2.1.0",
         "python-jose[cryptography]>=3.3.0",
         "passlib[bcrypt]>=1.7.4",
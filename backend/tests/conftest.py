@@ -0,0 +1,21 @@
+"""Shared test setup."""
+
+import os
+import sys
+
+import pytest
+import spacy
+
+# Add the backend directory to the Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.services import conversation_analyzer  # noqa: E402
+
+
+@pytest.fixture
+def blank_nlp(monkeypatch):
+    """Blank English pipeline with a sentencizer, standing in for the trained models."""
+    nlp = spacy.blank("en")
+    nlp.add_pipe("sentencizer")
+    monkeypatch.setattr(conversation_analyzer, "get_model", lambda name, exclude=(): nlp)
+    return nlp
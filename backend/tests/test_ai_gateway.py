@@ -0,0 +1,86 @@
+"""Tests for the AI gateway's streaming and rate limiting."""
+
+import asyncio
+import json
+from types import SimpleNamespace
+
+import httpx
+import pytest
+
+from app.services import ai_gateway
+from app.services.ai_gateway import AIGateway, AIServiceError
+
+
+def stream_gateway(body: bytes) -> AIGateway:
+    """Gateway whose AI service answers every request with the given stream body."""
+    transport = httpx.MockTransport(lambda request: httpx.Response(
+        200, headers={"content-type": "text/event-stream"}, content=body
+    ))
+    client = httpx.AsyncClient(transport=transport)
+    return AIGateway(client, "http://ai.test", "key", failure_threshold=1)
+
+
+async def collect(gateway: AIGateway):
+    return [delta async for delta in gateway.stream_chat_completion({"messages": []})]
+
+
+def test_stream_yields_content_deltas():
+    gateway = stream_gateway(
+        b'data: {"choices": [{"delta": {"content": "Hel"}}]}\n\n'
+        b'data: {"choices": [{"delta": {"content": "lo"}}]}\n\n'
+        b'data: [DONE]\n\n'
+    )
+
+    assert asyncio.run(collect(gateway)) == ["Hel", "lo"]
+    assert gateway.stats()["failures"] == 0
+    assert gateway.breaker.state == "closed"
+
+
+@pytest.mark.parametrize("event", [b"data: {not json", b'data: ["not", "a", "chunk"]'])
+def test_malformed_stream_event_is_a_provider_failure(event):
+    gateway = stream_gateway(b'data: {"choices": [{"delta": {"content": "Hi"}}]}\n\n' + event + b"\n\n")
+
+    with pytest.raises(AIServiceError):
+        asyncio.run(collect(gateway))
+    assert gateway.stats()["failures"] == 1
+    assert gateway.breaker.state == "open"
+
+
+class FakeClock:
+    """Monotonic clock that only advances when the gateway sleeps."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+    async def sleep(self, delay: float) -> None:
+        self.now += delay
+
+
+def test_large_request_is_charged_in_full_against_the_token_budget(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(ai_gateway, "time", SimpleNamespace(monotonic=clock.monotonic))
+    monkeypatch.setattr(ai_gateway.asyncio, "sleep", clock.sleep)
+
+    def answer(request):
+        used = json.loads(request.content)["max_tokens"]
+        return httpx.Response(200, json={"choices": [], "usage": {"total_tokens": used}})
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(answer))
+    gateway = AIGateway(client, "http://ai.test", "key", requests_per_minute=600, tokens_per_minute=60_000)
+
+    async def run():
+        await gateway.chat_completion({"messages": [], "max_tokens": 10_000})
+        first_done = clock.now
+        await gateway.chat_completion({"messages": [], "max_tokens": 1_000})
+        return first_done, clock.now
+
+    first_done, second_done = asyncio.run(run())
+
+    # 1000 tokens per second: the first request starts on the full bucket's
+    # 1000 tokens and owes 9000 more, so the next one waits 9 + 1 seconds
+    assert first_done == 0.0
+    assert second_done == pytest.approx(10.0)
+    assert gateway.stats()["throttle_wait_seconds"] == pytest.approx(10.0)
@@ -0,0 +1,135 @@
+"""Tests for class-wide batch homework generation."""
+
+import asyncio
+import itertools
+import json
+import threading
+
+from app.db.models import PersonalizedHomework, Student
+from app.services.batch_generation import BatchGenerationJob, BatchJobRegistry, generate_for_class
+from app.services.content_generator import ContentGenerationService
+
+STUDENTS = [Student(student_id=i, first_name=f"S{i}", last_name="L", proficiency_level="B1") for i in (1, 2, 3)]
+
+
+class FakeDatabase:
+    """Stores homework in memory and hands out sessions like a session factory."""
+
+    def __init__(self, students, broken_student=None):
+        self.students = students
+        self.broken_student = broken_student
+        self.saved = []
+        self.commits = 0
+        self.threads = set()
+        self._ids = itertools.count(100)
+
+    def __call__(self):
+        return FakeSession(self)
+
+
+class FakeSession:
+    def __init__(self, db):
+        self.db = db
+        self.pending = []
+
+    def __enter__(self):
+        self.db.threads.add(threading.get_ident())
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def exec(self, statement):
+        students = self.db.students
+        return type("Result", (), {"unique": lambda self: self, "all": lambda self: list(students)})()
+
+    def add(self, obj):
+        self.pending.append(obj)
+
+    def flush(self):
+        for obj in self.pending:
+            obj.homework_id = next(self.db._ids)
+
+    def commit(self):
+        if any(obj.student_id == self.db.broken_student for obj in self.pending):
+            raise RuntimeError("database is down")
+        self.db.commits += 1
+        self.db.saved.extend(self.pending)
+
+
+class FakeService:
+    """Content service that fails for student 2 if asked to."""
+
+    parse_content = staticmethod(ContentGenerationService.parse_content)
+
+    def __init__(self, failing_student=None):
+        self.failing_student = failing_student
+
+    async def generate(self, student, template, report=None):
+        if student.student_id == self.failing_student:
+            raise ValueError("unusable answer")
+        return json.dumps({"questions": [f"Question for {student.first_name}"]})
+
+
+def run_job(db, service):
+    job = BatchGenerationJob(class_id=1, template_id=7, total=len(db.students))
+    asyncio.run(generate_for_class(job, service, [s.student_id for s in db.students], {}, db, fan_out=2))
+    return job
+
+
+def test_each_homework_is_committed_off_the_event_loop():
+    db = FakeDatabase(STUDENTS)
+
+    job = run_job(db, FakeService())
+
+    assert job.status == "completed"
+    assert (job.completed, job.failed, job.failures) == (3, 0, {})
+    assert db.commits == 3
+    assert sorted(job.homework_ids) == sorted(h.homework_id for h in db.saved)
+    assert all(isinstance(h, PersonalizedHomework) and h.template_id == 7 for h in db.saved)
+    assert threading.get_ident() not in db.threads
+
+
+def test_failed_generation_is_stored_and_recorded():
+    db = FakeDatabase(STUDENTS)
+
+    job = run_job(db, FakeService(failing_student=2))
+
+    assert (job.completed, job.failed) == (2, 1)
+    assert job.failures == {2: "unusable answer"}
+    failed = [h for h in db.saved if h.student_id == 2]
+    assert failed[0].generation_status == "failed"
+    assert len(db.saved) == 3
+
+
+def test_storage_failure_loses_only_that_student():
+    db = FakeDatabase(STUDENTS, broken_student=3)
+
+    job = run_job(db, FakeService())
+
+    assert job.status == "completed"
+    assert (job.completed, job.failed) == (2, 1)
+    assert job.failures[3].startswith("Could not store homework")
+    assert sorted(h.student_id for h in db.saved) == [1, 2]
+    assert len(job.homework_ids) == 2
+
+
+def test_registry_records_a_crashed_job():
+    registry = BatchJobRegistry()
+    job = BatchGenerationJob(class_id=1, template_id=7, total=0)
+
+    async def crash():
+        raise RuntimeError("boom")
+
+    async def run():
+        registry.start(job, crash())
+        assert job.task is not None
+        await asyncio.gather(job.task, return_exceptions=True)
+        await asyncio.sleep(0)
+
+    asyncio.run(run())
+
+    assert registry.get(job.job_id) is job
+    assert job.status == "failed"
+    assert "boom" in job.error
+    assert job.finished_at is not None
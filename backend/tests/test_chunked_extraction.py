@@ -0,0 +1,91 @@
+"""Tests for merging and running chunked transcript extraction."""
+
+import asyncio
+import json
+import re
+
+from app.services.student_extractor import StudentExtractionService, merge_partial_extractions
+
+TRANSCRIPT = "My name is Ana Lopez.\n\nI play chess on weekends.\n\nI work as a nurse."
+
+
+class ChunkGateway:
+    """Answers each chunk request with the answer for its part number."""
+
+    def __init__(self, answers):
+        self.answers = answers
+        self.parts = []
+
+    async def chat_completion(self, payload):
+        part = int(re.search(r"This is part (\d+) of", payload["messages"][1]["content"]).group(1))
+        self.parts.append(part)
+        return {
+            "choices": [{"message": {"content": json.dumps(self.answers[part - 1])}}],
+            "usage": {"total_tokens": 10 * part, "prompt_tokens": 8},
+        }
+
+
+def test_interests_are_deduplicated_by_category_and_name():
+    merged, sources, conflicts = merge_partial_extractions([
+        {"interests_hobbies": [{"category": "Games", "name": "Chess", "frequency": None}]},
+        {"interests_hobbies": [
+            {"category": "games ", "name": "chess", "frequency": "weekly", "description": "Plays online"},
+            {"category": "Sports", "name": "Chess"},
+            {"category": "Sports", "name": ""},
+        ]},
+    ])
+
+    assert merged["interests_hobbies"] == [
+        # Attributes missing from the first mention are filled from later ones
+        {"category": "Games", "name": "Chess", "frequency": "weekly", "description": "Plays online"},
+        {"category": "Sports", "name": "Chess"},
+    ]
+    assert sources["interests_hobbies"] == 0
+    assert conflicts == []
+
+
+def test_first_scalar_value_is_kept_and_different_ones_reported():
+    merged, sources, conflicts = merge_partial_extractions([
+        {"first_name": None, "basic_info.phone": "555-1234"},
+        {"first_name": "Ana", "basic_info.phone": "555-9999"},
+        {"first_name": " ana ", "basic_info.phone": ""},
+    ])
+
+    assert merged == {"first_name": "Ana", "basic_info.phone": "555-1234"}
+    assert sources == {"first_name": 1, "basic_info.phone": 0}
+    # Differences in case and whitespace are not conflicts
+    assert conflicts == [{
+        "field": "basic_info.phone",
+        "kept": "555-1234",
+        "kept_chunk": 0,
+        "discarded": "555-9999",
+        "discarded_chunk": 1,
+    }]
+
+
+def test_extract_chunked_merges_chunks_and_reports_field_sources():
+    gateway = ChunkGateway([
+        {"first_name": "Ana", "last_name": "Lopez"},
+        {"interests_hobbies": [{"category": "Games", "name": "Chess"}], "last_name": "Perez"},
+        {"professional_background": {"current_occupation": "Nurse"}},
+    ])
+    service = StudentExtractionService(gateway, chunk_chars=30)
+
+    result = asyncio.run(service.extract_chunked(TRANSCRIPT))
+
+    assert sorted(gateway.parts) == [1, 2, 3]
+    assert result["chunks"] == 3
+    info = result["extracted_info"]
+    assert (info["first_name"], info["last_name"]) == ("Ana", "Lopez")
+    assert info["professional_background"] == {"current_occupation": "Nurse"}
+    assert info["interests_hobbies"] == [{"category": "Games", "name": "Chess"}]
+    sources = result["field_sources"]
+    assert sources["first_name"] == "chunk:0"
+    assert sources["interests_hobbies"] == "chunk:1"
+    assert sources["professional_background.current_occupation"] == "chunk:2"
+    assert sources["basic_info.email"] == "missing"
+    assert result["conflicts"] == [{
+        "field": "last_name", "kept": "Lopez", "kept_chunk": 0, "discarded": "Perez", "discarded_chunk": 1,
+    }]
+    assert result["usage"]["total_tokens"] == 60
+    assert len(result["latency_ms"]["chunks"]) == 3
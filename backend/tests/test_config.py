@@ -0,0 +1,33 @@
+"""Tests for the application settings."""
+
+import pytest
+
+from app.core.config import get_settings
+
+
+@pytest.fixture
+def fresh_settings():
+    """Clear the cached settings before and after the test."""
+    get_settings.cache_clear()
+    yield
+    get_settings.cache_clear()
+
+
+def test_environment_overrides_reach_get_settings(monkeypatch, fresh_settings):
+    monkeypatch.setenv("AI_SERVICE_URL", "http://127.0.0.1:8765")
+    monkeypatch.setenv("AI_SERVICE_KEY", "fake")
+    monkeypatch.setenv("TRANSCRIPTION_WORKERS", "0")
+    monkeypatch.setenv("EXTRACTION_MODELS", '["small", "large"]')
+
+    settings = get_settings()
+
+    assert settings.AI_SERVICE_URL == "http://127.0.0.1:8765"
+    assert settings.AI_SERVICE_KEY == "fake"
+    assert settings.TRANSCRIPTION_WORKERS == 0
+    assert settings.EXTRACTION_MODELS == ["small", "large"]
+
+
+def test_defaults_apply_without_overrides(monkeypatch, fresh_settings):
+    monkeypatch.delenv("AI_SERVICE_URL", raising=False)
+
+    assert get_settings().AI_SERVICE_URL == "https://api.openai.com/v1"
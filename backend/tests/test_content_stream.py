@@ -0,0 +1,103 @@
+"""Tests for the streaming homework generation endpoint."""
+
+import json
+import threading
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.api.routes import content
+from app.core.dependencies import get_content_generation_service, get_current_active_user
+from app.db.database import get_session
+from app.db.models import HomeworkTemplate, Student
+
+STUDENT = Student(student_id=1, first_name="Ana", last_name="L", proficiency_level="B1")
+TEMPLATE = HomeworkTemplate(
+    template_id=7, class_id=1, name="Past tense", objective="Practice", base_questions={"q": []}
+)
+
+
+class RequestSession:
+    """Stands in for the request's session; the stream must not write to it."""
+
+    def __init__(self):
+        self.writes = []
+
+    def exec(self, statement):
+        return type("Result", (), {"unique": lambda self: self, "first": lambda self: STUDENT})()
+
+    def get(self, model, key):
+        return TEMPLATE
+
+    def add(self, obj):
+        self.writes.append(obj)
+
+    def commit(self):
+        self.writes.append("commit")
+
+
+class StreamingService:
+    def __init__(self):
+        self.loop_thread = None
+
+    async def generate_stream(self, student, template, cache_mode="use", report=None):
+        self.loop_thread = threading.get_ident()
+        for piece in ('{"questions": ', '["Q1"]}'):
+            yield piece
+
+    def parse_content(self, text):
+        return json.loads(text)
+
+
+def _events(body):
+    events = []
+    for block in body.split("\n\n"):
+        lines = dict(line.split(": ", 1) for line in block.splitlines() if not line.startswith(":"))
+        if lines:
+            events.append((lines["event"], json.loads(lines["data"])))
+    return events
+
+
+def _client(service, request_session):
+    app = FastAPI()
+    app.include_router(content.router)
+    app.dependency_overrides[get_content_generation_service] = lambda: service
+    app.dependency_overrides[get_session] = lambda: request_session
+    app.dependency_overrides[get_current_active_user] = lambda: object()
+    return TestClient(app)
+
+
+def test_stream_stores_homework_in_own_session_off_the_loop(monkeypatch):
+    stored = []
+
+    def fake_store(session_factory, homework):
+        stored.append((threading.get_ident(), homework))
+        return 42
+
+    monkeypatch.setattr(content, "store_homework", fake_store)
+    service = StreamingService()
+    request_session = RequestSession()
+
+    response = _client(service, request_session).post("/students/1/homework/7/generate/stream")
+
+    events = _events(response.text)
+    assert [name for name, _ in events] == ["token", "token", "done"]
+    assert events[-1][1]["homework_id"] == 42
+    assert events[-1][1]["content"] == {"questions": ["Q1"]}
+    (thread, homework), = stored
+    assert thread != service.loop_thread
+    assert (homework.student_id, homework.template_id) == (1, 7)
+    assert request_session.writes == []
+
+
+def test_stream_reports_storage_failure_as_error_event(monkeypatch):
+    def failing_store(session_factory, homework):
+        raise RuntimeError("database is down")
+
+    monkeypatch.setattr(content, "store_homework", failing_store)
+
+    response = _client(StreamingService(), RequestSession()).post("/students/1/homework/7/generate/stream")
+
+    name, data = _events(response.text)[-1]
+    assert name == "error"
+    assert "database is down" in data["detail"]
@@ -0,0 +1,92 @@
+"""Tests for the on-disk cache of parsed documents."""
+
+import pytest
+import spacy
+
+from app.services.doc_cache import DocCache
+
+
+@pytest.fixture
+def nlp():
+    nlp = spacy.blank("en")
+    nlp.add_pipe("sentencizer")
+    return nlp
+
+
+def _put(cache, nlp, text):
+    cache.put(nlp, text, nlp(text))
+
+
+def test_cached_document_round_trips_and_counts_lookups(tmp_path, nlp):
+    cache = DocCache(str(tmp_path))
+
+    assert cache.get(nlp, "I teach English. I like chess.") is None
+    _put(cache, nlp, "I teach English. I like chess.")
+    doc = cache.get(nlp, "I teach English. I like chess.")
+
+    assert [sent.text for sent in doc.sents] == ["I teach English.", "I like chess."]
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["entries"]) == (1, 1, 1)
+    assert stats["hit_rate"] == 0.5
+
+
+def test_model_version_or_pipeline_change_invalidates_entries(tmp_path, nlp):
+    cache = DocCache(str(tmp_path))
+    _put(cache, nlp, "Same text.")
+
+    nlp.meta["version"] = "9.9.9"
+    assert cache.get(nlp, "Same text.") is None
+
+    upgraded = spacy.blank("en")
+    upgraded.add_pipe("sentencizer")
+    upgraded.add_pipe("entity_ruler")
+    assert cache.key(upgraded, "Same text.") != cache.key(spacy.blank("en"), "Same text.")
+    assert cache.get(upgraded, "Same text.") is None
+
+
+def test_least_recently_used_entry_is_evicted(tmp_path, nlp):
+    cache = DocCache(str(tmp_path))
+    _put(cache, nlp, "alpha one")
+    _put(cache, nlp, "bravo two")
+    cache.max_bytes = cache.stats()["size_bytes"] + 8
+
+    # Reading alpha makes bravo the least recently used entry
+    assert cache.get(nlp, "alpha one") is not None
+    _put(cache, nlp, "charl six")
+
+    assert cache.get(nlp, "bravo two") is None
+    assert cache.get(nlp, "alpha one") is not None
+    assert cache.get(nlp, "charl six") is not None
+    stats = cache.stats()
+    assert stats["evictions"] == 1
+    assert stats["entries"] == 2
+    assert stats["size_bytes"] <= cache.max_bytes
+    assert len(list(cache.storage_path.glob("*/*.spacy"))) == 2
+
+
+def test_existing_entries_are_indexed_and_evicted_on_startup(tmp_path, nlp):
+    cache = DocCache(str(tmp_path))
+    for text in ("alpha one", "bravo two", "charl six"):
+        _put(cache, nlp, text)
+    size = cache.stats()["size_bytes"]
+
+    reopened = DocCache(str(tmp_path), max_bytes=size)
+    assert reopened.stats()["entries"] == 3
+    assert reopened.get(nlp, "bravo two") is not None
+
+    shrunk = DocCache(str(tmp_path), max_bytes=size // 2)
+    assert shrunk.stats()["evictions"] > 0
+    assert shrunk.stats()["size_bytes"] <= size // 2
+
+
+def test_clear_removes_every_entry(tmp_path, nlp):
+    cache = DocCache(str(tmp_path))
+    _put(cache, nlp, "alpha one")
+    _put(cache, nlp, "bravo two")
+
+    cache.clear()
+
+    assert cache.stats()["entries"] == 0
+    assert cache.stats()["size_bytes"] == 0
+    assert cache.get(nlp, "alpha one") is None
+    assert list(cache.storage_path.glob("*/*.spacy")) == []
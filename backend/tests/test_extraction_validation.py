@@ -0,0 +1,136 @@
+"""Tests for validating extracted student information and repairing invalid sections."""
+
+import asyncio
+import json
+
+import pytest
+
+from app.api.models.extraction import validate_extraction
+from app.services.student_extractor import StudentExtractionService, answer_problem
+
+STUDENT = {"first_name": "Maria", "last_name": "Lopez", "proficiency_level": "B1"}
+
+
+class ScriptedGateway:
+    """Answers chat completions with the given answers, in order."""
+
+    def __init__(self, *answers):
+        self.answers = list(answers)
+        self.requests = []
+
+    async def chat_completion(self, payload):
+        self.requests.append(payload)
+        content = json.dumps(self.answers.pop(0))
+        return {"choices": [{"message": {"content": content}}], "usage": {"total_tokens": 10}}
+
+
+def repair(gateway, data):
+    return asyncio.run(StudentExtractionService(gateway).validate_and_repair("transcript", data))
+
+
+def test_partial_section_keeps_its_values():
+    data = {**STUDENT, "basic_info": {"native_language": "Spanish", "current_address": " Boston ", "phone": ""}}
+
+    valid, errors = validate_extraction(data)
+
+    assert valid == {**STUDENT, "basic_info": {"native_language": "Spanish", "current_address": "Boston"}}
+    assert errors == {}
+
+
+def test_empty_section_is_left_out():
+    valid, errors = validate_extraction({**STUDENT, "social_aspects": {"traditions": None, "strengths": ""}})
+
+    assert valid == STUDENT
+    assert errors == {}
+
+
+def test_malformed_field_is_reported_and_the_rest_of_the_section_kept():
+    data = {**STUDENT, "professional_background": {"company": "Acme", "years_of_experience": "ten"}}
+
+    valid, errors = validate_extraction(data)
+
+    assert valid["professional_background"] == {"company": "Acme"}
+    assert [error["loc"] for error in errors["professional_background"]] == [("years_of_experience",)]
+
+
+def test_student_fields_and_interest_names_are_required():
+    data = {
+        "first_name": "Maria", "last_name": " ", "proficiency_level": "B1",
+        "interests_hobbies": [{"category": "sports", "name": "tennis"}, {"category": "music"}],
+    }
+
+    valid, errors = validate_extraction(data)
+
+    assert "first_name" not in valid
+    assert valid["interests_hobbies"] == [{"category": "sports", "name": "tennis"}]
+    assert {error["type"] for error in errors[""]} == {"value_error.blank"}
+    assert [error["loc"] for error in errors["interests_hobbies"]] == [(1, "name")]
+
+
+def test_missing_optional_fields_do_not_escalate():
+    answer = {**STUDENT, "basic_info": {"native_language": "Spanish"}}
+    paths = ["first_name", "last_name", "proficiency_level", "basic_info.phone", "basic_info.native_language"]
+
+    assert answer_problem(answer, paths, ["first_name", "last_name", "proficiency_level"]) is None
+    # Optional fields never count as missing, even if asked to require them
+    assert answer_problem(answer, paths, paths) is None
+
+
+def test_missing_student_field_escalates():
+    answer = {"first_name": "Maria", "last_name": None, "basic_info": {"date_of_birth": "yesterday"}}
+
+    assert answer_problem(answer, ["first_name", "last_name"], ["last_name"]) == "missing: last_name"
+    assert answer_problem(answer, ["last_name", "basic_info.date_of_birth"], ["last_name"]).startswith(
+        "invalid: basic_info.date_of_birth"
+    )
+
+
+def test_repair_skips_sections_that_are_only_incomplete():
+    gateway = ScriptedGateway()
+    data = {**STUDENT, "learning_context": {"learning_goals": "Speak at work"}}
+
+    valid, report = repair(gateway, data)
+
+    assert valid == data
+    assert gateway.requests == []
+    assert report == {"reprompted": [], "dropped": {}, "usage": {}}
+
+
+def test_repair_merges_the_second_answer_with_the_valid_fields():
+    gateway = ScriptedGateway({"professional_background": {"years_of_experience": 10}})
+    data = {**STUDENT, "professional_background": {"company": "Acme", "years_of_experience": "ten"}}
+
+    valid, report = repair(gateway, data)
+
+    assert valid["professional_background"] == {"company": "Acme", "years_of_experience": 10}
+    assert report["reprompted"] == ["professional_background"]
+    assert report["dropped"] == {}
+    assert report["usage"] == {"total_tokens": 10}
+
+
+def test_section_still_invalid_after_repair_keeps_its_valid_fields():
+    gateway = ScriptedGateway({"basic_info": {"date_of_birth": "unknown", "email": "maria@example.com"}})
+    data = {**STUDENT, "basic_info": {"native_language": "Spanish", "date_of_birth": "last spring"}}
+
+    valid, report = repair(gateway, data)
+
+    assert valid["basic_info"] == {"native_language": "Spanish", "email": "maria@example.com"}
+    assert list(report["dropped"]) == ["basic_info"]
+    assert report["dropped"]["basic_info"].startswith("date_of_birth:")
+
+
+def test_missing_student_field_is_asked_for_again():
+    gateway = ScriptedGateway({"first_name": "Maria", "last_name": "Lopez", "proficiency_level": "B2"})
+    data = {"first_name": "Maria", "last_name": "Lopez"}
+
+    valid, report = repair(gateway, data)
+
+    assert valid == {**STUDENT, "proficiency_level": "B2"}
+    assert report["reprompted"] == ["student"]
+
+
+def test_student_still_invalid_after_repair_raises():
+    gateway = ScriptedGateway({"first_name": "Maria"})
+
+    with pytest.raises(ValueError, match="Extracted student is invalid"):
+        repair(gateway, {"first_name": "Maria"})
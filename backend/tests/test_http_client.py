@@ -0,0 +1,102 @@
+"""Tests for the shared HTTP client's pool statistics."""
+
+import asyncio
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import httpx
+import pytest
+
+from app.core.http_client import PooledAsyncClient, pool_stats
+
+
+class OkHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        body = b"{}"
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server_url():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), OkHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+    server.server_close()
+
+
+def test_kept_alive_connection_is_counted_once(server_url):
+    async def run():
+        async with PooledAsyncClient() as client:
+            for _ in range(3):
+                (await client.get(f"{server_url}/ping")).raise_for_status()
+            return pool_stats(client)
+
+    stats = asyncio.run(run())
+
+    assert stats["requests"] == stats["responses"] == 3
+    assert stats["connections_opened"] == 1
+    assert stats["requests_per_connection"] == 3.0
+    assert stats["tls_handshakes"] == 0
+    assert stats["in_flight"] == 0
+
+
+def test_errors_and_concurrency_are_counted():
+    async def handler(request):
+        if request.url.path == "/down":
+            raise httpx.ConnectError("refused", request=request)
+        await asyncio.sleep(0.01)
+        return httpx.Response(500 if request.url.path == "/fail" else 200)
+
+    async def run():
+        client = PooledAsyncClient(transport=httpx.MockTransport(handler),
+                                   limits=httpx.Limits(max_connections=4))
+        async with client:
+            await asyncio.gather(*(client.get("http://ai.test/ok") for _ in range(3)))
+            await client.get("http://ai.test/fail")
+            with pytest.raises(httpx.ConnectError):
+                await client.get("http://ai.test/down")
+            return pool_stats(client)
+
+    stats = asyncio.run(run())
+
+    assert stats["requests"] == 5
+    assert stats["responses"] == 4
+    assert stats["errors"] == 1
+    assert stats["transport_errors"] == 1
+    assert stats["peak_in_flight"] == 3
+    assert stats["in_flight"] == 0
+    # The mock transport opens no connections
+    assert stats["connections_opened"] == 0
+    assert stats["requests_per_connection"] is None
+    assert stats["max_connections"] == 4
+
+
+def test_existing_trace_callback_still_receives_events(server_url):
+    events = []
+
+    async def trace(event_name, info):
+        events.append(event_name)
+
+    async def run():
+        async with PooledAsyncClient() as client:
+            await client.get(f"{server_url}/ping", extensions={"trace": trace})
+            return pool_stats(client)
+
+    stats = asyncio.run(run())
+
+    assert "connection.connect_tcp.complete" in events
+    assert stats["connections_opened"] == 1
+
+
+def test_plain_client_reports_no_stats():
+    assert pool_stats(httpx.AsyncClient()) == {}
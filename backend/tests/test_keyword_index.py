@@ -0,0 +1,86 @@
+"""Tests for the Aho-Corasick keyword index."""
+
+from typing import Dict, Iterable, Set
+
+import pytest
+
+from app.services.conversation_analyzer import ConversationAnalyzer
+from app.services.keyword_index import KeywordIndex
+
+
+def scan(groups: Dict[str, Iterable[str]], text: str) -> Dict[str, Set[str]]:
+    """Reference matcher: the per-keyword `in` scan the index replaced."""
+    hits: Dict[str, Set[str]] = {}
+    for group, keywords in groups.items():
+        for keyword in keywords:
+            if keyword and keyword in text:
+                hits.setdefault(group, set()).add(keyword)
+    return hits
+
+
+GROUPS = {
+    # Overlapping keywords: prefixes, suffixes and keywords inside others
+    "overlap": ["he", "she", "his", "hers", "her", "usher"],
+    "phrases": ["like to", "to", "o", "work from home", "home", "from"],
+    # Keywords shared between groups
+    "hobbies": ["enjoy", "hobby", "play"],
+    "interests": ["enjoy", "passion"],
+    "empty": [],
+}
+
+TEXTS = [
+    "",
+    "ushers",
+    "she said his hershey was hers",
+    "I would like to work from home",
+    "I enjoy my hobby and my passion",
+    # Substring matching, as before: no word boundaries
+    "the display is playful",
+    "hehehe shhe",
+    "no keywords here",
+]
+
+
+@pytest.mark.parametrize("text", TEXTS)
+def test_search_matches_per_keyword_scan(text):
+    assert KeywordIndex(GROUPS).search(text) == scan(GROUPS, text)
+
+
+def test_search_matches_per_keyword_scan_on_analyzer_keywords(blank_nlp):
+    analyzer = ConversationAnalyzer()
+    groups = {
+        "language": analyzer.LANGUAGE_INDICATORS,
+        "level": analyzer.LEVELS,
+        "level_indicator": analyzer.LEVEL_INDICATORS,
+        "job": analyzer.JOB_INDICATORS,
+        **analyzer.LOCATION_INDICATORS,
+        **{f"category:{name}": keywords for name, keywords in analyzer.categories.items()},
+    }
+    text = (
+        "My native language is Spanish and my English level is intermediate. "
+        "I grew up in Madrid, moved to Boston and now work as a nurse. "
+        "In my free time I like to play tennis, and I want to improve my grammar "
+        "because my workplace is hybrid and I often work from home."
+    ).lower()
+
+    assert analyzer._keyword_index.search(text) == scan(groups, text)
+
+
+def test_matching_is_case_sensitive_so_callers_lowercase():
+    index = KeywordIndex(GROUPS)
+
+    assert index.search("I ENJOY TENNIS") == scan(GROUPS, "I ENJOY TENNIS") == {}
+    assert index.search("I ENJOY TENNIS".lower()) == {
+        "hobbies": {"enjoy"}, "interests": {"enjoy"}, "phrases": {"o"},
+    }
+
+
+def test_category_edits_apply_after_rebuilding_the_index(blank_nlp):
+    analyzer = ConversationAnalyzer()
+    analyzer.categories["hobbies"] = analyzer.categories["hobbies"] + ["knitting"]
+
+    assert "category:hobbies" not in analyzer._keyword_index.search("i love knitting")
+
+    analyzer.build_keyword_index()
+
+    assert analyzer._keyword_index.search("i love knitting")["category:hobbies"] == {"knitting"}
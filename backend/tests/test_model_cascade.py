@@ -0,0 +1,131 @@
+"""Tests for the cheap-first model cascade."""
+
+import asyncio
+import json
+
+import pytest
+
+from app.services.model_cascade import ModelCascade
+from app.services.student_extractor import StudentExtractionService
+
+
+class StubGateway:
+    """Answers with a fixed response per model and records the models called."""
+
+    def __init__(self, responses):
+        self.responses = responses
+        self.models = []
+
+    async def chat_completion(self, payload):
+        self.models.append(payload["model"])
+        return self.responses[payload["model"]]
+
+
+def response(answer, total_tokens=100, prompt_tokens=80):
+    return {
+        "choices": [{"message": {"content": answer}}],
+        "usage": {"total_tokens": total_tokens, "prompt_tokens": prompt_tokens, "model": "ignored"},
+    }
+
+
+def check(response):
+    """Accept 'good', escalate 'bad' and reject anything else as unusable."""
+    answer = response["choices"][0]["message"]["content"]
+    if answer == "good":
+        return answer, None
+    if answer == "bad":
+        return answer, "missing: first_name"
+    raise ValueError("not an answer")
+
+
+def complete(cascade, gateway):
+    return asyncio.run(cascade.complete(gateway, {"model": "unset", "messages": []}, check))
+
+
+def test_first_accepted_answer_is_returned():
+    gateway = StubGateway({"cheap": response("good"), "strong": response("good")})
+    cascade = ModelCascade(["cheap", "strong"])
+
+    answer, report = complete(cascade, gateway)
+
+    assert answer == "good"
+    assert gateway.models == ["cheap"]
+    assert report["model"] == "cheap"
+    assert report["escalations"] == []
+    assert cascade.stats()["escalation_rate"] == 0.0
+
+
+def test_rejected_answer_escalates_to_the_next_model():
+    gateway = StubGateway({"cheap": response("bad"), "mid": response("nonsense"), "strong": response("good")})
+    cascade = ModelCascade(["cheap", "mid", "strong"])
+
+    answer, report = complete(cascade, gateway)
+
+    assert answer == "good"
+    assert gateway.models == ["cheap", "mid", "strong"]
+    assert report["model"] == "strong"
+    assert report["escalations"] == [
+        {"model": "cheap", "reason": "missing: first_name"},
+        {"model": "mid", "reason": "unusable: not an answer"},
+    ]
+    stats = cascade.stats()
+    assert stats["escalated"] == 1
+    assert stats["tiers"]["cheap"]["rejected_reasons"] == {"missing": 1}
+    assert stats["tiers"]["mid"]["rejected_reasons"] == {"unusable": 1}
+    assert stats["tiers"]["strong"]["accepted"] == 1
+
+
+def test_final_model_answer_is_returned_even_if_rejected():
+    gateway = StubGateway({"cheap": response("bad"), "strong": response("bad")})
+    cascade = ModelCascade(["cheap", "strong"])
+
+    answer, report = complete(cascade, gateway)
+
+    assert answer == "bad"
+    assert report["model"] == "strong"
+    assert [e["model"] for e in report["escalations"]] == ["cheap"]
+    assert cascade.stats()["tiers"]["strong"]["escalated"] == 0
+
+
+def test_unusable_final_answer_raises():
+    gateway = StubGateway({"cheap": response("bad"), "strong": response("nonsense")})
+
+    with pytest.raises(ValueError, match="not an answer"):
+        complete(ModelCascade(["cheap", "strong"]), gateway)
+
+
+def test_usage_and_latency_cover_every_model_tried():
+    gateway = StubGateway({"cheap": response("bad", 100, 80), "strong": response("good", 300, 200)})
+    cascade = ModelCascade(["cheap", "strong"])
+
+    _, report = complete(cascade, gateway)
+
+    # Only numeric counts are summed
+    assert report["usage"] == {"total_tokens": 400, "prompt_tokens": 280}
+    assert set(report["latency_ms"]) == {"cheap", "strong", "total"}
+    assert report["latency_ms"]["total"] >= report["latency_ms"]["cheap"] + report["latency_ms"]["strong"]
+    tiers = cascade.stats()["tiers"]
+    assert tiers["cheap"]["latency_ms"]["p50"] == report["latency_ms"]["cheap"]
+    assert tiers["strong"]["calls"] == 1
+
+
+def test_cascade_needs_a_model():
+    with pytest.raises(ValueError):
+        ModelCascade([])
+
+
+def test_incomplete_but_valid_extraction_is_not_escalated():
+    # The transcript gives the student fields and only part of basic_info
+    answer = json.dumps({
+        "first_name": "Maria", "last_name": "Lopez", "proficiency_level": "B1",
+        "basic_info": {"native_language": "Spanish", "phone": None},
+        "interests_hobbies": [{"category": "sports", "name": "tennis"}],
+    })
+    gateway = StubGateway({"cheap": response(answer), "strong": response(answer)})
+    cascade = ModelCascade(["cheap", "strong"])
+
+    result = asyncio.run(StudentExtractionService(gateway, cascade=cascade).process_transcription("..."))
+
+    assert gateway.models == ["cheap"]
+    assert result["basic_info"] == {"native_language": "Spanish", "phone": None}
+    assert cascade.stats()["escalation_rate"] == 0.0
@@ -0,0 +1,53 @@
+"""Tests for the persistent pool of spaCy parser processes."""
+
+import pytest
+
+from app.services.conversation_analyzer import ConversationAnalyzer, split_text
+from app.services.nlp_models import ParserPool
+
+TRANSCRIPT = " ".join(
+    f"I have {n} years of experience and I am {20 + n} years old. I lived {n} years in Spain."
+    for n in range(1, 30)
+)
+
+
+@pytest.fixture
+def model_path(blank_nlp, tmp_path):
+    """The blank pipeline saved to disk, so pool processes can load it by path."""
+    path = tmp_path / "model"
+    blank_nlp.to_disk(path)
+    return str(path)
+
+
+@pytest.fixture
+def pool():
+    pool = ParserPool(2)
+    yield pool
+    pool.shutdown()
+
+
+def test_pool_parses_like_the_calling_process(blank_nlp, model_path, pool):
+    texts = list(split_text(TRANSCRIPT, 300))
+
+    docs = list(pool.parse(blank_nlp, model_path, (), texts))
+
+    assert [doc.text for doc in docs] == texts
+    for doc, expected in zip(docs, blank_nlp.pipe(texts)):
+        assert [sent.text for sent in doc.sents] == [sent.text for sent in expected.sents]
+        assert doc.vocab is blank_nlp.vocab
+
+
+def test_analyzer_parses_chunks_in_the_pool(blank_nlp, model_path, pool):
+    def analyzer(**kwargs):
+        return ConversationAnalyzer(model_name=model_path, long_text_threshold=500, chunk_chars=300, **kwargs)
+
+    pooled = analyzer(parser_pool=pool)
+    serial = analyzer()
+
+    assert pooled.analyze_transcription(TRANSCRIPT) == serial.analyze_transcription(TRANSCRIPT)
+    assert pooled.pipeline_runs == len(list(split_text(TRANSCRIPT, 300)))
+
+
+def test_pool_needs_a_process():
+    with pytest.raises(ValueError):
+        ParserPool(0)
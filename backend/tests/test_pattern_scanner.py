@@ -0,0 +1,87 @@
+"""Tests for the combined regex pattern scanner."""
+
+import re
+from typing import Dict, Iterable, Optional
+
+import pytest
+
+from app.services.conversation_analyzer import ConversationAnalyzer
+from app.services.pattern_scanner import PatternScanner
+
+
+def search_each(patterns: Dict[str, str], text: str, keys: Optional[Iterable[str]] = None) -> Dict[str, str]:
+    """Reference matcher: the per-pattern re.search loop the scanner replaced."""
+    found = {}
+    for key in patterns if keys is None else keys:
+        match = re.search(patterns[key], text, re.IGNORECASE)
+        if match:
+            found[key] = match.group(0)
+    return found
+
+
+PATTERNS = {
+    **ConversationAnalyzer.patterns,
+    # Overlaps the built-in patterns: starts at the same digits
+    "number": r"\b\d+\b",
+    "named_group": r"(?P<word>[a-z]+)ing\b",
+    "scoped_flags": r"(?-i:[A-Z]{2,})",
+    # Backreferences cannot be joined and are searched on their own
+    "repeated_word": r"\b(\w+) \1\b",
+}
+
+TEXTS = [
+    "",
+    "I am 34 years old and have 10 years of experience.",
+    "I have lived 2.5 years in Canada; I am 30-35 yo.",
+    "She has 7 YEARS EXPERIENCE working in NASA labs, really really.",
+    "Nothing to see here",
+    "5 years in Spain then 3 years living in France, 12 years experience",
+]
+
+
+@pytest.mark.parametrize("text", TEXTS)
+def test_scan_matches_per_pattern_search(text):
+    assert PatternScanner(PATTERNS).scan(text) == search_each(PATTERNS, text)
+
+
+@pytest.mark.parametrize("text", TEXTS)
+def test_scan_of_some_keys_matches_per_pattern_search(text):
+    keys = ["years_in_country", "number", "repeated_word"]
+
+    assert PatternScanner(PATTERNS).scan(text, keys) == search_each(PATTERNS, text, keys)
+
+
+@pytest.mark.parametrize("pattern", [r"(?i)\bfoo\b", r"bar(?s)baz", r"(?ax)\d+"])
+def test_global_inline_flags_are_rejected(pattern):
+    with pytest.raises(ValueError, match="global inline flags"):
+        PatternScanner({**PATTERNS, "flagged": pattern})
+
+
+def test_escaped_parenthesis_is_not_a_flag():
+    scanner = PatternScanner({"literal": r"\(?i\)"})
+
+    assert scanner.scan("see (i) here") == {"literal": "(i)"}
+
+
+def test_registered_pattern_applies_to_one_analyzer(blank_nlp):
+    analyzer = ConversationAnalyzer()
+    other = ConversationAnalyzer()
+
+    analyzer.register_pattern("kids", r"\b\d+\s*(?:kids|children)\b", field="children")
+
+    text = "I have 2 kids."
+    assert analyzer.analyze_transcription(text)["children"] == "2 kids"
+    assert "children" not in other.analyze_transcription(text)
+    assert "children" not in ConversationAnalyzer().analyze_transcription(text)
+    assert "kids" not in ConversationAnalyzer.patterns
+
+
+def test_rejected_pattern_leaves_the_analyzer_unchanged(blank_nlp):
+    analyzer = ConversationAnalyzer()
+
+    with pytest.raises(ValueError):
+        analyzer.register_pattern("kids", r"(?i)\d+ kids")
+
+    assert "kids" not in analyzer.patterns
+    assert "kids" not in analyzer.pattern_fields
+    assert analyzer.analyze_transcription("I have 2 kids.") == {}
@@ -0,0 +1,71 @@
+"""Tests that the conversation analyzer parses each text exactly once."""
+
+import pytest
+from spacy.language import Language
+
+from app.services.conversation_analyzer import (
+    ConversationAnalyzer, IncrementalConversationAnalyzer, split_text
+)
+from app.services.doc_cache import DocCache
+
+TRANSCRIPT = "My name is Maria. I am 34 years old. I have 10 years of experience."
+LONG_TRANSCRIPT = " ".join([TRANSCRIPT] * 20)
+
+# Docs seen by the counting pipeline component
+parsed = []
+
+
+@Language.component("parse_counter")
+def parse_counter(doc):
+    parsed.append(doc.text)
+    return doc
+
+
+@pytest.fixture
+def analyzer(blank_nlp):
+    blank_nlp.add_pipe("parse_counter")
+    parsed.clear()
+    return ConversationAnalyzer(long_text_threshold=500, chunk_chars=200)
+
+
+def test_analyze_call_runs_the_pipeline_once(analyzer):
+    analyzer.analyze_transcription(TRANSCRIPT)
+
+    assert analyzer.pipeline_runs == len(parsed) == 1
+
+
+def test_long_transcript_runs_the_pipeline_once_per_chunk(analyzer):
+    analyzer.analyze_transcription(LONG_TRANSCRIPT)
+
+    assert parsed == list(split_text(LONG_TRANSCRIPT, 200))
+    assert analyzer.pipeline_runs == len(parsed) > 1
+
+
+def test_batch_runs_the_pipeline_once_per_transcription(analyzer):
+    texts = [TRANSCRIPT, TRANSCRIPT.upper(), TRANSCRIPT.lower()]
+
+    list(analyzer.analyze_transcriptions(texts, n_process=1))
+
+    assert parsed == texts
+    assert analyzer.pipeline_runs == 3
+
+
+def test_cached_parse_skips_the_pipeline(analyzer, tmp_path):
+    analyzer.doc_cache = DocCache(str(tmp_path))
+
+    analyzer.analyze_transcription(TRANSCRIPT)
+    analyzer.analyze_transcription(TRANSCRIPT)
+    list(analyzer.analyze_transcriptions([TRANSCRIPT, "New text."], n_process=1))
+
+    assert parsed == [TRANSCRIPT, "New text."]
+    assert analyzer.pipeline_runs == 2
+
+
+def test_incremental_analysis_counts_every_window(analyzer):
+    incremental = IncrementalConversationAnalyzer(analyzer)
+
+    for sentence in TRANSCRIPT.split(". "):
+        incremental.add_text(sentence + ". ")
+    incremental.finish()
+
+    assert analyzer.pipeline_runs == len(parsed) > 0
@@ -0,0 +1,101 @@
+"""Tests for compact, token-budgeted prompt contexts."""
+
+import json
+
+import pytest
+
+from app.services import prompt_context
+from app.services.prompt_context import ELLIPSIS, PromptContextBuilder, compact
+
+
+@pytest.fixture(autouse=True)
+def estimated_counts(monkeypatch):
+    """Count tokens with the characters-per-token estimate, tiktoken or not."""
+    monkeypatch.setattr(prompt_context, "tiktoken", None)
+    prompt_context._load_encoding.cache_clear()
+    yield
+    prompt_context._load_encoding.cache_clear()
+
+
+def test_compact_drops_empty_fields_recursively():
+    value = {
+        "name": "  Ana ",
+        "email": None,
+        "notes": "   ",
+        "interests": [{"name": ""}, {"name": "chess", "level": None}],
+        "learning_context": {"goals": None, "style": []},
+    }
+
+    assert compact(value) == {"name": "Ana", "interests": [{"name": "chess"}]}
+    assert compact({"a": {"b": None}}) is None
+
+
+def test_long_text_field_is_truncated_to_fit():
+    builder = PromptContextBuilder("gpt-4", max_tokens=50, trim_order=["long"])
+    context = {"keep": "k", "long": "x" * 400}
+
+    text, tokens, trimmed = builder.build(context)
+
+    assert not builder.counter.exact
+    assert trimmed == ["long"]
+    assert tokens == builder.counter.count(text) <= 50
+    data = json.loads(text)
+    assert data["keep"] == "k"
+    assert data["long"].startswith("xxxx") and data["long"].endswith(ELLIPSIS)
+    # The caller's context is not modified
+    assert context["long"] == "x" * 400
+
+
+def test_field_too_short_to_truncate_is_removed():
+    builder = PromptContextBuilder("gpt-4", max_tokens=20, trim_order=["long"], min_field_tokens=60)
+
+    text, tokens, trimmed = builder.build({"keep": "k", "long": "x" * 400})
+
+    assert json.loads(text) == {"keep": "k"}
+    assert trimmed == ["long"]
+    assert tokens <= 20
+
+
+def test_nested_paths_are_trimmed_in_order_and_empty_parents_dropped():
+    builder = PromptContextBuilder(
+        "gpt-4", max_tokens=30,
+        trim_order=["student.absent", "student.learning_context.challenges", "student.interests"],
+        min_field_tokens=1000,
+    )
+    context = {
+        "student": {
+            "name": "Ana",
+            "learning_context": {"challenges": "y" * 200},
+            "interests": [{"name": "chess"}, {"name": "tennis"}],
+        }
+    }
+
+    text, tokens, trimmed = builder.build(context)
+
+    # Paths missing from the context are skipped; removing challenges empties learning_context
+    assert trimmed == ["student.learning_context.challenges"]
+    assert json.loads(text) == {"student": {"name": "Ana", "interests": [{"name": "chess"}, {"name": "tennis"}]}}
+    assert tokens <= 30
+
+
+def test_trailing_list_items_are_dropped_before_the_list():
+    builder = PromptContextBuilder("gpt-4", max_tokens=25, trim_order=["interests"])
+    interests = [{"name": f"hobby number {i}"} for i in range(6)]
+
+    text, tokens, trimmed = builder.build({"interests": interests})
+
+    kept = json.loads(text)["interests"]
+    assert trimmed == ["interests"]
+    assert 0 < len(kept) < len(interests)
+    assert kept == interests[:len(kept)]
+    assert tokens <= 25
+
+
+def test_result_can_stay_over_budget_when_untrimmable_fields_do_not_fit():
+    builder = PromptContextBuilder("gpt-4", max_tokens=10, trim_order=["extra"])
+
+    text, tokens, trimmed = builder.build({"fixed": "z" * 200, "extra": "w" * 40})
+
+    assert trimmed == ["extra"]
+    assert json.loads(text) == {"fixed": "z" * 200}
+    assert tokens == builder.counter.count(text) > 10
@@ -0,0 +1,103 @@
+"""Tests for skeleton-based homework generation."""
+
+import asyncio
+import json
+
+import pytest
+
+from app.db.models import Student
+from app.services.content_generator import ContentGenerationService, fill_skeleton
+from app.services.model_cascade import ModelCascade
+
+STUDENT = Student(student_id=1, first_name="Ana", last_name="Lopez", proficiency_level="B1")
+
+SKELETON = {
+    "title": "Past tense",
+    "questions": [
+        {"number": 1, "prompt": "Describe {{ work_task }} you did yesterday."},
+        {"number": 2, "prompt": "Write about {{hobby}} last weekend."},
+    ],
+    "slots": {
+        "work_task": {"description": "A task from the student's job", "default": "a task"},
+        "hobby": {"description": "One of the student's hobbies", "default": "a hobby"},
+    },
+}
+
+
+class StubGateway:
+    """Answers with a fixed completion per model and records the requests."""
+
+    def __init__(self, answers):
+        self.answers = answers
+        self.requests = []
+
+    async def chat_completion(self, payload):
+        self.requests.append(payload)
+        return {
+            "choices": [{"message": {"content": self.answers[payload["model"]]}}],
+            "usage": {"total_tokens": 10},
+        }
+
+
+def test_fill_skeleton_uses_defaults_for_missing_and_unknown_slots():
+    skeleton = {**SKELETON, "instructions": "Mention {{undefined_slot}}."}
+
+    content = fill_skeleton(skeleton, {"hobby": "chess", "unused": "ignored"})
+
+    assert "slots" not in content
+    assert content["questions"][0]["prompt"] == "Describe a task you did yesterday."
+    assert content["questions"][1]["prompt"] == "Write about chess last weekend."
+    # A placeholder without a slot definition falls back to its readable name
+    assert content["instructions"] == "Mention undefined slot."
+    assert content["questions"][0]["number"] == 1
+
+
+def test_generate_skeleton_escalates_an_answer_that_does_not_parse():
+    gateway = StubGateway({"cheap": "not json at all", "strong": json.dumps(SKELETON)})
+    service = ContentGenerationService(gateway, cascade=ModelCascade(["cheap", "strong"]))
+    report = {}
+
+    skeleton = asyncio.run(service.generate_skeleton({"name": "Past tense"}, report=report))
+
+    assert skeleton == SKELETON
+    assert [r["model"] for r in gateway.requests] == ["cheap", "strong"]
+    assert report["cascade"]["model"] == "strong"
+
+
+def test_generate_skeleton_raises_when_the_final_answer_does_not_parse():
+    service = ContentGenerationService(StubGateway({"cheap": "not json at all"}),
+                                       cascade=ModelCascade(["cheap"]))
+
+    with pytest.raises(ValueError):
+        asyncio.run(service.generate_skeleton({"name": "Past tense"}))
+
+
+def test_generate_from_skeleton_escalates_unfilled_slots_and_fills_the_rest():
+    gateway = StubGateway({
+        "cheap": json.dumps({"slots": {"hobby": "chess"}}),
+        # Unknown slots in the answer are ignored; an empty slot keeps its default
+        "strong": json.dumps({"slots": {"hobby": "chess", "work_task": " ", "pet": "a cat"}}),
+    })
+    service = ContentGenerationService(gateway, cascade=ModelCascade(["cheap", "strong"]))
+    report = {}
+
+    content = asyncio.run(service.generate_from_skeleton(STUDENT, SKELETON, report=report))
+
+    assert [r["model"] for r in gateway.requests] == ["cheap", "strong"]
+    assert report["cascade"]["escalations"] == [{"model": "cheap", "reason": "missing: work_task"}]
+    assert content["questions"][0]["prompt"] == "Describe a task you did yesterday."
+    assert content["questions"][1]["prompt"] == "Write about chess last weekend."
+    assert "pet" not in json.dumps(content)
+
+
+def test_generate_from_skeleton_without_slots_does_not_call_the_service():
+    gateway = StubGateway({})
+    service = ContentGenerationService(gateway)
+    skeleton = {"title": "Past tense", "questions": [{"number": 1, "prompt": "What did you do?"}]}
+    report = {}
+
+    content = asyncio.run(service.generate_from_skeleton(STUDENT, skeleton, report=report))
+
+    assert content == skeleton
+    assert gateway.requests == []
+    assert report["prompt_tokens"] == 0
@@ -0,0 +1,124 @@
+"""Tests for the transcription queue worker."""
+
+import asyncio
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from app.db.models import TranscriptionJob
+from app.services import transcription_queue
+from app.services.response_cache import ResponseCache
+from app.services.student_extractor import StudentExtractionService
+from app.services.transcription_queue import TranscriptionWorker
+
+TRANSCRIPT = (
+    "Hi, my name is Maria Lopez and my English level is intermediate. "
+    "I work as a software engineer in Boston and I play tennis on weekends."
+)
+
+# Valid answer for every extraction request
+EXTRACTION = {
+    "first_name": "Maria",
+    "last_name": "Lopez",
+    "proficiency_level": "B1",
+    "basic_info": {
+        "date_of_birth": "1990-05-01", "email": "maria@example.com", "phone": "555-0100",
+        "native_language": "Spanish", "current_address": "Boston",
+    },
+    "professional_background": {
+        "current_occupation": "Software engineer", "company": "Acme", "industry": "Software",
+        "work_responsibilities": "Builds web services", "years_of_experience": 10,
+        "education_level": "Master's degree",
+    },
+    "interests_hobbies": [
+        {"category": "sports", "name": "tennis", "description": "Plays on weekends",
+         "experience_years": 5, "frequency": "weekly"},
+    ],
+}
+
+
+class FakeGateway:
+    """Answers every chat completion with EXTRACTION."""
+
+    def __init__(self):
+        self.calls = 0
+
+    async def chat_completion(self, payload):
+        self.calls += 1
+        return {"choices": [{"message": {"content": json.dumps(EXTRACTION)}}], "usage": {}}
+
+
+class FakeAnalyzer:
+    """Local analyzer that recognizes the name and level."""
+
+    model_name = "fake"
+
+    def analyze_transcription(self, transcription):
+        return {"name": "Maria Lopez", "english_level": "B1"}
+
+
+class FakeSession:
+    """Database session that keeps nothing."""
+
+    def add(self, obj):
+        pass
+
+    def commit(self):
+        pass
+
+    def refresh(self, obj):
+        pass
+
+    def rollback(self):
+        pass
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def service(tmp_path, monkeypatch):
+    service = StudentExtractionService(
+        FakeGateway(), ResponseCache(str(tmp_path), "extraction_cache"), get_analyzer=FakeAnalyzer
+    )
+
+    async def save_student_info(session, extracted_data):
+        return SimpleNamespace(student_id=1)
+
+    monkeypatch.setattr(service, "save_student_info", save_student_info)
+    return service
+
+
+def queue_jobs(monkeypatch, jobs):
+    """Make claim_next_job hand out the given jobs in order."""
+    pending = list(jobs)
+
+    def claim_next_job(session, worker_id, lease_seconds, max_attempts=None):
+        if not pending:
+            return None
+        job = pending.pop(0)
+        job.status, job.stage, job.attempts = "processing", "extracting", job.attempts + 1
+        return job
+
+    monkeypatch.setattr(transcription_queue, "claim_next_job", claim_next_job)
+
+
+@pytest.mark.parametrize("mode", ["hybrid", "chunked"])
+def test_identical_jobs_reuse_the_cached_extraction(service, monkeypatch, mode):
+    jobs = [TranscriptionJob(transcription=TRANSCRIPT, extraction_mode=mode) for _ in range(2)]
+    queue_jobs(monkeypatch, jobs)
+    worker = TranscriptionWorker(FakeSession, service)
+
+    async def process_all():
+        while await worker.process_next():
+            pass
+
+    asyncio.run(process_all())
+
+    first, second = jobs
+    assert [job.status for job in jobs] == ["completed", "completed"], [job.error for job in jobs]
+    assert first.extraction_report["cached"] is False
+    assert second.extraction_report["cached"] is True
+    assert second.result == first.result
+    assert service.gateway.calls == 1
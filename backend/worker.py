@@ -0,0 +1,67 @@
+"""Run standalone workers for queued transcriptions.
+
+Workers claim jobs from the database queue, so any number of these processes
+can run alongside the API (set TRANSCRIPTION_WORKERS=0 in the API's environment
+or .env file to process jobs only here).
+"""
+
+import argparse
+import asyncio
+import os
+import signal
+import sys
+from functools import partial
+
+# Add the backend directory to the Python path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from sqlmodel import Session
+
+from app.core.config import get_settings
+from app.core.dependencies import (
+    get_conversation_analyzer, get_extraction_cache, get_extraction_cascade, get_parser_pool
+)
+from app.core.http_client import create_http_client
+from app.db.database import engine
+from app.services.ai_gateway import create_ai_gateway
+from app.services.student_extractor import StudentExtractionService
+from app.services.transcription_queue import create_workers
+
+
+async def main(count: int) -> None:
+    settings = get_settings()
+    client = create_http_client(settings)
+    service = StudentExtractionService(
+        create_ai_gateway(client, settings),
+        get_extraction_cache(),
+        get_analyzer=partial(get_conversation_analyzer, settings.HYBRID_EXTRACTION_TIER),
+        chunk_chars=settings.EXTRACTION_CHUNK_CHARS,
+        cascade=get_extraction_cascade()
+    )
+    workers = create_workers(settings, lambda: Session(engine), service, count)
+
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stop.set)
+
+    print(f"Running {count} transcription worker(s)")
+    try:
+        await asyncio.gather(*(worker.run(stop) for worker in workers))
+    finally:
+        await client.aclose()
+        pool = get_parser_pool()
+        if pool is not None:
+            pool.shutdown()
+    print(f"Processed {sum(w.processed for w in workers)} job(s), {sum(w.failed for w in workers)} failed")
+    cascade = service.cascade.stats()
+    print(f"Escalated {cascade['escalated']}/{cascade['requests']} extraction(s) "
+          f"({cascade['escalation_rate']:.1%}) past {cascade['models'][0]}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Process queued transcriptions")
+    parser.add_argument("--workers", type=int, default=get_settings().TRANSCRIPTION_WORKERS,
+                        help="Number of concurrent workers")
+    args = parser.parse_args()
+    asyncio.run(main(args.workers))